@@ -0,0 +1,261 @@
+import importlib
+
+import torch
+import torch.nn.functional as F
+
+from flatquant.function_utils import get_decompose_dim
+from benchmarks.registry import BackendUnavailable, register_case, implement
+
+
+# shapes of the real models, from their HuggingFace configs
+MODEL_CONFIGS = {
+    "llama-2-7b": dict(hidden_size=4096, intermediate_size=11008, num_attention_heads=32, num_key_value_heads=32, head_dim=128),
+    "llama-2-13b": dict(hidden_size=5120, intermediate_size=13824, num_attention_heads=40, num_key_value_heads=40, head_dim=128),
+    "llama-2-70b": dict(hidden_size=8192, intermediate_size=28672, num_attention_heads=64, num_key_value_heads=8, head_dim=128),
+    "llama-3-8b": dict(hidden_size=4096, intermediate_size=14336, num_attention_heads=32, num_key_value_heads=8, head_dim=128),
+    "llama-3-70b": dict(hidden_size=8192, intermediate_size=28672, num_attention_heads=64, num_key_value_heads=8, head_dim=128),
+    "qwen-2.5-7b": dict(hidden_size=3584, intermediate_size=18944, num_attention_heads=28, num_key_value_heads=4, head_dim=128),
+    "qwen-2.5-32b": dict(hidden_size=5120, intermediate_size=27648, num_attention_heads=40, num_key_value_heads=8, head_dim=128),
+}
+
+
+def _import(name):
+    try:
+        return importlib.import_module(name)
+    except ImportError as e:
+        raise BackendUnavailable(f"can not import {name}: {e}")
+
+
+def _unique(shapes):
+    return list({tuple(shape.items()): shape for shape in shapes}.values())
+
+
+def linear_shapes(models, tokens):
+    shapes = []
+    for model in models:
+        cfg = MODEL_CONFIGS[model]
+        hidden, inter = cfg["hidden_size"], cfg["intermediate_size"]
+        kv_dim = cfg["num_key_value_heads"] * cfg["head_dim"]
+        for in_features, out_features in [(hidden, hidden + 2 * kv_dim), (hidden, hidden), (hidden, 2 * inter), (inter, hidden)]:
+            shapes += [dict(tokens=t, in_features=in_features, out_features=out_features) for t in tokens]
+    return _unique(shapes)
+
+
+def hidden_shapes(models, tokens):
+    """The inputs of the online transforms: hidden_size (qkv_proj, o_proj) and intermediate_size (down_proj)."""
+    dims = [MODEL_CONFIGS[model][key] for model in models for key in ["hidden_size", "intermediate_size"]]
+    return _unique([dict(tokens=t, dim=dim) for dim in dims for t in tokens])
+
+
+def intermediate_shapes(models, tokens):
+    return _unique([dict(tokens=t, dim=MODEL_CONFIGS[model]["intermediate_size"]) for model in models for t in tokens])
+
+
+def kv_cache_shapes(models, tokens):
+    # decoding one token over a context of `tokens`
+    return _unique([dict(seq_len=t, num_heads=MODEL_CONFIGS[model]["num_attention_heads"], head_dim=MODEL_CONFIGS[model]["head_dim"])
+                    for model in models for t in tokens if t > 1])
+
+
+def _int4_quant_ref(x):
+    """Per-token symmetric int4 quantization, returns the integer codes and the scales."""
+    scales = x.abs().amax(dim=-1, keepdim=True).clamp(min=1e-5) / 7
+    return torch.clamp(torch.round(x / scales), -8, 7), scales
+
+
+def _kron_inputs(device, tokens, dim, dtype):
+    M, N = get_decompose_dim(dim)
+    x = torch.randn((tokens, M, N), device=device, dtype=dtype)
+    left = torch.randn((M, M), device=device, dtype=dtype) / M ** 0.5
+    right = torch.randn((N, N), device=device, dtype=dtype) / N ** 0.5
+    return x, left, right
+
+
+# ---- linear layers ----
+
+def linear_flops(tokens, in_features, out_features):
+    return 2 * tokens * in_features * out_features
+
+
+register_case("linear_fp16", linear_shapes, flops=linear_flops)
+register_case("linear_int4", linear_shapes, flops=linear_flops)
+
+
+@implement("linear_fp16", "cpu")
+def linear_fp16_cpu(device, tokens, in_features, out_features):
+    # fp32 on CPU, which has no fast fp16 GEMM
+    x = torch.randn((tokens, in_features), device=device)
+    weight = torch.randn((out_features, in_features), device=device)
+    return lambda: F.linear(x, weight)
+
+
+@implement("linear_fp16", "cuda")
+def linear_fp16_cuda(device, tokens, in_features, out_features):
+    x = torch.randn((tokens, in_features), device=device, dtype=torch.float16)
+    weight = torch.randn((out_features, in_features), device=device, dtype=torch.float16)
+    return lambda: F.linear(x, weight)
+
+
+@implement("linear_int4", "cpu")
+def linear_int4_cpu(device, tokens, in_features, out_features):
+    x = torch.randn((tokens, in_features), device=device)
+    weight_q = torch.randint(-8, 8, (out_features, in_features), device=device).float()
+    weight_scales = torch.rand((1, out_features), device=device)
+
+    def _run():
+        x_q, scales = _int4_quant_ref(x)
+        return F.linear(x_q, weight_q) * scales * weight_scales
+    return _run
+
+
+@implement("linear_int4", "cuda")
+def linear_int4_cuda(device, tokens, in_features, out_features):
+    deploy_nn = _import("deploy.nn")
+    x = torch.randn((tokens, in_features), device=device, dtype=torch.float16)
+    linear = deploy_nn.Linear4bit(in_features, out_features).to(device)
+    linear.weight_scales.fill_(1.0)
+    linear.weight_scales = linear.weight_scales.to(torch.float16)
+    module = torch.nn.Sequential(deploy_nn.Quantizer(input_clip_ratio=1.0), linear)
+    return lambda: module(x)
+
+
+# ---- online transforms fused with the int4 quantization ----
+
+def kron_flops(tokens, dim):
+    M, N = get_decompose_dim(dim)
+    return 2 * tokens * (M * M * N + M * N * N)
+
+
+register_case("kron_quant", hidden_shapes, flops=kron_flops)
+register_case("rmsnorm_kron_quant", hidden_shapes, flops=kron_flops)
+register_case("swiglu_kron_quant", intermediate_shapes, flops=kron_flops)
+
+
+@implement("kron_quant", "cpu")
+def kron_quant_cpu(device, tokens, dim):
+    x, left, right = _kron_inputs(device, tokens, dim, torch.float32)
+    return lambda: _int4_quant_ref((left @ x @ right).reshape(tokens, -1))
+
+
+@implement("kron_quant", "triton")
+def kron_quant_triton(device, tokens, dim):
+    kernels = _import("deploy.kernels.kron_matmul")
+    x, left, right = _kron_inputs(device, tokens, dim, torch.float16)
+    return lambda: kernels.kron_matmul(left, x, right, tokens)
+
+
+@implement("rmsnorm_kron_quant", "cpu")
+def rmsnorm_kron_quant_cpu(device, tokens, dim):
+    x, left, right = _kron_inputs(device, tokens, dim, torch.float32)
+
+    def _run():
+        x_norm = x * torch.rsqrt(x.pow(2).mean(dim=(1, 2), keepdim=True) + 1e-5)
+        return _int4_quant_ref((left @ x_norm @ right).reshape(tokens, -1))
+    return _run
+
+
+@implement("rmsnorm_kron_quant", "triton")
+def rmsnorm_kron_quant_triton(device, tokens, dim):
+    kernels = _import("deploy.kernels.rmsnorm_kron_matmul")
+    x, left, right = _kron_inputs(device, tokens, dim, torch.float16)
+    if x.shape[1] > kernels.RMSNORM_KRON_BLOCK_SIZE_M:
+        raise BackendUnavailable(f"the fused rmsnorm only supports M <= {kernels.RMSNORM_KRON_BLOCK_SIZE_M}")
+    return lambda: kernels.rmsnorm_kron_matmul(left, x, right, tokens, 1e-5)
+
+
+@implement("swiglu_kron_quant", "cpu")
+def swiglu_kron_quant_cpu(device, tokens, dim):
+    gate, left, right = _kron_inputs(device, tokens, dim, torch.float32)
+    up = torch.randn_like(gate)
+    return lambda: _int4_quant_ref((left @ (F.silu(gate) * up) @ right).reshape(tokens, -1))
+
+
+@implement("swiglu_kron_quant", "triton")
+def swiglu_kron_quant_triton(device, tokens, dim):
+    kernels = _import("deploy.kernels.swiglu_kron_matmul")
+    gate, left, right = _kron_inputs(device, tokens, dim, torch.float16)
+    up = torch.randn_like(gate)
+    return lambda: kernels.swiglu_kron_matmul(left, gate, up, right, tokens)
+
+
+# ---- Hadamard transform ----
+
+register_case("fwht", hidden_shapes)
+
+
+@implement("fwht", "cpu")
+def fwht_cpu(device, tokens, dim):
+    hadamard_utils = _import("flatquant.hadamard_utils")
+    x = torch.randn((tokens, dim), device=device)
+    had_K, K = hadamard_utils.get_hadK(dim)
+    return lambda: hadamard_utils.matmul_hadU_cpu(x, had_K, K)
+
+
+@implement("fwht", "cuda")
+def fwht_cuda(device, tokens, dim):
+    hadamard_utils = _import("flatquant.hadamard_utils")
+    if hadamard_utils.fast_hadamard_transform is None:
+        raise BackendUnavailable("fast_hadamard_transform is not installed")
+    x = torch.randn((tokens, dim), device=device, dtype=torch.float16)
+    had_K, K = hadamard_utils.get_hadK(dim, dtype=torch.float16, device=device)
+    return lambda: hadamard_utils.matmul_hadU_fast(x, had_K, K)
+
+
+# ---- int4 KV cache decoding ----
+
+register_case("kv_cache_decode", kv_cache_shapes)
+
+
+@implement("kv_cache_decode", "cuda")
+def kv_cache_decode_cuda(device, seq_len, num_heads, head_dim):
+    kv_cache = _import("deploy.transformers.kv_cache")
+    cache = kv_cache.MultiLayerPagedKVCache4Bit(
+        batch_size=1, page_size=seq_len, max_seq_len=seq_len, device=device, n_layers=1,
+        num_heads=num_heads, head_dim=head_dim, disable_quant=False, trans_dtype=torch.float16, trans="had")
+    query_states, key_states, value_states = [
+        torch.rand((1, 1, num_heads, head_dim), device=device, dtype=torch.float16) for _ in range(3)]
+
+    def _decode():
+        cache._needs_init = [False] * len(cache._needs_init)
+        cache.length = seq_len - 1
+        return cache.update(key_states, value_states, layer_idx=0, cache_kwargs={})(query_states)
+    return _decode
+
+
+# ---- int4 quantization of the activations: per-token (dynamic) vs calibrated per-tensor (static) scales ----
+
+register_case("act_quant_dynamic", hidden_shapes)
+register_case("act_quant_static", hidden_shapes)
+
+
+def _static_scale(x):
+    return x.abs().amax() / 7
+
+
+@implement("act_quant_dynamic", "cpu")
+def act_quant_dynamic_cpu(device, tokens, dim):
+    x = torch.randn((tokens, dim), device=device)
+    return lambda: _int4_quant_ref(x)
+
+
+@implement("act_quant_static", "cpu")
+def act_quant_static_cpu(device, tokens, dim):
+    x = torch.randn((tokens, dim), device=device)
+    scale = _static_scale(x)
+    return lambda: torch.clamp(torch.round(x / scale), -8, 7)
+
+
+@implement("act_quant_dynamic", "cuda")
+def act_quant_dynamic_cuda(device, tokens, dim):
+    deploy_nn = _import("deploy.nn")
+    x = torch.randn((tokens, dim), device=device, dtype=torch.float16)
+    quantizer = deploy_nn.Quantizer().to(device)
+    return lambda: quantizer(x)
+
+
+@implement("act_quant_static", "cuda")
+def act_quant_static_cuda(device, tokens, dim):
+    deploy_nn = _import("deploy.nn")
+    x = torch.randn((tokens, dim), device=device, dtype=torch.float16)
+    quantizer = deploy_nn.Quantizer(static_scale=_static_scale(x).item()).to(device)
+    return lambda: quantizer(x)
@@ -11,6 +11,8 @@ import deploy.transformers.modeling_llama as modeling_llama
 import torch
 import transformers
 
+from flatquant.bit_allocation import load_bit_config
+
 
 model_configs = [
     "./modelzoo/llama-2-7b",
@@ -59,11 +61,26 @@ def module_benchmark(module):
     return (end_time - start_time) * 1000 / num_bench_steps, peak_memory
 
 
-def _build_cache(batch_size, length, layer, disable_quant, num_key_value_heads, hidden_size, device, trans="had"):
+def _build_cache(batch_size, length, layer, disable_quant, num_key_value_heads, hidden_size, device, trans="had",
+                 kv_bits=4, kv_groupsize=-1):
     num_heads = num_key_value_heads
     model_dim = hidden_size
     # head_dim = model_dim // num_heads
     head_dim = 128  # TODO. fixed head dim for LLaMA models
+    if not disable_quant and kv_bits < 4:
+        return deploy.transformers.MultiLayerPagedKVCacheLowBit(
+            batch_size=batch_size,
+            page_size=length,
+            max_seq_len=length,
+            device=device,
+            n_layers=1,
+            num_heads=num_heads,
+            head_dim=head_dim,
+            bits=kv_bits,
+            groupsize=kv_groupsize,
+            trans_dtype=torch.float16,
+            trans=trans
+        )
     return deploy.transformers.MultiLayerPagedKVCache4Bit(
         batch_size=batch_size,
         page_size=length, 
@@ -95,7 +112,9 @@ def get_model_quantized(args, config_name):
         device=DEV,
         num_key_value_heads=model.config.num_key_value_heads,
         hidden_size=model.config.hidden_size,
-        trans=args.trans if "qk" in args.online_trans else "none"), model.config.hidden_size
+        trans=args.trans if "qk" in args.online_trans else "none",
+        kv_bits=args.kv_bits,
+        kv_groupsize=args.kv_groupsize), model.config.hidden_size
 
 
 def get_model_fp16(config_name):
@@ -255,14 +274,17 @@ def benchmark(args):
                            time_prefill_f16, time_decode_f16, time_e2e_f16,
                            time_prefill_i4_benchmark, time_decode_i4_benchmark, time_e2e_i4_benchmark)
         
-        # FlatQuant
-        args.fuseLN, args.trans = False, "matmul"
+        # FlatQuant, with fuseLN the RMSNorm, the kronecker transform and the quantizer of the layer inputs
+        # run as one kernel (RMSNormOnlineTrans)
+        args.trans = "matmul"
         online_trans_list = [
-            {"qk", "o_proj", "down_proj", "qkv_proj", "up_gate_proj"}
+            (False, {"qk", "o_proj", "down_proj", "qkv_proj", "up_gate_proj"}),
+            (True, {"qk", "o_proj", "down_proj", "qkv_proj", "up_gate_proj"}),
         ]
-        for online_trans in online_trans_list:
-            print(f"------------------------- Int4 FlatQuant ({'+'.join(online_trans)}) ------------------------")
-            args.online_trans = online_trans
+        for fuseLN, online_trans in online_trans_list:
+            fused = ", fuseLN" if fuseLN else ""
+            print(f"------------------------- Int4 FlatQuant ({'+'.join(online_trans)}{fused}) ------------------------")
+            args.fuseLN, args.online_trans = fuseLN, online_trans
             model, cache_builder, hidden_size = get_model_quantized(args, config_name)
             layer = model.model.layers[0]
             del model
@@ -294,8 +316,30 @@ if __name__ == '__main__':
         help='Decode steps',
         default=256,
     )
+    parser.add_argument(
+        '--bit_config', type=str,
+        help='Per-module bits planned by --bit_budget (bit_config.json), the units at 16 bits are kept in fp16',
+        default=None,
+    )
+    parser.add_argument(
+        '--a_groupsize', type=int,
+        help='Group size of the int4 activations of the linear layers (-1 for per-token), as --a_groupsize of the calibration',
+        default=-1,
+    )
+    parser.add_argument(
+        '--kv_bits', type=int, choices=[2, 3, 4],
+        help='Bits of the KV cache, 2 and 3 bits use the bit-packed cache with per-group scales',
+        default=4,
+    )
+    parser.add_argument(
+        '--kv_groupsize', type=int,
+        help='Group size of the 2/3-bit KV cache (-1 for per-head), as --k_groupsize/--v_groupsize of the calibration',
+        default=-1,
+    )
     
     args = parser.parse_args()
+    if args.bit_config is not None:
+        args.bit_config = load_bit_config(args.bit_config)
     if args.batch_size is None:
         for bsz in [1, 2, 4, 8, 16, 32, 64]:
             args.batch_size = bsz
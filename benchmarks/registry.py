@@ -0,0 +1,207 @@
+import csv
+import json
+import os
+import platform
+import socket
+import statistics
+import subprocess
+import time
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+
+import torch
+
+
+class BackendUnavailable(Exception):
+    """Raised by a case builder when the backend can not run the given shape."""
+
+
+@dataclass
+class Backend:
+    name: str
+    device: str
+    is_available: Callable[[], bool]
+    synchronize: Callable[[], None]
+
+
+def _has_module(name):
+    try:
+        __import__(name)
+    except Exception:
+        return False
+    return True
+
+
+def _cuda_synchronize():
+    torch.cuda.synchronize()
+
+
+# cpu:    pure PyTorch reference implementations, runs everywhere
+# triton: the Triton kernels of deploy.kernels
+# cuda:   the CUDA extension of deploy (int4 GEMM, quantizer) and cuBLAS baselines
+BACKENDS = {
+    "cpu": Backend("cpu", "cpu", lambda: True, lambda: None),
+    "triton": Backend("triton", "cuda", lambda: torch.cuda.is_available() and _has_module("triton"), _cuda_synchronize),
+    "cuda": Backend("cuda", "cuda", lambda: torch.cuda.is_available() and _has_module("deploy"), _cuda_synchronize),
+}
+
+
+@dataclass
+class BenchCase:
+    name: str
+    # returns the list of shapes, each a dict of keyword arguments of the builders
+    shapes: Callable[..., List[dict]]
+    # flops of one call for a shape, used for TFLOPS
+    flops: Optional[Callable[..., float]] = None
+    # backend name -> builder(device, **shape) returning the zero-argument callable to time
+    builders: Dict[str, Callable] = field(default_factory=dict)
+
+
+CASES: Dict[str, BenchCase] = {}
+
+
+def register_case(name, shapes, flops=None):
+    CASES[name] = BenchCase(name, shapes, flops)
+    return CASES[name]
+
+
+def implement(case_name, backend):
+    """Registers the decorated builder as the implementation of a case on a backend."""
+    def decorator(builder):
+        CASES[case_name].builders[backend] = builder
+        return builder
+    return decorator
+
+
+def shape_key(shape):
+    return ",".join(f"{k}={v}" for k, v in shape.items())
+
+
+def time_callable(fn, synchronize, warmup=5, repeats=20, min_run_ms=1.0):
+    """
+    Times fn after warmup calls. Every repeat runs fn often enough to last at least min_run_ms, so
+    that the timer and synchronization overhead of small kernels does not dominate. Returns the
+    per-call times of the repeats in ms.
+    """
+    for _ in range(warmup):
+        fn()
+    synchronize()
+    start = time.perf_counter()
+    fn()
+    synchronize()
+    number = max(1, int(min_run_ms / max((time.perf_counter() - start) * 1e3, 1e-6)))
+    times = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        for _ in range(number):
+            fn()
+        synchronize()
+        times.append((time.perf_counter() - start) * 1e3 / number)
+    return times
+
+
+@torch.inference_mode()
+def run_case(case, backend_name, shape, warmup=5, repeats=20):
+    record = {"case": case.name, "backend": backend_name, "shape": shape_key(shape)}
+    backend = BACKENDS[backend_name]
+    if not backend.is_available():
+        return dict(record, status="skipped", reason="backend unavailable")
+    try:
+        fn = case.builders[backend_name](backend.device, **shape)
+        times = time_callable(fn, backend.synchronize, warmup=warmup, repeats=repeats)
+    except BackendUnavailable as e:
+        return dict(record, status="skipped", reason=str(e))
+    except Exception as e:
+        return dict(record, status="error", reason=f"{type(e).__name__}: {e}")
+    record.update(
+        status="ok",
+        median_ms=statistics.median(times),
+        mean_ms=statistics.mean(times),
+        std_ms=statistics.stdev(times) if len(times) > 1 else 0.0,
+        min_ms=min(times),
+    )
+    if case.flops is not None:
+        record["tflops"] = case.flops(**shape) / (record["median_ms"] * 1e-3) * 1e-12
+    return record
+
+
+def run_benchmarks(case_names, backends, shape_kwargs=None, warmup=5, repeats=20, log=print):
+    records = []
+    for name in case_names:
+        case = CASES[name]
+        for shape in case.shapes(**(shape_kwargs or {})):
+            for backend_name in backends:
+                if backend_name not in case.builders:
+                    continue
+                record = run_case(case, backend_name, shape, warmup=warmup, repeats=repeats)
+                if log is not None:
+                    timing = f"{record['median_ms']:.4f}ms" if record["status"] == "ok" else f"{record['status']} ({record['reason']})"
+                    log(f"{name:<20} {backend_name:<7} {record['shape']:<48} {timing}")
+                records.append(record)
+    return records
+
+
+def environment_metadata():
+    meta = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "hostname": socket.gethostname(),
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+        "python": platform.python_version(),
+        "torch": torch.__version__,
+        "torch_num_threads": torch.get_num_threads(),
+        "cuda": torch.version.cuda,
+        "gpu": torch.cuda.get_device_name() if torch.cuda.is_available() else None,
+    }
+    try:
+        import triton
+        meta["triton"] = triton.__version__
+    except ImportError:
+        meta["triton"] = None
+    try:
+        meta["git_commit"] = subprocess.check_output(
+            ["git", "rev-parse", "HEAD"], cwd=os.path.dirname(os.path.abspath(__file__)),
+            stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        meta["git_commit"] = None
+    return meta
+
+
+def save_json(path, records, metadata):
+    with open(path, "w") as f:
+        json.dump({"metadata": metadata, "results": records}, f, indent=2)
+
+
+def save_csv(path, records):
+    columns = ["case", "backend", "shape", "status", "median_ms", "mean_ms", "std_ms", "min_ms", "tflops", "reason"]
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns, extrasaction="ignore")
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def load_results(path):
+    with open(path) as f:
+        return json.load(f)["results"]
+
+
+def compare_to_baseline(records, baseline, tolerance=0.1):
+    """
+    Compares the median times with the ones of a baseline run. A result is a regression when it is
+    more than `tolerance` (relative) slower than the baseline. Returns one entry per result found in
+    both runs.
+    """
+    baseline = {(r["case"], r["backend"], r["shape"]): r for r in baseline if r["status"] == "ok"}
+    comparisons = []
+    for record in records:
+        base = baseline.get((record["case"], record["backend"], record["shape"]))
+        if record["status"] != "ok" or base is None:
+            continue
+        ratio = record["median_ms"] / base["median_ms"]
+        comparisons.append({
+            "case": record["case"], "backend": record["backend"], "shape": record["shape"],
+            "baseline_ms": base["median_ms"], "median_ms": record["median_ms"],
+            "ratio": ratio, "regression": ratio > 1 + tolerance,
+        })
+    return comparisons
@@ -0,0 +1,61 @@
+"""
+Unified benchmark runner.
+
+    python -m benchmarks.run --cases kron_quant linear_int4 --backends cpu triton cuda \
+        --models llama-3-8b --tokens 1 2048 --output results.json --baseline baseline.json
+
+Runs every registered case (benchmarks/cases.py) on the requested backends for the shapes of the
+given models, writes the results with the environment metadata as JSON (and CSV), and compares them
+to a stored baseline. The exit code is 1 if any result regressed by more than --tolerance.
+"""
+import argparse
+import sys
+
+from benchmarks import cases
+from benchmarks.registry import BACKENDS, CASES, run_benchmarks, environment_metadata, save_json, save_csv, \
+    load_results, compare_to_baseline
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Unified FlatQuant benchmark runner.")
+    parser.add_argument("--cases", nargs="+", default=list(CASES.keys()), choices=list(CASES.keys()),
+                        help="Benchmark cases to run, all by default.")
+    parser.add_argument("--backends", nargs="+", default=list(BACKENDS.keys()), choices=list(BACKENDS.keys()),
+                        help="Backends to run, the unavailable ones are reported as skipped.")
+    parser.add_argument("--models", nargs="+", default=["llama-2-7b", "llama-3-8b"], choices=list(cases.MODEL_CONFIGS.keys()),
+                        help="Models whose shapes are benchmarked.")
+    parser.add_argument("--tokens", nargs="+", type=int, default=[1, 2048],
+                        help="Number of tokens (batch size * sequence length), or the context length for decoding.")
+    parser.add_argument("--warmup", type=int, default=5, help="Warmup calls per result.")
+    parser.add_argument("--repeats", type=int, default=20, help="Timed repeats per result.")
+    parser.add_argument("--output", type=str, default=None, help="Path of the JSON results.")
+    parser.add_argument("--csv", type=str, default=None, help="Path of the CSV results.")
+    parser.add_argument("--baseline", type=str, default=None, help="JSON results of a previous run to compare with.")
+    parser.add_argument("--tolerance", type=float, default=0.1,
+                        help="Relative slowdown over the baseline reported as a regression.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    records = run_benchmarks(args.cases, args.backends, dict(models=args.models, tokens=args.tokens),
+                             warmup=args.warmup, repeats=args.repeats)
+    metadata = dict(environment_metadata(), args=vars(args))
+    if args.output is not None:
+        save_json(args.output, records, metadata)
+    if args.csv is not None:
+        save_csv(args.csv, records)
+
+    if args.baseline is None:
+        return 0
+    comparisons = compare_to_baseline(records, load_results(args.baseline), tolerance=args.tolerance)
+    regressions = [c for c in comparisons if c["regression"]]
+    print(f"compared {len(comparisons)} results with {args.baseline}, {len(regressions)} regressions")
+    for c in comparisons:
+        flag = "REGRESSION" if c["regression"] else ""
+        print(f"{c['case']:<20} {c['backend']:<7} {c['shape']:<48} {c['baseline_ms']:.4f}ms -> {c['median_ms']:.4f}ms ({c['ratio']:.2f}x) {flag}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
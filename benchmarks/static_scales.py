@@ -0,0 +1,104 @@
+"""
+Accuracy versus speed of the static (calibrated) activation scales of --a_static.
+
+    python -m benchmarks.static_scales --backends cpu cuda --models llama-3-8b --tokens 1 16 2048 \
+        --percentiles 1.0 0.999 0.99 --activations acts.pt --output static_scales.json
+
+Times the int4 quantization of the activations with per-token scales (act_quant_dynamic) and with a
+per-tensor scale (act_quant_static), and reports the quantization error of both: the relative MSE of the
+int4 fake quantization on held-out activations, with the static range taken from calibration activations
+as in the calibration (quantile of the per-token maxima, EMA over the batches). The activations are a
+(tokens, dim) tensor saved with torch.save, e.g. the inputs of a linear layer captured with a hook, or
+synthetic activations with heavy-tailed token norms otherwise.
+"""
+import argparse
+import json
+import sys
+
+import torch
+
+from benchmarks import cases
+from benchmarks.registry import CASES, environment_metadata, run_benchmarks
+from flatquant.quant_utils import ActivationQuantizer, observe_static_ranges, set_static_ranges
+
+
+def synthetic_activations(tokens, dim, seed=0):
+    """Gaussian channels with a few outlier channels, token norms drawn from a log-normal distribution."""
+    g = torch.Generator().manual_seed(seed)
+    x = torch.randn((tokens, dim), generator=g)
+    x[:, torch.randperm(dim, generator=g)[:max(1, dim // 256)]] *= 20
+    return x * torch.exp(torch.randn((tokens, 1), generator=g))
+
+
+def quant_error(x, quantizer):
+    with torch.no_grad():
+        return ((quantizer(x) - x).pow(2).mean() / x.pow(2).mean()).item()
+
+
+def static_error(cali, test, percentile, momentum=0.9, batch_tokens=2048, bits=4):
+    quantizer = observe_static_ranges(ActivationQuantizer(bits=bits, sym=True, static=True), percentile, momentum)
+    with torch.no_grad():
+        for batch in cali.split(batch_tokens):
+            quantizer(batch)
+    return quant_error(test, set_static_ranges(quantizer))
+
+
+def accuracy_report(x, percentiles, momentum=0.9, bits=4):
+    """Relative MSE of the dynamic and the static quantization, on the second half of the tokens of x."""
+    cali, test = x[:x.shape[0] // 2], x[x.shape[0] // 2:]
+    report = {"dynamic": quant_error(test, ActivationQuantizer(bits=bits, sym=True))}
+    for percentile in percentiles:
+        report[f"static_p{percentile}"] = static_error(cali, test, percentile, momentum, bits=bits)
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Accuracy versus speed of static activation scales.")
+    parser.add_argument("--backends", nargs="+", default=["cpu", "cuda"], help="Backends of the timing.")
+    parser.add_argument("--models", nargs="+", default=["llama-3-8b"], choices=list(cases.MODEL_CONFIGS.keys()))
+    parser.add_argument("--tokens", nargs="+", type=int, default=[1, 16, 2048],
+                        help="Number of tokens, small ones are the decoding steps.")
+    parser.add_argument("--percentiles", nargs="+", type=float, default=[1.0, 0.999, 0.99])
+    parser.add_argument("--momentum", type=float, default=0.9)
+    parser.add_argument("--activations", type=str, default=None,
+                        help="(tokens, dim) activations saved with torch.save, synthetic ones by default.")
+    parser.add_argument("--warmup", type=int, default=5)
+    parser.add_argument("--repeats", type=int, default=20)
+    parser.add_argument("--output", type=str, default=None, help="Path of the JSON report.")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    records = run_benchmarks(["act_quant_dynamic", "act_quant_static"], args.backends,
+                             dict(models=args.models, tokens=args.tokens), warmup=args.warmup, repeats=args.repeats,
+                             log=None)
+    timings = {(r["backend"], r["shape"]): {} for r in records if r["status"] == "ok"}
+    for r in records:
+        if r["status"] == "ok":
+            timings[(r["backend"], r["shape"])][r["case"]] = r["median_ms"]
+    print(f"{'backend':<7} {'shape':<24} {'dynamic':>10} {'static':>10} {'speedup':>8}")
+    for (backend, shape), t in timings.items():
+        if len(t) == 2:
+            print(f"{backend:<7} {shape:<24} {t['act_quant_dynamic']:>8.4f}ms {t['act_quant_static']:>8.4f}ms "
+                  f"{t['act_quant_dynamic'] / t['act_quant_static']:>7.2f}x")
+
+    if args.activations is not None:
+        activations = {"activations": torch.load(args.activations).float().flatten(0, -2)}
+    else:
+        dims = sorted({shape["dim"] for shape in CASES["act_quant_static"].shapes(models=args.models, tokens=[1])})
+        activations = {f"synthetic dim={dim}": synthetic_activations(8192, dim) for dim in dims}
+    accuracy = {name: accuracy_report(x, args.percentiles, args.momentum) for name, x in activations.items()}
+    for name, report in accuracy.items():
+        print(f"{name}: relative MSE of the int4 quantization " +
+              ", ".join(f"{mode} {error:.4e}" for mode, error in report.items()))
+
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"metadata": dict(environment_metadata(), args=vars(args)), "timings": records,
+                       "accuracy": accuracy}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,7 @@ import torch.distributed as dist
 from transformers import AutoTokenizer
 from safetensors.torch import load_model
 
-from model import Transformer, ModelArgs
+from deepseek_v3.model import Transformer, ModelArgs
 
 
 def sample(logits, temperature: float = 1.0):
@@ -53,30 +53,41 @@ def generate(
     total_len = min(model.max_seq_len, max_new_tokens + max(prompt_lens))
     # Use device from utils for NPU support
     from flatquant.utils import DEV
-    tokens = torch.full((len(prompt_tokens), total_len), -1, dtype=torch.long, device=DEV)
+    # ragged prefill: the right-padded prompts are encoded in one pass, the causal mask keeps the
+    # padding out of the valid tokens and decoding overwrites its cache entries
+    tokens = torch.zeros((len(prompt_tokens), max(prompt_lens)), dtype=torch.long, device=DEV)
     for i, t in enumerate(prompt_tokens):
         tokens[i, :len(t)] = torch.tensor(t, dtype=torch.long, device=DEV)
-    prev_pos = 0
-    finished = torch.tensor([False] * len(prompt_tokens), device=DEV)
-    prompt_mask = tokens != -1
-    for cur_pos in range(min(prompt_lens), total_len):
-        logits = model.forward(tokens[:, prev_pos:cur_pos], prev_pos)
+    positions = torch.tensor(prompt_lens, dtype=torch.long, device=DEV)
+    logits = model.forward(tokens, 0, seq_lens=positions)
+    budgets = [min(max_new_tokens, total_len - prompt_len) for prompt_len in prompt_lens]
+    completion_tokens = [[] for _ in prompt_tokens]
+    # batched decode with per-sequence positions, active[row] is the sequence at that row of the batch
+    active = [i for i in range(len(prompt_tokens)) if budgets[i] > 0]
+    if len(active) < len(prompt_tokens):
+        logits, positions = logits[active], positions[active]
+    while active:
         if temperature > 0:
             next_token = sample(logits, temperature)
         else:
             next_token = logits.argmax(dim=-1)
-        next_token = torch.where(prompt_mask[:, cur_pos], tokens[:, cur_pos], next_token)
-        tokens[:, cur_pos] = next_token
-        finished |= torch.logical_and(~prompt_mask[:, cur_pos], next_token == eos_id)
-        prev_pos = cur_pos
-        if finished.all():
+        keep = []
+        for row, (i, token) in enumerate(zip(active, next_token.tolist())):
+            if token == eos_id:
+                continue
+            completion_tokens[i].append(token)
+            if len(completion_tokens[i]) < budgets[i]:
+                keep.append(row)
+        if not keep:
             break
-    completion_tokens = []
-    for i, toks in enumerate(tokens.tolist()):
-        toks = toks[prompt_lens[i]:prompt_lens[i]+max_new_tokens]
-        if eos_id in toks:
-            toks = toks[:toks.index(eos_id)]
-        completion_tokens.append(toks)
+        if len(keep) < len(active):
+            # drop the finished sequences from the batch and their cache rows
+            rows = torch.tensor(keep, dtype=torch.long, device=DEV)
+            model.select_cache(rows, max(prompt_lens[i] + len(completion_tokens[i]) for i in active))
+            active = [active[row] for row in keep]
+            next_token, positions = next_token[rows], positions[rows]
+        logits = model.forward(next_token.unsqueeze(1), positions)
+        positions = positions + 1
     return completion_tokens
 
 
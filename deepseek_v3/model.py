@@ -1,6 +1,6 @@
 import math
 from dataclasses import dataclass
-from typing import Tuple, Optional, Literal
+from typing import Tuple, Optional, Literal, Union
 
 import torch
 from torch import nn
@@ -385,11 +385,30 @@ def apply_rotary_emb(x: torch.Tensor, freqs_cis: torch.Tensor) -> torch.Tensor:
     """
     dtype = x.dtype
     x = torch.view_as_complex(x.float().view(*x.shape[:-1], -1, 2))
-    freqs_cis = freqs_cis.view(1, x.size(1), 1, x.size(-1))
+    freqs_cis = freqs_cis.view(-1, x.size(1), 1, x.size(-1))
     y = torch.view_as_real(x * freqs_cis).flatten(3)
     return y.to(dtype)
 
 
+def cache_index(bsz: int, start_pos: Union[int, torch.Tensor], seqlen: int):
+    """
+    Index of the KV cache entries written by a forward pass.
+
+    Args:
+        bsz (int): Batch size.
+        start_pos (Union[int, torch.Tensor]): Starting position shared by the batch, or a tensor of shape
+            (batch_size,) with the starting position of every sequence.
+        seqlen (int): Number of tokens of the forward pass.
+
+    Returns:
+        Tuple: Index into the (batch, position) dims of a cache.
+    """
+    if isinstance(start_pos, int):
+        return slice(None, bsz), slice(start_pos, start_pos + seqlen)
+    positions = start_pos[:, None] + torch.arange(seqlen, device=start_pos.device)
+    return torch.arange(bsz, device=start_pos.device)[:, None], positions
+
+
 class MLA(nn.Module):
     """
     Multi-Head Latent Attention (MLA) Layer.
@@ -446,15 +465,18 @@ class MLA(nn.Module):
 
         Args:
             x (torch.Tensor): Input tensor of shape (batch_size, seq_len, dim).
-            start_pos (int): Starting position in the sequence for caching.
+            start_pos (Union[int, torch.Tensor]): Starting position in the sequence for caching, or the
+                per-sequence starting positions of shape (batch_size,).
             freqs_cis (torch.Tensor): Precomputed complex exponential values for rotary embeddings.
-            mask (Optional[torch.Tensor]): Mask tensor to exclude certain positions from attention.
+            mask (Optional[torch.Tensor]): Mask tensor to exclude certain positions from attention, of shape
+                (seq_len, end_pos) or (batch_size, seq_len, end_pos) for per-sequence positions.
 
         Returns:
             torch.Tensor: Output tensor with the same shape as the input.
         """
         bsz, seqlen, _ = x.size()
-        end_pos = start_pos + seqlen
+        end_pos = start_pos + seqlen if isinstance(start_pos, int) else mask.size(-1)
+        index = cache_index(bsz, start_pos, seqlen)
         if self.q_lora_rank == 0:
             q = self.wq(x)
         else:
@@ -471,19 +493,19 @@ class MLA(nn.Module):
             kv = kv.view(bsz, seqlen, self.n_local_heads, self.qk_nope_head_dim + self.v_head_dim)
             k_nope, v = torch.split(kv, [self.qk_nope_head_dim, self.v_head_dim], dim=-1)
             k = torch.cat([k_nope, k_pe.expand(-1, -1, self.n_local_heads, -1)], dim=-1)
-            self.k_cache[:bsz, start_pos:end_pos] = k
-            self.v_cache[:bsz, start_pos:end_pos] = v
+            self.k_cache[index] = k
+            self.v_cache[index] = v
             scores = torch.einsum("bshd,bthd->bsht", q, self.k_cache[:bsz, :end_pos]) * self.softmax_scale
         else:
             wkv_b = self.wkv_b.weight if self.wkv_b.scale is None else weight_dequant(self.wkv_b.weight, self.wkv_b.scale, block_size) 
             wkv_b = wkv_b.view(self.n_local_heads, -1, self.kv_lora_rank)
             q_nope = torch.einsum("bshd,hdc->bshc", q_nope, wkv_b[:, :self.qk_nope_head_dim])
-            self.kv_cache[:bsz, start_pos:end_pos] = self.kv_norm(kv)
-            self.pe_cache[:bsz, start_pos:end_pos] = k_pe.squeeze(2)
+            self.kv_cache[index] = self.kv_norm(kv)
+            self.pe_cache[index] = k_pe.squeeze(2)
             scores = (torch.einsum("bshc,btc->bsht", q_nope, self.kv_cache[:bsz, :end_pos]) +
                       torch.einsum("bshr,btr->bsht", q_pe, self.pe_cache[:bsz, :end_pos])) * self.softmax_scale
         if mask is not None:
-            scores += mask.unsqueeze(1)
+            scores += mask.unsqueeze(-2)
         scores = scores.softmax(dim=-1, dtype=torch.float32).type_as(x)
         if attn_impl == "naive":
             x = torch.einsum("bsht,bthd->bshd", scores, self.v_cache[:bsz, :end_pos])
@@ -630,6 +652,29 @@ class Expert(nn.Module):
         return self.w2(F.silu(self.w1(x)) * self.w3(x))
 
 
+def sort_by_expert(indices: torch.Tensor, start: int, end: int) -> Tuple[torch.Tensor, list]:
+    """
+    Sorts the routed (token, slot) pairs by expert once, so that the pairs of each local expert
+    form a contiguous segment.
+
+    Args:
+        indices (torch.Tensor): Expert indices from the gate, of shape (num_tokens, topk).
+        start (int): First local expert.
+        end (int): One past the last local expert.
+
+    Returns:
+        Tuple[torch.Tensor, list]: Flat positions (token * topk + slot) of the pairs routed to the local
+        experts sorted by expert, and the segment offsets of experts start..end into them. The offsets
+        are the only values copied to the host.
+    """
+    flat_indices = indices.flatten()
+    order = torch.argsort(flat_indices, stable=True)
+    counts = torch.bincount(flat_indices, minlength=end)
+    offsets = F.pad(torch.cumsum(counts, dim=0), (1, 0))[start:end + 1].tolist()
+    order = order[offsets[0]:offsets[-1]]
+    return order, [offset - offsets[0] for offset in offsets]
+
+
 class MoE(nn.Module):
     """
     Mixture-of-Experts (MoE) module.
@@ -677,13 +722,15 @@ class MoE(nn.Module):
         x = x.view(-1, self.dim)
         weights, indices = self.gate(x)
         y = torch.zeros_like(x)
-        counts = torch.bincount(indices.flatten(), minlength=self.n_routed_experts).tolist()
-        for i in range(self.experts_start_idx, self.experts_end_idx):
-            if counts[i] == 0:
+        order, offsets = sort_by_expert(indices, self.experts_start_idx, self.experts_end_idx)
+        idx = order // self.n_activated_experts
+        x_sorted = x[idx]
+        out = torch.empty_like(x_sorted)
+        for i, (seg_start, seg_end) in enumerate(zip(offsets[:-1], offsets[1:]), start=self.experts_start_idx):
+            if seg_start == seg_end:
                 continue
-            expert = self.experts[i]
-            idx, top = torch.where(indices == i)
-            y[idx] += expert(x[idx]) * weights[idx, top, None]
+            out[seg_start:seg_end] = self.experts[i](x_sorted[seg_start:seg_end])
+        y.index_add_(0, idx, out * weights.flatten()[order, None])
         z = self.shared_experts(x)
         if world_size > 1:
             dist.all_reduce(y)
@@ -720,7 +767,7 @@ class Block(nn.Module):
 
         Args:
             x (torch.Tensor): Input tensor.
-            start_pos (int): Starting position in the sequence.
+            start_pos (Union[int, torch.Tensor]): Starting position in the sequence, or per sequence.
             freqs_cis (torch.Tensor): Precomputed complex exponential values for rotary embeddings.
             mask (Optional[torch.Tensor]): Mask tensor to exclude certain positions from attention.
 
@@ -766,26 +813,38 @@ class Transformer(nn.Module):
         self.register_buffer("freqs_cis", precompute_freqs_cis(args), persistent=False)
 
     @torch.inference_mode()
-    def forward(self, tokens: torch.Tensor, start_pos: int = 0):
+    def forward(self, tokens: torch.Tensor, start_pos: Union[int, torch.Tensor] = 0, seq_lens: Optional[torch.Tensor] = None):
         """
         Forward pass for the Transformer model.
 
         Args:
             tokens (torch.Tensor): Input tensor of token IDs with shape (batch_size, seq_len).
-            start_pos (int, optional): Starting position in the sequence for rotary embeddings. Defaults to 0.
+            start_pos (Union[int, torch.Tensor], optional): Starting position in the sequence for rotary embeddings,
+                or a tensor of shape (batch_size,) with the starting position of every sequence. Defaults to 0.
+            seq_lens (Optional[torch.Tensor], optional): Number of valid tokens of every sequence of a right-padded
+                batch, the logits are taken at the last valid token. Defaults to None.
 
         Returns:
             torch.Tensor: Logits tensor of shape (batch_size, vocab_size).
         """
-        seqlen = tokens.size(1)
+        bsz, seqlen = tokens.size()
         h = self.embed(tokens)
-        freqs_cis = self.freqs_cis[start_pos:start_pos+seqlen]
         mask = None
-        if seqlen > 1:
-            mask = torch.full((seqlen, seqlen), float("-inf"), device=tokens.device).triu_(1)
+        if isinstance(start_pos, int):
+            freqs_cis = self.freqs_cis[start_pos:start_pos+seqlen]
+            if seqlen > 1:
+                mask = torch.full((seqlen, seqlen), float("-inf"), device=tokens.device).triu_(1)
+        else:
+            # every sequence only attends to its own cached positions
+            positions = cache_index(bsz, start_pos, seqlen)[1]
+            freqs_cis = self.freqs_cis[positions]
+            end_pos = int(start_pos.max()) + seqlen
+            mask = torch.zeros((bsz, seqlen, end_pos), device=tokens.device)
+            mask.masked_fill_(torch.arange(end_pos, device=tokens.device) > positions[..., None], float("-inf"))
         for layer in self.layers:
             h = layer(h, start_pos, freqs_cis, mask)
-        h = self.norm(h)[:, -1]
+        h = self.norm(h)
+        h = h[:, -1] if seq_lens is None else h[torch.arange(bsz, device=h.device), seq_lens - 1]
         logits = self.head(h)
         if world_size > 1:
             all_logits = [torch.empty_like(logits) for _ in range(world_size)]
@@ -793,6 +852,20 @@ class Transformer(nn.Module):
             logits = torch.cat(all_logits, dim=-1)
         return logits
 
+    def select_cache(self, rows: torch.Tensor, end_pos: int):
+        """
+        Moves the KV cache entries of the sequences in rows to the front of the batch, so that finished
+        sequences can be dropped from it.
+
+        Args:
+            rows (torch.Tensor): Batch rows of the sequences to keep, in their new order.
+            end_pos (int): Number of cached positions to move.
+        """
+        for layer in self.layers:
+            for name, cache in layer.attn.named_buffers(recurse=False):
+                if name.endswith("cache"):
+                    cache[:len(rows), :end_pos] = cache[rows, :end_pos]
+
 
 if __name__ == "__main__":
     torch.set_default_dtype(torch.bfloat16)
@@ -4,11 +4,13 @@ from . import functional
 
 
 import deploy._CUDA
+from deploy.kernels.group_matmul import group_matmul as group_matmul_kernel
 
 
 __all__ = [ 
            "matmul", #int-4 matmul
            "sym_quant", "sym_dequant", "PackedQuantizedTensor", # Quantization
+           "group_sym_quant", "group_matmul", "group_matmul_ref", # Per-group quantization
 ]
 
 class ShapeHandler:
@@ -52,12 +54,60 @@ def sym_dequant(q, scale_row, scale_col, bits=32):
     return deploy._CUDA.sym_dequant(q, scale_row.view(-1), scale_col, bits).view(*q_shape_excl_last, -1)
 
 
+def group_sym_quant(x, scale, groupsize):
+    """
+    Per-group symmetric int4 quantization. `scale` holds one value per group, i.e. it has
+    shape (..., x.shape[-1] // groupsize). The packed output has the same layout as `sym_quant`
+    (two int4 values per uint8 along the last dim), so each group is a contiguous slice of
+    groupsize // 2 bytes.
+    """
+    assert x.dtype == scale.dtype == torch.float16
+    assert x.shape[-1] % groupsize == 0, "x.shape[-1]: {} must be multiplication of groupsize {}".format(x.shape[-1], groupsize)
+    x, x_shape_excl_last = flatten_last_dim_and_return_shape(x)
+    q = deploy._CUDA.sym_quant(x.reshape(-1, groupsize).contiguous(), scale.reshape(-1).contiguous())
+    return q.view(*x_shape_excl_last, -1)
+
+
+def group_matmul_ref(A, B, scales_a, scales_b, groupsize):
+    """Reference of group_matmul in plain torch: exact integer partial sums per group, accumulated in fp32."""
+    A, A_shape_excl_last = flatten_last_dim_and_return_shape(A)
+    M, N, K = A.shape[0], B.shape[0], A.shape[1] * 2
+    q_a = functional.unpack_i4(A).reshape(M, K // groupsize, groupsize).transpose(0, 1).double()
+    q_b = functional.unpack_i4(B).reshape(N, K // groupsize, groupsize).transpose(0, 1).double()
+    partials = torch.bmm(q_a, q_b.transpose(1, 2)).float()
+    out = (partials * scales_a.reshape(M, -1).T.float().unsqueeze(-1)).sum(0) * scales_b.reshape(1, N).float()
+    return out.to(torch.float16).view(*A_shape_excl_last, N)
+
+
+def group_matmul(A, B, scales_a, scales_b, groupsize):
+    """
+    Int4 GEMM with per-group scales on the activations A and per-channel scales on the weights.
+
+    A:        packed int4 activations, (..., K // 2)
+    B:        packed int4 weights, (N, K // 2)
+    scales_a: (..., K // groupsize)
+    scales_b: (N, 1)
+
+    A single Triton kernel computes the int32 partial sum of every group, scales it with the activation
+    scales of the group and accumulates it in fp32. Falls back to group_matmul_ref off CUDA.
+    """
+    assert groupsize % 32 == 0, "groupsize: {} must be multiplication of 32".format(groupsize)
+    if not A.is_cuda:
+        return group_matmul_ref(A, B, scales_a, scales_b, groupsize)
+    A, A_shape_excl_last = flatten_last_dim_and_return_shape(A)
+    out = group_matmul_kernel(A.contiguous(), B, scales_a.contiguous(), scales_b, groupsize)
+    return out.view(*A_shape_excl_last, B.shape[0])
+
+
 class PackedQuantizedTensor:
     def __init__(self, 
                  quantized_x: torch.Tensor, 
-                 scales_x: torch.Tensor):
+                 scales_x: torch.Tensor,
+                 groupsize: int = -1):
         self.quantized_x = quantized_x
         self.scales_x = scales_x
+        # -1 for per-token scales, otherwise scales_x holds one scale per group of `groupsize` channels
+        self.groupsize = groupsize
 
     def size(self):
         return self.quantized_x.size()
@@ -1,3 +1,4 @@
-from .quantization import pack_i4, unpack_i4, asym_quant_dequant, sym_quant_dequant
+from .quantization import pack_i4, unpack_i4, pack_bits, unpack_bits, asym_quant_dequant, sym_quant_dequant
 from .online_trans import (
-    matmul_hadU_cuda)
+    matmul_hadU_cuda, rms_norm_kronecker_quant, rms_norm_kronecker_quant_ref,
+    swiglu_kronecker_quant, swiglu_kronecker_quant_ref)
@@ -80,3 +80,28 @@ def unpack_i4(x: torch.Tensor):
     out[:, 1::2] = x1
 
     return out.view(out_shape)
+
+
+# Pack unsigned `bits`-bit integers along the last dim. Every 8 values are packed into `bits` bytes,
+# value i of a block occupies bits [i * bits, (i + 1) * bits). For bits=4 this matches the layout of pack_i4.
+def pack_bits(q: torch.Tensor, bits: int):
+    assert 1 <= bits <= 8, 'Only support packing 1~8 bits'
+    assert q.shape[-1] % 8 == 0, 'The last dim of the tensor to be packed should be divisible by 8'
+    q = q.to(torch.int64).view(*q.shape[:-1], -1, 8)
+    shifts = torch.arange(8, device=q.device, dtype=torch.int64) * bits
+    words = torch.sum(q << shifts, dim=-1, keepdim=True)
+    byte_shifts = torch.arange(bits, device=q.device, dtype=torch.int64) * 8
+    packed = ((words >> byte_shifts) & 0xff).to(torch.uint8)
+    return packed.view(*q.shape[:-2], -1)
+
+
+# Unpack the tensor packed by pack_bits into unsigned int32 values.
+def unpack_bits(x: torch.Tensor, bits: int):
+    assert x.dtype == torch.uint8, 'The tensor to be unpacked should be stored in uint8'
+    assert x.shape[-1] % bits == 0
+    x = x.to(torch.int64).view(*x.shape[:-1], -1, bits)
+    byte_shifts = torch.arange(bits, device=x.device, dtype=torch.int64) * 8
+    words = torch.sum(x << byte_shifts, dim=-1, keepdim=True)
+    shifts = torch.arange(8, device=x.device, dtype=torch.int64) * bits
+    q = (words >> shifts) & ((1 << bits) - 1)
+    return q.to(torch.int32).view(*x.shape[:-2], -1)
@@ -6,6 +6,7 @@ import numpy as np
 from triton.language.extra import libdevice
 import deploy
 from deploy.nn.quantization import Quantizer
+from deploy.kernels.quant_epilogue import quant_pack_int4, tile_groupsize
 
 
 @triton.autotune(
@@ -40,12 +41,16 @@ def matmul_quant_kernel(
         stride_ck, stride_cn,
         stride_resb, stride_resm, stride_resn,
         BLOCK_SIZE_K: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
 ):
     """
     Quant(b @ c)
 
     b [B, M, N]
     c [N, N]
+
+    with a per-token scale, or NUM_GROUPS scales of GROUPSIZE consecutive values of the token
     """
 
     pid = tl.program_id(axis=0)
@@ -66,27 +71,13 @@ def matmul_quant_kernel(
         b_ptrs += BLOCK_SIZE_K * stride_bn
         c_ptrs += BLOCK_SIZE_K * stride_ck
 
-    abs_src_val = tl.abs(accumulator)
-    max_src_val = tl.max(abs_src_val)
-
-    scale = max_src_val / 7.
-    quant_val = libdevice.llrint(accumulator / scale)
-    quant_val = max(-8, min(quant_val, 7))
-
-    quant_val = quant_val.reshape(np2_M, np2_N // 2, 2, can_reorder=False)
-    quant_val_even, quant_val_odd = quant_val.split()
-    quant_val_odd = quant_val_odd << 4
-
-    res = tl.zeros((np2_M, np2_N // 2), dtype=tl.int8)
-    res = res | (quant_val_odd & 0xf0)
-    res = res | (quant_val_even & 0x0f)
+    res = quant_pack_int4(accumulator, output_scale, batch_id, np2_M, np2_N, NUM_GROUPS, GROUPSIZE)
 
     offs_resm = pid_m * M + tl.arange(0, np2_M)
     offs_resn = tl.arange(0, np2_N // 2)
     res_ptrs = res_ptr + stride_resb.to(tl.int64) * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
     res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
     tl.store(res_ptrs, res, mask=res_mask)
-    tl.store(output_scale + batch_id, scale.to(tl.float16))
 
 
 @triton.autotune(
@@ -166,9 +157,11 @@ def quant_kernel(
         N: tl.constexpr,
         np2_M: tl.constexpr, 
         np2_N: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
 ):
     '''
-    quant fp16 tensor to int4
+    quant fp16 tensor to int4, with a per-token scale or NUM_GROUPS scales of GROUPSIZE consecutive values
     '''
     batch_id = tl.program_id(axis=0) + tl.program_id(axis=1) * tl.num_programs(axis=0)
     index_rows = tl.arange(0, np2_M)
@@ -178,40 +171,33 @@ def quant_kernel(
     src_mask = (index_rows[:, None] < M) & (index_cols[None, :] < N)
     src = tl.load(src_ptrs, mask=src_mask, other=0.0)
 
-    abs_src_val = tl.abs(src)
-    max_src_val = tl.max(abs_src_val)
-    scale = max_src_val / 7.
-
-    quant_val = libdevice.llrint(src / scale)
-    quant_val = max(-8, min(quant_val, 7))
-    quant_val = quant_val.reshape(np2_M,  np2_N // 2, 2, can_reorder=False)
-    quant_val_even, quant_val_odd = quant_val.split()
-    quant_val_odd = quant_val_odd << 4
-
-    res = tl.zeros((np2_M, np2_N // 2), dtype=tl.uint8)
-    res = res | (quant_val_odd & 0xf0)
-    res = res | (quant_val_even & 0x0f)
+    res = quant_pack_int4(src.to(tl.float32), output_scale, batch_id, np2_M, np2_N, NUM_GROUPS, GROUPSIZE)
 
     offs_resm = tl.arange(0, np2_M)
     offs_resn = tl.arange(0, np2_N // 2)
     dst_ptrs = dst_ptr + stride_dstb.to(tl.int64) * batch_id + stride_dstm * offs_resm[:, None] + stride_dstn * offs_resn[None, :]
     res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
     tl.store(dst_ptrs, res, mask=res_mask)
-    tl.store(output_scale + batch_id, scale)
 
 
 FUSION=True
-def block_matmul(b, c, seq_len):
+def block_matmul(b, c, seq_len, groupsize=-1):
     # Check constraints.
-    # b @ c, b [b, m, n], c [n, n]
+    # quant(b @ c), b [b, m, n], c [n, n]
+    # per-token scales, or per-group scales of shape [b, m * n // groupsize] for groupsize > 0
     assert b.shape[2] == c.shape[0], "Incompatible dimensions"
     assert b.is_contiguous(), "Matrix B must be contiguous"
     assert c.is_contiguous(), "Matrix C must be contiguous"
     B, M, N = b.shape
     Actual_B = B // seq_len
     BLOCK_SIZE_M = triton.next_power_of_2(M)
+    GROUPSIZE = tile_groupsize(M, N, groupsize)
+    if GROUPSIZE is None:
+        # the groups are not slices of the tile, quantize the fp16 result per group
+        return Quantizer(groupsize=groupsize)(torch.matmul(b, c).reshape(B, -1))
+    NUM_GROUPS = 1 if GROUPSIZE == -1 else M * N // GROUPSIZE
     # Allocates output.
-    output_scale = torch.empty((B, 1), device=b.device, dtype=torch.float16)
+    output_scale = torch.empty((B, NUM_GROUPS), device=b.device, dtype=torch.float16)
     quant_res = torch.empty((B, M, N // 2), device=b.device, dtype=torch.uint8)
 
     # 1D launch kernel where each block gets its own program.
@@ -227,6 +213,8 @@ def block_matmul(b, c, seq_len):
             b.stride(0), b.stride(1), b.stride(2),  #
             c.stride(0), c.stride(1), #
             quant_res.stride(0), quant_res.stride(1), quant_res.stride(2),  #
+            NUM_GROUPS=NUM_GROUPS,
+            GROUPSIZE=GROUPSIZE,
         )
     else:
         bmm_res = torch.empty((B, M, N), device=b.device, dtype=b.dtype)
@@ -252,8 +240,10 @@ def block_matmul(b, c, seq_len):
             B, M, N,
             triton.next_power_of_2(M),
             triton.next_power_of_2(N),
+            NUM_GROUPS,
+            GROUPSIZE,
         )
-    packed_tensor = deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale)
+    packed_tensor = deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale, groupsize=GROUPSIZE)
     return packed_tensor
 
 
@@ -0,0 +1,86 @@
+import triton
+import triton.language as tl
+import torch
+
+
+@triton.autotune(
+    configs=[
+        triton.Config({'BLOCK_SIZE_M': 16, 'BLOCK_SIZE_N': 64}, num_stages=2, num_warps=4),
+        triton.Config({'BLOCK_SIZE_M': 16, 'BLOCK_SIZE_N': 128}, num_stages=3, num_warps=4),
+        triton.Config({'BLOCK_SIZE_M': 32, 'BLOCK_SIZE_N': 64}, num_stages=3, num_warps=4),
+        triton.Config({'BLOCK_SIZE_M': 64, 'BLOCK_SIZE_N': 64}, num_stages=3, num_warps=4),
+        triton.Config({'BLOCK_SIZE_M': 64, 'BLOCK_SIZE_N': 128}, num_stages=3, num_warps=8),
+        triton.Config({'BLOCK_SIZE_M': 128, 'BLOCK_SIZE_N': 128}, num_stages=3, num_warps=8),
+    ],
+    key=['M', 'N', 'K'],
+)
+
+
+@triton.jit
+def group_matmul_kernel(
+        a_ptr, b_ptr, scales_a_ptr, scales_b_ptr, c_ptr,
+        M, N, K,
+        stride_am, stride_ak,
+        stride_bn, stride_bk,
+        stride_sam, stride_sag,
+        stride_cm, stride_cn,
+        GROUP_SIZE: tl.constexpr,
+        BLOCK_SIZE_M: tl.constexpr,
+        BLOCK_SIZE_N: tl.constexpr,
+):
+    """
+    c = sum_g (a_g @ b_g.T) * scales_a[:, g] * scales_b.T
+
+    a [M, K // 2], b [N, K // 2]: int4 packed two per uint8 (low nibble first)
+    scales_a [M, K // GROUP_SIZE], scales_b [N, 1]
+
+    Every group is an int8 dot product accumulated in int32, scaled by the activation scales of the group
+    and accumulated in fp32, in one pass over K.
+    """
+    pid_m = tl.program_id(axis=0)
+    pid_n = tl.program_id(axis=1)
+
+    offs_m = pid_m * BLOCK_SIZE_M + tl.arange(0, BLOCK_SIZE_M)
+    offs_n = pid_n * BLOCK_SIZE_N + tl.arange(0, BLOCK_SIZE_N)
+    offs_k = tl.arange(0, GROUP_SIZE // 2)
+    mask_m = offs_m < M
+    mask_n = offs_n < N
+    a_ptrs = a_ptr + (offs_m[:, None] * stride_am + offs_k[None, :] * stride_ak)
+    b_ptrs = b_ptr + (offs_k[:, None] * stride_bk + offs_n[None, :] * stride_bn)
+
+    accumulator = tl.zeros((BLOCK_SIZE_M, BLOCK_SIZE_N), dtype=tl.float32)
+    for g in range(0, K // GROUP_SIZE):
+        a = tl.load(a_ptrs, mask=mask_m[:, None], other=0).to(tl.int8, bitcast=True)
+        b = tl.load(b_ptrs, mask=mask_n[None, :], other=0).to(tl.int8, bitcast=True)
+        # sign-extended low and high nibbles, the order of the channels within the group does not matter
+        a_lo, a_hi = (a << 4) >> 4, a >> 4
+        b_lo, b_hi = (b << 4) >> 4, b >> 4
+        acc = tl.dot(a_lo, b_lo, out_dtype=tl.int32)
+        acc = tl.dot(a_hi, b_hi, acc, out_dtype=tl.int32)
+        scales_a = tl.load(scales_a_ptr + offs_m * stride_sam + g * stride_sag, mask=mask_m, other=0.0)
+        accumulator += acc.to(tl.float32) * scales_a.to(tl.float32)[:, None]
+        a_ptrs += (GROUP_SIZE // 2) * stride_ak
+        b_ptrs += (GROUP_SIZE // 2) * stride_bk
+
+    scales_b = tl.load(scales_b_ptr + offs_n, mask=mask_n, other=0.0)
+    accumulator = accumulator * scales_b.to(tl.float32)[None, :]
+    c_ptrs = c_ptr + (offs_m[:, None] * stride_cm + offs_n[None, :] * stride_cn)
+    tl.store(c_ptrs, accumulator.to(tl.float16), mask=mask_m[:, None] & mask_n[None, :])
+
+
+def group_matmul(a, b, scales_a, scales_b, groupsize):
+    # a [M, K // 2], b [N, K // 2], scales_a [M, K // groupsize], scales_b [N, 1]
+    M, N, K = a.shape[0], b.shape[0], a.shape[1] * 2
+    scales_a = scales_a.reshape(M, K // groupsize)
+    c = torch.empty((M, N), dtype=torch.float16, device=a.device)
+    grid = lambda META: (triton.cdiv(M, META['BLOCK_SIZE_M']), triton.cdiv(N, META['BLOCK_SIZE_N']))
+    group_matmul_kernel[grid](
+        a, b, scales_a, scales_b, c,
+        M, N, K,
+        a.stride(0), a.stride(1),
+        b.stride(0), b.stride(1),
+        scales_a.stride(0), scales_a.stride(1),
+        c.stride(0), c.stride(1),
+        GROUP_SIZE=groupsize,
+    )
+    return c
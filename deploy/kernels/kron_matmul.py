@@ -6,6 +6,7 @@ import triton.language as tl
 
 import deploy
 from deploy.nn.quantization import Quantizer
+from deploy.kernels.quant_epilogue import quant_pack_int4, tile_groupsize
 
 
 @triton.autotune(
@@ -37,6 +38,8 @@ def matmul_kernel(
         stride_resb, stride_resm, stride_resn,
         BLOCK_SIZE_M: tl.constexpr, # we use BLOCK_SIZE_M == triton.next_power_of_2(BLOCK_SIZE_M) to fuse quant into matmul
         is_split: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
 ):
     """
     a @ b @ c
@@ -46,6 +49,7 @@ def matmul_kernel(
     c [N, N]
 
     now only supports BLOCK_SIZE_M == triton.next_power_of_2(BLOCK_SIZE_M)
+    the int4 result has a per-token scale, or NUM_GROUPS scales of GROUPSIZE consecutive values of the token
     """
 
     pid = tl.program_id(axis=0)
@@ -86,35 +90,13 @@ def matmul_kernel(
         # atomic max does support fp16
         # tl.atomic_max(output_scale + batch_id, max_src_val.to(tl.float16))
     else:
-        abs_src_val = tl.abs(accumulator)
-        max_src_val = tl.max(abs_src_val)
-
-        scale = max_src_val / 7.
-        quant_val = libdevice.llrint(accumulator / scale)
-        quant_val = max(-8, min(quant_val, 7))
-
-        quant_val = quant_val.reshape(BLOCK_SIZE_M, np2_N // 2, 2, can_reorder=False)
-        quant_val_even, quant_val_odd = quant_val.split()
-        quant_val_odd = quant_val_odd << 4
-
-        # debug
-        # offs_resm = pid_m * M + tl.arange(0, M)
-        # offs_resn = pid_n * N + tl.arange(0, N)
-        # res_ptrs = res_ptr + stride_resb * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
-        # res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N)
-        # tl.store(res_ptrs, quant_val, mask=res_mask)
-        # tl.store(output_scale + batch_id, scale.to(tl.float16))
-        # debug
-        res = tl.zeros((BLOCK_SIZE_M, np2_N // 2), dtype=tl.int8)
-        res = res | (quant_val_odd & 0xf0)
-        res = res | (quant_val_even & 0x0f)
+        res = quant_pack_int4(accumulator, output_scale, batch_id, BLOCK_SIZE_M, np2_N, NUM_GROUPS, GROUPSIZE)
 
         offs_resm = pid_m * BLOCK_SIZE_M + tl.arange(0, BLOCK_SIZE_M)
         offs_resn = tl.arange(0, np2_N // 2)
         res_ptrs = res_ptr + stride_resb.to(tl.int64) * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
         res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
         tl.store(res_ptrs, res, mask=res_mask)
-        tl.store(output_scale + batch_id, scale.to(tl.float16))
 
 
 @triton.jit
@@ -129,9 +111,11 @@ def quant_kernel(
         N: tl.constexpr,
         np2_M: tl.constexpr, 
         np2_N: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
 ):
     '''
-    quant fp16 tensor to int4
+    quant fp16 tensor to int4, with a per-token scale or NUM_GROUPS scales of GROUPSIZE consecutive values
     '''
     batch_id = tl.program_id(axis=0) + tl.program_id(axis=1) * tl.num_programs(axis=0)
     index_rows = tl.arange(0, np2_M)
@@ -141,31 +125,19 @@ def quant_kernel(
     src_mask = (index_rows[:, None] < M) & (index_cols[None, :] < N)
     src = tl.load(src_ptrs, mask=src_mask, other=0.0)
 
-    abs_src_val = tl.abs(src)
-    max_src_val = tl.max(abs_src_val)
-    scale = max_src_val / 7.
-
-    quant_val = libdevice.llrint(src / scale)
-    quant_val = max(-8, min(quant_val, 7))
-    quant_val = quant_val.reshape(np2_M,  np2_N // 2, 2, can_reorder=False)
-    quant_val_even, quant_val_odd = quant_val.split()
-    quant_val_odd = quant_val_odd << 4
-
-    res = tl.zeros((np2_M, np2_N // 2), dtype=tl.uint8)
-    res = res | (quant_val_odd & 0xf0)
-    res = res | (quant_val_even & 0x0f)
+    res = quant_pack_int4(src.to(tl.float32), output_scale, batch_id, np2_M, np2_N, NUM_GROUPS, GROUPSIZE)
 
     offs_resm = tl.arange(0, np2_M)
     offs_resn = tl.arange(0, np2_N // 2)
     dst_ptrs = dst_ptr + stride_dstb.to(tl.int64) * batch_id + stride_dstm * offs_resm[:, None] + stride_dstn * offs_resn[None, :]
     res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
     tl.store(dst_ptrs, res, mask=res_mask)
-    tl.store(output_scale + batch_id, scale)
 
 
-def kron_matmul(a, b, c, seq_len):
+def kron_matmul(a, b, c, seq_len, groupsize=-1):
     # Check constraints.
-    # a @ b @ c, a [m, m], b [b, m, n], c [n, n]
+    # quant(a @ b @ c), a [m, m], b [b, m, n], c [n, n]
+    # per-token scales, or per-group scales of shape [b, m * n // groupsize] for groupsize > 0
     assert a.shape[1] == b.shape[1], "Incompatible dimensions"
     assert b.shape[2] == c.shape[0], "Incompatible dimensions"
     assert a.is_contiguous(), "Matrix A must be contiguous"
@@ -175,10 +147,12 @@ def kron_matmul(a, b, c, seq_len):
     Actual_B = B // seq_len
     # BLOCK_SIZE_M = triton.next_power_of_2(M)
     BLOCK_SIZE_M = 64
+    GROUPSIZE = tile_groupsize(M, N, groupsize)
     # Allocates output.
-    is_split = (M > BLOCK_SIZE_M)
+    is_split = (M > BLOCK_SIZE_M) or GROUPSIZE is None
     # is_split = True
-    output_scale = torch.empty((B, 1), device=a.device, dtype=torch.float16)
+    NUM_GROUPS = 1 if GROUPSIZE in (-1, None) else M * N // GROUPSIZE
+    output_scale = torch.empty((B, NUM_GROUPS), device=a.device, dtype=torch.float16)
     quant_res = torch.empty((B, M, N // 2), device=a.device, dtype=torch.uint8)
     if is_split:
         bmm_res = torch.empty((B, M, N), device=a.device, dtype=a.dtype)
@@ -197,8 +171,11 @@ def kron_matmul(a, b, c, seq_len):
             c.stride(0), c.stride(1), #
             bmm_res.stride(0), bmm_res.stride(1), bmm_res.stride(2),  #
             BLOCK_SIZE_M,
-            is_split,
+            True,
         )
+        if GROUPSIZE is None:
+            # the groups are not slices of the tile, quantize the fp16 result per group
+            return Quantizer(groupsize=groupsize)(bmm_res.reshape(B, -1))
         # quant fp16 to int4
         grid = (seq_len, Actual_B)
         quant_kernel[grid](
@@ -210,8 +187,9 @@ def kron_matmul(a, b, c, seq_len):
             B, M, N,
             triton.next_power_of_2(M),
             triton.next_power_of_2(N),
+            NUM_GROUPS,
+            GROUPSIZE,
         )
-        packed_tensor = deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale)
     else:
         # 1D launch kernel where each block gets its own program.
         grid = (1, seq_len, Actual_B)
@@ -228,9 +206,10 @@ def kron_matmul(a, b, c, seq_len):
             quant_res.stride(0), quant_res.stride(1), quant_res.stride(2),  #
             BLOCK_SIZE_M,
             is_split,
+            NUM_GROUPS,
+            GROUPSIZE,
         )
-        packed_tensor = deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale)
-    return packed_tensor
+    return deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale, groupsize=GROUPSIZE)
 
 
 def benchmark(B, M, N, S, provider):
@@ -0,0 +1,48 @@
+from triton.language.extra import libdevice
+import triton
+import triton.language as tl
+
+
+def tile_groupsize(M, N, groupsize):
+    """
+    Group size the quantization epilogue of the kronecker kernels can use on the row-major (M, N) tile of a
+    token: -1 for per-token scales, `groupsize` if every group of the flattened token is a whole slice of
+    rows or columns of the tile, None otherwise (the caller quantizes the fp16 result per group instead).
+    """
+    if groupsize <= 0 or groupsize >= M * N:
+        return -1
+    if N == triton.next_power_of_2(N) and groupsize == triton.next_power_of_2(groupsize) and (M * N) % groupsize == 0:
+        return groupsize
+    return None
+
+
+@triton.jit
+def quant_pack_int4(x, output_scale, batch_id, ROWS: tl.constexpr, COLS: tl.constexpr, NUM_GROUPS: tl.constexpr,
+                    GROUPSIZE: tl.constexpr):
+    """
+    Symmetric int4 quantization of the (ROWS, COLS) fp32 tile of one token, packed two values per int8 along
+    the columns. Stores the per-token scale (GROUPSIZE == -1), or the scales of the NUM_GROUPS groups of
+    GROUPSIZE consecutive values of the row-major tile, to output_scale and returns the packed tile.
+    The rows and columns of the tile past the token are quantized too, the caller masks them out.
+    """
+    if GROUPSIZE == -1:
+        scale = tl.max(tl.abs(x)) / 7.
+        quant_val = libdevice.llrint(x / scale)
+        tl.store(output_scale + batch_id, scale.to(tl.float16))
+    else:
+        groups = x.reshape(ROWS * COLS // GROUPSIZE, GROUPSIZE, can_reorder=False)
+        scales = tl.max(tl.abs(groups), axis=1) / 7.
+        quant_val = libdevice.llrint(groups / scales[:, None]).reshape(ROWS, COLS, can_reorder=False)
+        offs_scale = tl.arange(0, ROWS * COLS // GROUPSIZE)
+        tl.store(output_scale + batch_id.to(tl.int64) * NUM_GROUPS + offs_scale, scales.to(tl.float16),
+                 mask=offs_scale < NUM_GROUPS)
+    quant_val = tl.minimum(tl.maximum(quant_val, -8), 7)
+
+    quant_val = quant_val.reshape(ROWS, COLS // 2, 2, can_reorder=False)
+    quant_val_even, quant_val_odd = quant_val.split()
+    quant_val_odd = quant_val_odd << 4
+
+    res = tl.zeros((ROWS, COLS // 2), dtype=tl.int8)
+    res = res | (quant_val_odd & 0xf0)
+    res = res | (quant_val_even & 0x0f)
+    return res
@@ -0,0 +1,130 @@
+import torch
+from triton.language.extra import libdevice
+import triton
+import triton.language as tl
+
+import deploy
+from deploy.kernels.quant_epilogue import quant_pack_int4, tile_groupsize
+
+
+@triton.autotune(
+    configs=[
+        triton.Config({}, num_stages=2, num_warps=4),
+        triton.Config({}, num_stages=2, num_warps=2),
+        triton.Config({}, num_stages=3, num_warps=4),
+        triton.Config({}, num_stages=3, num_warps=2),
+        triton.Config({}, num_stages=4, num_warps=4),
+        triton.Config({}, num_stages=4, num_warps=2),
+    ],
+    key=['B', 'M', 'N'],
+)
+
+
+@triton.jit
+def rmsnorm_matmul_kernel(
+        a_ptr, b_ptr, c_ptr,
+        res_ptr,
+        output_scale,
+        eps,
+        B,
+        M: tl.constexpr,
+        N: tl.constexpr,
+        np2_M: tl.constexpr,
+        np2_N: tl.constexpr,
+        stride_am, stride_ak,
+        stride_bb, stride_bk, stride_bn,
+        stride_ck, stride_cn,
+        stride_resb, stride_resm, stride_resn,
+        BLOCK_SIZE_M: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
+):
+    """
+    quant(a @ rmsnorm(b) @ c)
+
+    a [M, M]
+    b [B, M, N]
+    c [N, N]
+
+    each program loads one whole token, normalizes it in registers, applies the kronecker transform
+    and packs the int4 result with a per-token scale (or NUM_GROUPS scales of GROUPSIZE consecutive values),
+    so only supports M <= BLOCK_SIZE_M
+    """
+
+    batch_id = tl.program_id(axis=0) + tl.program_id(axis=1) * tl.num_programs(axis=0)
+
+    offs_am = tl.arange(0, BLOCK_SIZE_M) % M
+    offs_n = tl.arange(0, np2_N)
+    offs_k = tl.arange(0, np2_M)
+    a_ptrs = a_ptr + (offs_am[:, None] * stride_am + offs_k[None, :] * stride_ak)
+    b_ptrs = b_ptr + batch_id * stride_bb.to(tl.int64) + (offs_k[:, None] * stride_bk + offs_n[None, :] * stride_bn)
+
+    a = tl.load(a_ptrs, mask=offs_k[None, :] < M, other=0.0)
+    b = tl.load(b_ptrs, mask=(offs_k[:, None] < M) & (offs_n[None, :] < N), other=0.0).to(tl.float32)
+
+    # rmsnorm over the M * N entries of the token, same as deploy.nn.RMSNorm
+    variance = tl.sum(tl.sum(b * b, axis=1), axis=0) / (M * N)
+    b = (b * tl.rsqrt(variance + eps)).to(tl.float16)
+
+    accumulator = tl.zeros((BLOCK_SIZE_M, np2_N), dtype=tl.float32)
+    accumulator += tl.dot(a, b)
+
+    tmp_ab = accumulator.to(tl.float16)
+
+    offs_cn = tl.arange(0, np2_N) % N
+    offs_k = tl.arange(0, np2_N)
+    c_ptrs = c_ptr + (offs_k[:, None] * stride_ck + offs_cn[None, :] * stride_cn)
+    c = tl.load(c_ptrs, mask=offs_k[:, None] < N, other=0.0)
+
+    accumulator = 0
+    accumulator += tl.dot(tmp_ab, c)
+
+    res = quant_pack_int4(accumulator, output_scale, batch_id, BLOCK_SIZE_M, np2_N, NUM_GROUPS, GROUPSIZE)
+
+    offs_resm = tl.arange(0, BLOCK_SIZE_M)
+    offs_resn = tl.arange(0, np2_N // 2)
+    res_ptrs = res_ptr + stride_resb.to(tl.int64) * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
+    res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
+    tl.store(res_ptrs, res, mask=res_mask)
+
+
+# a whole token has to fit into one program
+RMSNORM_KRON_BLOCK_SIZE_M = 64
+
+
+def rmsnorm_kron_matmul(a, b, c, seq_len, eps, groupsize=-1):
+    # Check constraints.
+    # quant(a @ rmsnorm(b) @ c), a [m, m], b [b, m, n], c [n, n]
+    # per-token scales, or per-group scales of shape [b, m * n // groupsize] for groupsize > 0
+    assert a.shape[1] == b.shape[1], "Incompatible dimensions"
+    assert b.shape[2] == c.shape[0], "Incompatible dimensions"
+    assert a.is_contiguous(), "Matrix A must be contiguous"
+    assert b.is_contiguous(), "Matrix B must be contiguous"
+    assert c.is_contiguous(), "Matrix C must be contiguous"
+    B, M, N = b.shape
+    assert M <= RMSNORM_KRON_BLOCK_SIZE_M, "The fused rmsnorm only supports M <= {}".format(RMSNORM_KRON_BLOCK_SIZE_M)
+    GROUPSIZE = tile_groupsize(M, N, groupsize)
+    assert GROUPSIZE is not None, "The groups of {} must be slices of the ({}, {}) tile".format(groupsize, M, N)
+    NUM_GROUPS = 1 if GROUPSIZE == -1 else M * N // GROUPSIZE
+    Actual_B = B // seq_len
+    output_scale = torch.empty((B, NUM_GROUPS), device=a.device, dtype=torch.float16)
+    quant_res = torch.empty((B, M, N // 2), device=a.device, dtype=torch.uint8)
+    # one program per token, split over two grid dims as 'B' may exceed 65535
+    grid = (seq_len, Actual_B)
+    rmsnorm_matmul_kernel[grid](
+        a, b, c,  #
+        quant_res, #
+        output_scale, #
+        eps, #
+        B, M, N,  #
+        triton.next_power_of_2(M),
+        triton.next_power_of_2(N),
+        a.stride(0), a.stride(1), #
+        b.stride(0), b.stride(1), b.stride(2),  #
+        c.stride(0), c.stride(1), #
+        quant_res.stride(0), quant_res.stride(1), quant_res.stride(2),  #
+        RMSNORM_KRON_BLOCK_SIZE_M,
+        NUM_GROUPS,
+        GROUPSIZE,
+    )
+    return deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale, groupsize=GROUPSIZE)
@@ -0,0 +1,162 @@
+import torch
+from triton.language.extra import libdevice
+import triton
+import triton.language as tl
+
+import deploy
+from deploy.kernels.kron_matmul import quant_kernel
+from deploy.kernels.quant_epilogue import quant_pack_int4, tile_groupsize
+
+
+@triton.autotune(
+    configs=[
+        triton.Config({}, num_stages=2, num_warps=4),
+        triton.Config({}, num_stages=2, num_warps=2),
+        triton.Config({}, num_stages=3, num_warps=4),
+        triton.Config({}, num_stages=3, num_warps=2),
+        triton.Config({}, num_stages=4, num_warps=4),
+        triton.Config({}, num_stages=4, num_warps=2),
+    ],
+    key=['B', 'M', 'N'],
+)
+
+
+@triton.jit
+def swiglu_matmul_kernel(
+        a_ptr, gate_ptr, up_ptr, c_ptr,
+        res_ptr,
+        output_scale,
+        B,
+        M: tl.constexpr,
+        N: tl.constexpr,
+        np2_M: tl.constexpr,
+        np2_N: tl.constexpr,
+        stride_am, stride_ak,
+        stride_gb, stride_gk, stride_gn,
+        stride_ub, stride_uk, stride_un,
+        stride_ck, stride_cn,
+        stride_resb, stride_resm, stride_resn,
+        BLOCK_SIZE_M: tl.constexpr,
+        is_split: tl.constexpr,
+        NUM_GROUPS: tl.constexpr = 1,
+        GROUPSIZE: tl.constexpr = -1,
+):
+    """
+    a @ (silu(gate) * up) @ c
+
+    a       [M, M]
+    gate/up [B, M, N]
+    c       [N, N]
+
+    the activation is computed while loading the matmul operand and never written out. if the token
+    fits into one program the result is quantized to int4 in place (with a per-token scale, or NUM_GROUPS
+    scales of GROUPSIZE consecutive values), otherwise it is stored in fp16 and quantized by quant_kernel
+    """
+
+    pid = tl.program_id(axis=0)
+    batch_id = tl.program_id(axis=1) + tl.program_id(axis=2) * tl.num_programs(axis=1)
+    pid_m = pid
+
+    offs_am = (pid_m * BLOCK_SIZE_M + tl.arange(0, BLOCK_SIZE_M)) % M
+    offs_n = tl.arange(0, np2_N)
+    offs_k = tl.arange(0, np2_M)
+    a_ptrs = a_ptr + (offs_am[:, None] * stride_am + offs_k[None, :] * stride_ak)
+    gate_ptrs = gate_ptr + batch_id * stride_gb.to(tl.int64) + (offs_k[:, None] * stride_gk + offs_n[None, :] * stride_gn)
+    up_ptrs = up_ptr + batch_id * stride_ub.to(tl.int64) + (offs_k[:, None] * stride_uk + offs_n[None, :] * stride_un)
+    b_mask = (offs_k[:, None] < M) & (offs_n[None, :] < N)
+
+    a = tl.load(a_ptrs, mask=offs_k[None, :] < M, other=0.0)
+    gate = tl.load(gate_ptrs, mask=b_mask, other=0.0).to(tl.float32)
+    up = tl.load(up_ptrs, mask=b_mask, other=0.0).to(tl.float32)
+    b = (gate * tl.sigmoid(gate) * up).to(tl.float16)
+
+    accumulator = tl.zeros((BLOCK_SIZE_M, np2_N), dtype=tl.float32)
+    accumulator += tl.dot(a, b)
+
+    tmp_ab = accumulator.to(tl.float16)
+
+    offs_cn = tl.arange(0, np2_N) % N
+    offs_k = tl.arange(0, np2_N)
+    c_ptrs = c_ptr + (offs_k[:, None] * stride_ck + offs_cn[None, :] * stride_cn)
+    c = tl.load(c_ptrs, mask=offs_k[:, None] < N, other=0.0)
+
+    accumulator = 0
+    accumulator += tl.dot(tmp_ab, c)
+
+    if is_split:
+        res = accumulator.to(tl.float16)
+
+        offs_resm = pid_m * BLOCK_SIZE_M + tl.arange(0, BLOCK_SIZE_M)
+        offs_resn = tl.arange(0, np2_N)
+        res_ptrs = res_ptr + stride_resb.to(tl.int64) * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
+        res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N)
+
+        tl.store(res_ptrs, res, mask=res_mask)
+    else:
+        res = quant_pack_int4(accumulator, output_scale, batch_id, BLOCK_SIZE_M, np2_N, NUM_GROUPS, GROUPSIZE)
+
+        offs_resm = pid_m * BLOCK_SIZE_M + tl.arange(0, BLOCK_SIZE_M)
+        offs_resn = tl.arange(0, np2_N // 2)
+        res_ptrs = res_ptr + stride_resb.to(tl.int64) * batch_id + stride_resm * offs_resm[:, None] + stride_resn * offs_resn[None, :]
+        res_mask = (offs_resm[:, None] < M) & (offs_resn[None, :] < N // 2)
+        tl.store(res_ptrs, res, mask=res_mask)
+
+
+def swiglu_kron_matmul(a, gate, up, c, seq_len, groupsize=-1):
+    # Check constraints.
+    # quant(a @ (silu(gate) * up) @ c), a [m, m], gate/up [b, m, n], c [n, n]
+    # per-token scales, or per-group scales of shape [b, m * n // groupsize] for groupsize > 0
+    assert gate.shape == up.shape, "Incompatible dimensions"
+    assert a.shape[1] == gate.shape[1], "Incompatible dimensions"
+    assert gate.shape[2] == c.shape[0], "Incompatible dimensions"
+    assert a.is_contiguous(), "Matrix A must be contiguous"
+    assert c.is_contiguous(), "Matrix C must be contiguous"
+    B, M, N = gate.shape
+    Actual_B = B // seq_len
+    BLOCK_SIZE_M = 64
+    is_split = (M > BLOCK_SIZE_M)
+    GROUPSIZE = tile_groupsize(M, N, groupsize)
+    assert GROUPSIZE is not None, "The groups of {} must be slices of the ({}, {}) tile".format(groupsize, M, N)
+    NUM_GROUPS = 1 if GROUPSIZE == -1 else M * N // GROUPSIZE
+    output_scale = torch.empty((B, NUM_GROUPS), device=a.device, dtype=torch.float16)
+    quant_res = torch.empty((B, M, N // 2), device=a.device, dtype=torch.uint8)
+    if is_split:
+        bmm_res = torch.empty((B, M, N), device=a.device, dtype=a.dtype)
+        grid = (triton.cdiv(M, BLOCK_SIZE_M), seq_len, Actual_B)
+        out = bmm_res
+    else:
+        grid = (1, seq_len, Actual_B)
+        out = quant_res
+    swiglu_matmul_kernel[grid](
+        a, gate, up, c,  #
+        out, #
+        output_scale, #
+        B, M, N,  #
+        triton.next_power_of_2(M),
+        triton.next_power_of_2(N),
+        a.stride(0), a.stride(1), #
+        gate.stride(0), gate.stride(1), gate.stride(2),  #
+        up.stride(0), up.stride(1), up.stride(2),  #
+        c.stride(0), c.stride(1), #
+        out.stride(0), out.stride(1), out.stride(2),  #
+        BLOCK_SIZE_M,
+        is_split,
+        NUM_GROUPS,
+        GROUPSIZE,
+    )
+    if is_split:
+        # quant fp16 to int4
+        grid = (seq_len, Actual_B)
+        quant_kernel[grid](
+            bmm_res,
+            bmm_res.stride(0), bmm_res.stride(1), bmm_res.stride(2),
+            quant_res,
+            quant_res.stride(0), quant_res.stride(1), quant_res.stride(2),
+            output_scale,
+            B, M, N,
+            triton.next_power_of_2(M),
+            triton.next_power_of_2(N),
+            NUM_GROUPS,
+            GROUPSIZE,
+        )
+    return deploy.PackedQuantizedTensor(quant_res.reshape(B, -1), output_scale, groupsize=GROUPSIZE)
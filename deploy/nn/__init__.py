@@ -1,4 +1,4 @@
 from .linear import Linear4bit
-from .normalization import RMSNorm
-from .quantization import Quantizer
-from .online_trans import OnlineTrans
+from .normalization import RMSNorm, RMSNormOnlineTrans
+from .quantization import Quantizer, act_static_scales
+from .online_trans import OnlineTrans, SwiGLUOnlineTrans
@@ -42,6 +42,11 @@ class Linear4bit(torch.nn.Module):
         #    torch.cuda.set_device(x.device)
         
         assert type(x) == deploy.PackedQuantizedTensor #Quantized input is given
+        if x.groupsize > 0:
+            out = deploy.group_matmul(x.quantized_x, self.weight, x.scales_x, self.weight_scales, x.groupsize)
+            if self.bias is not None:
+                return out + self.bias
+            return out
         x, scales_x = x.quantized_x, x.scales_x
         #shape_handler = ShapeHandler(quantized_x)
         #quantized_x = shape_handler.flatten(quantized_x)
@@ -1,4 +1,6 @@
+import deploy
 import torch
+from deploy.nn.online_trans import get_decompose_dim
 
 
 class RMSNorm(torch.nn.Module):
@@ -20,3 +22,23 @@ class RMSNorm(torch.nn.Module):
         variance = x.pow(2).sum(-1, keepdim=True) / self.mean_dim
         x = x * torch.rsqrt(variance + self.eps)
         return x.to(input_dtype)
+
+
+class RMSNormOnlineTrans(torch.nn.Module):
+    """
+    RMSNorm fused with the kronecker OnlineTrans (trans="matmul") and the int4 Quantizer of the following 
+    linear layers, so the hidden states are read once and a deploy.PackedQuantizedTensor is returned
+    (with per-group scales for groupsize > 0). Only for fuseLN, where the norm weight is merged into the linear layers.
+    """
+
+    def __init__(self, mean_dim: int, eps=1e-5, groupsize=-1):
+        super().__init__()
+        self.eps = eps
+        self.mean_dim = mean_dim
+        self.groupsize = groupsize
+        left_size, right_size = get_decompose_dim(mean_dim)
+        self.register_buffer("left_matrix", torch.randn([left_size, left_size], dtype=torch.float16))
+        self.register_buffer("right_matrix", torch.randn([right_size, right_size], dtype=torch.float16))
+
+    def forward(self, x: torch.Tensor):
+        return deploy.functional.rms_norm_kronecker_quant(x, self.left_matrix, self.right_matrix, self.eps, self.groupsize)
@@ -16,16 +16,19 @@ def get_decompose_dim(n):
 
 
 class OnlineTrans(torch.nn.Module):
-    def __init__(self, trans_dim, force_fp32=False, trans="had", decompose=True):
+    def __init__(self, trans_dim, force_fp32=False, trans="had", decompose=True, groupsize=-1):
         super().__init__()
         self.fp32_trans = force_fp32
+        # the kronecker transform (trans="matmul") quantizes its output, per group for groupsize > 0
+        self.groupsize = groupsize
         self.trans = trans
         self.decompose = decompose
         self.trans_dim = trans_dim
         if trans == "had":
             had_rem_dim, self.rem_dim = deploy.functional.online_trans.get_hadK(trans_dim)
             if had_rem_dim is not None:
-                self.register_buffer("had_rem_dim", had_rem_dim)
+                # the registry tensor is shared, keep a private copy as the buffer
+                self.register_buffer("had_rem_dim", had_rem_dim.clone())
                 if not self.fp32_trans:
                     self.had_rem_dim = self.had_rem_dim.to(torch.float16)
             else:
@@ -58,5 +61,23 @@ class OnlineTrans(torch.nn.Module):
                 invs.append(self.left_matrix)
             if hasattr(self, "right_matrix"):
                 invs.append(self.right_matrix)
-            x = deploy.functional.online_trans.kronecker_matmul(x, invs)
+            x = deploy.functional.online_trans.kronecker_matmul(x, invs, self.groupsize)
         return x
+
+
+class SwiGLUOnlineTrans(torch.nn.Module):
+    """
+    silu(gate) * up of the MLP fused with the kronecker OnlineTrans (trans="matmul") and the int4 Quantizer 
+    of down_proj, takes the outputs of gate_proj and up_proj and returns a deploy.PackedQuantizedTensor
+    with per-token scales, or per-group scales for groupsize > 0.
+    """
+    def __init__(self, trans_dim, groupsize=-1):
+        super().__init__()
+        self.trans_dim = trans_dim
+        self.groupsize = groupsize
+        left_size, right_size = get_decompose_dim(trans_dim)
+        self.register_buffer("left_matrix", torch.randn([left_size, left_size], dtype=torch.float16))
+        self.register_buffer("right_matrix", torch.randn([right_size, right_size], dtype=torch.float16))
+
+    def forward(self, gate, up):
+        return deploy.functional.swiglu_kronecker_quant(gate, up, self.left_matrix, self.right_matrix, self.groupsize)
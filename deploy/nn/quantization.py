@@ -2,14 +2,63 @@ import deploy
 import torch
 
 
+# the act_quantizer of flat_matrices.pth used by each Quantizer of a layer, the projections sharing an input
+# see the same calibrated range
+ACT_QUANTIZERS = {"qkv": "self_attn.q_proj", "o": "self_attn.o_proj",
+                  "up_gate": "mlp.up_proj", "down": "mlp.down_proj"}
+
+
+def act_static_scales(flat_matrices, n_layers, clip_ratio=None):
+    """
+    Per-layer {"qkv", "o", "up_gate", "down"} static scales of the Quantizers from the flat_matrices.pth saved
+    by --save_matrix with --a_static: max(-static_xmin * sigmoid(clip_factor_a_min), static_xmax *
+    sigmoid(clip_factor_a_max)) / 7 like ActivationQuantizer.get_scale_zero, with `clip_ratio` (--a_clip_ratio)
+    instead of the sigmoids without --lac. None for the quantizers without a calibrated range.
+    """
+    def _scale(params, name):
+        prefix = f"{name}.act_quantizer."
+        if prefix + "static_xmax" not in params:
+            return None
+        xmax, xmin = params[prefix + "static_xmax"].float(), params[prefix + "static_xmin"].float()
+        if prefix + "clip_factor_a_max" in params:
+            xmax = xmax * torch.sigmoid(params[prefix + "clip_factor_a_max"].float())
+            xmin = xmin * torch.sigmoid(params[prefix + "clip_factor_a_min"].float())
+        elif clip_ratio is not None:
+            xmax, xmin = xmax * clip_ratio, xmin * clip_ratio
+        scale = torch.maximum(-xmin, xmax).max().item() / 7
+        return scale if scale > 0 else 1.0
+    return [{unit: _scale(flat_matrices[i], name) for unit, name in ACT_QUANTIZERS.items()}
+            for i in range(n_layers)]
+
+
 class Quantizer(torch.nn.Module):
-    def __init__(self, input_clip_ratio=1.0):
+    """
+    Symmetric int4 quantization of the inputs of the int4 linear layers, with per-token (or per-group) scales
+    computed from x, or with a per-tensor `static_scale` calibrated by FlatQuant (--a_static, see
+    `act_static_scales`), which skips the reduction over x.
+    """
+    def __init__(self, input_clip_ratio=1.0, groupsize=-1, static_scale=None):
         super().__init__()
         self.input_clip_ratio = input_clip_ratio
+        self.groupsize = groupsize
+        if static_scale is not None:
+            static_scale = torch.tensor(static_scale, dtype=torch.float16).reshape(1, 1)
+        self.register_buffer("static_scale", static_scale)
     
     def forward(self, x):
         if not isinstance(x, deploy.PackedQuantizedTensor):
-            scales_x = (torch.max(torch.abs(x), dim=-1)[0].unsqueeze(1)/7).to(torch.float16) * self.input_clip_ratio
+            if self.groupsize > 0 and self.groupsize < x.shape[-1]:
+                x_grouped = x.reshape(*x.shape[:-1], x.shape[-1] // self.groupsize, self.groupsize)
+                if self.static_scale is not None:
+                    scales_x = self.static_scale.expand(*x_grouped.shape[:-1]).contiguous()
+                else:
+                    scales_x = (torch.max(torch.abs(x_grouped), dim=-1)[0]/7).to(torch.float16) * self.input_clip_ratio
+                quantized_x = deploy.group_sym_quant(x, scales_x, self.groupsize)
+                return deploy.PackedQuantizedTensor(quantized_x, scales_x, groupsize=self.groupsize)
+            if self.static_scale is not None:
+                scales_x = self.static_scale.expand(x.shape[0], 1).contiguous()
+            else:
+                scales_x = (torch.max(torch.abs(x), dim=-1)[0].unsqueeze(1)/7).to(torch.float16) * self.input_clip_ratio
             quantized_x = deploy.sym_quant(x, scales_x)
             packed_tensor = deploy.PackedQuantizedTensor(quantized_x, scales_x)
             return packed_tensor
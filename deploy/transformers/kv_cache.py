@@ -5,7 +5,7 @@ import torch
 from .. import _CUDA
 import functools
 from fast_hadamard_transform import hadamard_transform
-from deploy.functional.quantization import get_minq_maxq
+from deploy.functional.quantization import get_minq_maxq, pack_bits, unpack_bits
 
 
 @torch.jit.script
@@ -30,6 +30,91 @@ def unpack_i4_and_asym_dequantize(q, scale, zero):
     return q * scale - zero
 
 
+def asym_quantize_and_pack(x: torch.Tensor, bits: int, groupsize: int = -1, clip_ratio=None):
+    """
+    Asymmetric per-group quantization followed by `pack_bits`, for K/V caches below 4 bits.
+    The quantization grid mirrors flatquant.quant_utils.ActivationQuantizer(bits, sym=False, groupsize=groupsize),
+    i.e. the k/v cache quantizers used during calibration emulate this format. clip_ratio is either a float
+    scaling both bounds or a (max_ratio, min_ratio) pair, sigmoid(clip_factor_a_max/min) of a quantizer calibrated
+    with --lac.
+
+    Returns the packed tensor of shape (..., head_dim * bits // 8) and the params of shape
+    (..., head_dim // groupsize, 2) holding (scale, zero) in fp16, with x ~= scale * (q - zero).
+    """
+    head_dim = x.shape[-1]
+    if groupsize <= 0 or groupsize >= head_dim:
+        groupsize = head_dim
+    assert head_dim % groupsize == 0
+    maxq = 2 ** bits - 1
+    x = x.reshape(*x.shape[:-1], head_dim // groupsize, groupsize)
+    xmax = torch.clamp(torch.amax(x, dim=-1, keepdim=True), min=0)
+    xmin = torch.clamp(torch.amin(x, dim=-1, keepdim=True), max=0)
+    if clip_ratio is not None:
+        max_ratio, min_ratio = clip_ratio if isinstance(clip_ratio, (tuple, list)) else (clip_ratio, clip_ratio)
+        xmax = xmax * max_ratio
+        xmin = xmin * min_ratio
+    tmp = (xmin == 0) & (xmax == 0)
+    xmin = torch.where(tmp, -torch.ones_like(xmin), xmin)
+    xmax = torch.where(tmp, torch.ones_like(xmax), xmax)
+    scale = (xmax - xmin) / maxq
+    zero = torch.round(-xmin / scale)
+    q = torch.clamp(torch.round(x / scale) + zero, 0, maxq)
+    q = pack_bits(q.reshape(*x.shape[:-2], head_dim), bits)
+    return q, torch.cat([scale, zero], dim=-1).to(torch.float16)
+
+
+def unpack_and_asym_dequantize(q, param, bits):
+    x = unpack_bits(q, bits)
+    x = x.view(*x.shape[:-1], param.shape[-2], -1)
+    scale, zero = param[..., 0:1], param[..., 1:2]
+    return (scale * (x - zero)).view(*x.shape[:-2], -1)
+
+
+def kv_clip_ratios(flat_matrices, n_layers):
+    """
+    Per-layer (k_clip_ratio, v_clip_ratio) of MultiLayerPagedKVCacheLowBit from the flat_matrices.pth saved by
+    --save_matrix: the (max_ratio, min_ratio) of the k/v cache quantizers calibrated with --lac, None without.
+    """
+    def _ratio(params, name):
+        if f"self_attn.{name}.clip_factor_a_max" not in params:
+            return None
+        return tuple(torch.sigmoid(params[f"self_attn.{name}.clip_factor_a_{bound}"].float()).item()
+                     for bound in ("max", "min"))
+    return [(_ratio(flat_matrices[i], "k_cache_quantizer"), _ratio(flat_matrices[i], "v_cache_quantizer"))
+            for i in range(n_layers)]
+
+
+def batch_decode_lowbit(q, k_data, k_param, v_data, v_param, bits, chunk_size=4096):
+    """
+    Reference decode attention over a packed low-bit K/V cache.
+
+    q:      (batch_size, num_qo_heads, head_dim)
+    k_data: (batch_size, num_kv_heads, kv_len, head_dim * bits // 8), k_param: (..., kv_len, n_groups, 2)
+
+    The cache is dequantized chunk by chunk with an online softmax, so at most `chunk_size` tokens of
+    fp16 K/V are live at a time.
+    """
+    batch_size, num_qo_heads, head_dim = q.shape
+    num_kv_heads, kv_len = k_data.shape[1], k_data.shape[2]
+    group = num_qo_heads // num_kv_heads
+    q = q.float().view(batch_size, num_kv_heads, group, head_dim) / math.sqrt(head_dim)
+    m = q.new_full((batch_size, num_kv_heads, group, 1), -float("inf"))
+    l = q.new_zeros((batch_size, num_kv_heads, group, 1))
+    acc = q.new_zeros((batch_size, num_kv_heads, group, head_dim))
+    for start in range(0, kv_len, chunk_size):
+        end = min(start + chunk_size, kv_len)
+        k = unpack_and_asym_dequantize(k_data[:, :, start:end], k_param[:, :, start:end], bits).float()
+        v = unpack_and_asym_dequantize(v_data[:, :, start:end], v_param[:, :, start:end], bits).float()
+        s = torch.matmul(q, k.transpose(-1, -2))
+        m_new = torch.maximum(m, s.amax(dim=-1, keepdim=True))
+        p = torch.exp(s - m_new)
+        alpha = torch.exp(m - m_new)
+        l = l * alpha + p.sum(dim=-1, keepdim=True)
+        acc = acc * alpha + torch.matmul(p, v)
+        m = m_new
+    return (acc / l).view(batch_size, num_qo_heads, head_dim)
+
+
 def matmul_had_cuda(X, dtype):
     n = X.shape[-1]
     input = hadamard_transform(X.to(dtype).contiguous(), scale=1/math.sqrt(n))
@@ -309,3 +394,136 @@ class MultiLayerPagedKVCache4Bit(Cache):
 
     def to_legacy_cache(self):
         return self
+
+
+class MultiLayerPagedKVCacheLowBit(Cache):
+    """
+    Paged K/V cache with generic bit-packing (e.g. 2/3-bit) and per-group (scale, zero) params
+    stored alongside the pages. See `asym_quantize_and_pack` for the format.
+    Token t of sequence b lives in page (t // page_size) * batch_size + b at offset t % page_size.
+    clip_ratios[layer_idx] = (k_clip_ratio, v_clip_ratio) are the clipping ratios of the calibrated k/v cache
+    quantizers (see kv_clip_ratios), without them the cache is only exact for a calibration without --lac.
+    """
+    def __init__(
+        self, batch_size, page_size, max_seq_len, 
+        device, n_layers, num_heads, head_dim, 
+        bits=2, groupsize=-1, clip_ratios=None,
+        trans_dtype=torch.float16, trans="had"):
+        assert (head_dim * bits) % 8 == 0, "head_dim * bits should be divisible by 8"
+        if groupsize <= 0 or groupsize >= head_dim:
+            groupsize = head_dim
+        assert head_dim % groupsize == 0
+        self.batch_size = batch_size
+        self.page_size = page_size
+        self.max_seq_len = max_seq_len
+        self.bits = bits
+        self.groupsize = groupsize
+        self.clip_ratios = clip_ratios if clip_ratios is not None else [(None, None)] * n_layers
+        max_page_cnt = self.page_cnt_from_length(max_seq_len)
+        self.pages = torch.empty(
+            (max_page_cnt * batch_size, n_layers, 2, num_heads, page_size, head_dim * bits // 8),
+            dtype=torch.uint8, device=device)
+        self.scales = torch.empty(
+            (max_page_cnt * batch_size, n_layers, 2, num_heads, page_size, head_dim // groupsize, 2),
+            dtype=torch.float16, device=device)
+        self.trans = trans
+        if self.trans == "had":
+            self.head_dim = None
+        elif self.trans.startswith("matmul"):
+            self.head_dim = torch.randn([head_dim, head_dim], requires_grad=False).to(trans_dtype).to(device)
+        else:
+            trans_dtype = None
+            self.head_dim = None
+        self.trans_dtype = trans_dtype
+        self._needs_init = [True] * n_layers
+        self.length = 0
+        self.device = device
+
+    def page_cnt_from_length(self, length):
+        return (length + self.page_size - 1) // self.page_size
+
+    @property
+    def seen_tokens(self):
+        return self.length
+
+    def _trans(self, x):
+        if self.trans_dtype is None:
+            return x
+        if self.head_dim is None:
+            return matmul_had_cuda(x, dtype=self.trans_dtype)
+        return torch.matmul(x.to(self.trans_dtype), self.head_dim)
+
+    def _write(self, layer_idx, kv_idx, data, param, start):
+        b_sz, added_length = data.shape[:2]
+        pos = torch.arange(start, start + added_length, device=self.device)
+        page_idx = (pos // self.page_size).unsqueeze(0) * self.batch_size + \
+            torch.arange(b_sz, device=self.device).unsqueeze(1)
+        offset = (pos % self.page_size).unsqueeze(0).expand(b_sz, -1)
+        # (b_sz, added_length, num_heads, ...) -> pages[page, layer, kv, :, offset]
+        self.pages[page_idx, layer_idx, kv_idx, :, offset] = data
+        self.scales[page_idx, layer_idx, kv_idx, :, offset] = param
+
+    def _read(self, layer_idx, kv_idx):
+        page_cnt = self.page_cnt_from_length(self.length)
+        def _gather(buf):
+            buf = buf[:page_cnt * self.batch_size, layer_idx, kv_idx]
+            buf = buf.view(page_cnt, self.batch_size, *buf.shape[1:]).transpose(0, 1).transpose(1, 2)
+            # (batch_size, num_heads, page_cnt, page_size, ...)
+            buf = buf.reshape(self.batch_size, buf.shape[1], page_cnt * self.page_size, *buf.shape[4:])
+            return buf[:, :, :self.length]
+        return _gather(self.pages), _gather(self.scales)
+
+    def update(
+        self,
+        key_states: torch.Tensor,
+        value_states: torch.Tensor,
+        layer_idx: int,
+        cache_kwargs: Optional[Dict[str, Any]] = None,
+    ):
+        b_sz, added_length, num_heads, head_dim = key_states.shape
+        assert b_sz == self.batch_size
+        attention_mask = cache_kwargs.get("attention_mask") if cache_kwargs is not None else None
+        if attention_mask is not None and not bool(attention_mask.all()):
+            raise NotImplementedError("Current implementation does not support padded batches")
+
+        orig_key_states = key_states
+        orig_value_states = value_states
+        key_states = self._trans(key_states)
+        k_clip_ratio, v_clip_ratio = self.clip_ratios[layer_idx]
+        k_data, k_param = asym_quantize_and_pack(key_states, self.bits, self.groupsize, k_clip_ratio)
+        v_data, v_param = asym_quantize_and_pack(value_states, self.bits, self.groupsize, v_clip_ratio)
+
+        if layer_idx == 0:
+            new_length = self.length + added_length
+            if self.page_cnt_from_length(new_length) * self.batch_size > self.pages.shape[0]:
+                raise NotImplementedError
+            self.length = new_length
+        start = self.length - added_length
+        self._write(layer_idx, 0, k_data, k_param, start)
+        self._write(layer_idx, 1, v_data, v_param, start)
+
+        if self._needs_init[layer_idx]:
+            self._needs_init[layer_idx] = False
+            return orig_key_states, orig_value_states
+        assert added_length == 1
+        return functools.partial(self._decode, layer_idx=layer_idx)
+
+    def _decode(self, q, layer_idx):
+        batch_size, q_len, num_qo_heads, head_dim = q.shape
+        assert q_len == 1
+        q = self._trans(q.view(batch_size, num_qo_heads, head_dim))
+        k_data, k_param = self._read(layer_idx, 0)
+        v_data, v_param = self._read(layer_idx, 1)
+        attn_output = batch_decode_lowbit(q, k_data, k_param, v_data, v_param, self.bits)
+        return attn_output.to(torch.float16).unsqueeze(1)
+
+    def get_seq_length(self, layer_idx: Optional[int] = 0) -> int:
+        """Returns the sequence length of the cached states. A layer index can be optionally passed."""
+        return self.length
+
+    def get_max_length(self) -> Optional[int]:
+        """Returns the maximum sequence length of the cached states, if there is any."""
+        return None
+
+    def to_legacy_cache(self):
+        return self
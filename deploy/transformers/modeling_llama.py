@@ -9,6 +9,8 @@ from transformers.pytorch_utils import ALL_LAYERNORM_LAYERS
 from typing import Optional, Tuple
 from transformers import Cache
 
+from flatquant.bit_allocation import module_bits
+
 
 ALL_LAYERNORM_LAYERS.append(deploy.nn.RMSNorm)
 
@@ -86,8 +88,12 @@ class FlatQuantFP16LlamaAttention(LlamaFlashAttention2):
         if isinstance(self.o_proj_trans, deploy.nn.OnlineTrans) and self.o_proj_trans.trans == "matmul":
             # attn_output: (bsz, seq_len, num_heads, head_dim)
             attn_output = self.o_proj_trans(attn_output.transpose(-1, -2).contiguous())
-            attn_output.quantized_x = attn_output.quantized_x.transpose(-1, -2)
-            attn_output.quantized_x = attn_output.quantized_x.reshape(bsz, q_len, -1).contiguous()
+            if attn_output.groupsize > 0:
+                # the groups are consecutive in the (head_dim, num_heads) order of the transform
+                attn_output.quantized_x = attn_output.quantized_x.reshape(bsz, q_len, -1)
+            else:
+                attn_output.quantized_x = attn_output.quantized_x.transpose(-1, -2)
+                attn_output.quantized_x = attn_output.quantized_x.reshape(bsz, q_len, -1).contiguous()
         else:
             attn_output = self.o_proj_trans(attn_output.transpose(-1, -2)).transpose(-1, -2)
             attn_output = attn_output.reshape(bsz, q_len, self.hidden_size).contiguous()
@@ -99,55 +105,101 @@ class FlatQuantFP16LlamaAttention(LlamaFlashAttention2):
         return attn_output, attn_weights, past_key_value
 
 
+def is_fp16_unit(options, layer_idx, name):
+    '''
+    Whether the projection `name` of a layer is kept in fp16 by the per-module bits of options.bit_config
+    (--bit_budget), with its online transform folded into the weights and no quantizer. The int4 kernels
+    also hold 2- and 3-bit weights, whose grids are subsets of the int4 one.
+    '''
+    w_bits, _ = module_bits(getattr(options, "bit_config", None), f"model.layers.{layer_idx}.{name}", 4, 4)
+    if w_bits not in (2, 3, 4, 16):
+        raise NotImplementedError(f"Only 2/3/4-bit (int4 kernels) and 16-bit linear layers are supported, "
+                                  f"but model.layers.{layer_idx}.{name} has {w_bits} bits.")
+    return w_bits == 16
+
+
 class FlatQuantLlamaAttention(FlatQuantFP16LlamaAttention):
 
     def __init__(self, options, *args, **kwargs):
         super().__init__(*args, **kwargs)
         self.options = options
-        self.quantizer = deploy.nn.Quantizer()
-        self.q_proj = deploy.nn.Linear4bit.from_float(self.q_proj)
-        self.k_proj = deploy.nn.Linear4bit.from_float(self.k_proj)
-        self.v_proj = deploy.nn.Linear4bit.from_float(self.v_proj)
-        if "o_proj" in self.options.online_trans:
-            self.o_proj_trans = deploy.nn.OnlineTrans(self.num_heads, trans=options.trans, decompose=False)
-        self.o_proj = torch.nn.Sequential(
-            deploy.nn.Quantizer(),
-            deploy.nn.Linear4bit.from_float(self.o_proj)
-        )
-        if "qkv_proj" in self.options.online_trans:
+        groupsize = getattr(options, "a_groupsize", -1)
+        qkv_fp16 = is_fp16_unit(options, self.layer_idx, "self_attn.q_proj")
+        o_fp16 = is_fp16_unit(options, self.layer_idx, "self_attn.o_proj")
+        if not qkv_fp16:
+            self.quantizer = deploy.nn.Quantizer(groupsize=groupsize)
+            self.q_proj = deploy.nn.Linear4bit.from_float(self.q_proj)
+            self.k_proj = deploy.nn.Linear4bit.from_float(self.k_proj)
+            self.v_proj = deploy.nn.Linear4bit.from_float(self.v_proj)
+        if "o_proj" in self.options.online_trans and not o_fp16:
+            self.o_proj_trans = deploy.nn.OnlineTrans(self.num_heads, trans=options.trans, decompose=False,
+                                                      groupsize=groupsize)
+        if o_fp16:
+            self.o_proj = torch.nn.Sequential(self.o_proj)
+        else:
+            self.o_proj = torch.nn.Sequential(
+                deploy.nn.Quantizer(groupsize=groupsize),
+                deploy.nn.Linear4bit.from_float(self.o_proj)
+            )
+        if "qkv_proj" in self.options.online_trans and not qkv_fp16:
             if not self.options.fuseLN:
-                self.inp_trans = deploy.nn.OnlineTrans(self.hidden_size, trans=options.trans)
+                self.inp_trans = deploy.nn.OnlineTrans(self.hidden_size, trans=options.trans, groupsize=groupsize)
 
 
 class FlatQuantLlamaMLP(LlamaMLP):
-    def __init__(self, options, *args, **kwargs):
+    def __init__(self, options, *args, layer_idx=None, **kwargs):
         super().__init__(*args, **kwargs)
         self.options = options
-        self.quantizer = deploy.nn.Quantizer()
-        self.up_proj = deploy.nn.Linear4bit.from_float(self.up_proj)
-        self.gate_proj = deploy.nn.Linear4bit.from_float(self.gate_proj)
-        if "down_proj" in self.options.online_trans:
+        groupsize = getattr(options, "a_groupsize", -1)
+        up_gate_fp16 = is_fp16_unit(options, layer_idx, "mlp.up_proj")
+        if up_gate_fp16:
+            self.quantizer = torch.nn.Identity()
+        else:
+            self.quantizer = deploy.nn.Quantizer(groupsize=groupsize)
+            self.up_proj = deploy.nn.Linear4bit.from_float(self.up_proj)
+            self.gate_proj = deploy.nn.Linear4bit.from_float(self.gate_proj)
+        self.act_trans = None
+        if is_fp16_unit(options, layer_idx, "mlp.down_proj"):
+            self.down_proj = torch.nn.Sequential(self.down_proj)
+        elif "down_proj" in self.options.online_trans and options.trans == "matmul":
+            # silu(gate) * up, the kronecker transform and the quantizer of down_proj in one stage
+            assert self.config.hidden_act == "silu"
+            self.act_trans = deploy.nn.SwiGLUOnlineTrans(self.intermediate_size, groupsize=groupsize)
+            self.down_proj = torch.nn.Sequential(
+                deploy.nn.Linear4bit.from_float(self.down_proj)
+            )
+        elif "down_proj" in self.options.online_trans:
             self.down_proj = torch.nn.Sequential(
-                deploy.nn.OnlineTrans(self.intermediate_size, trans=options.trans),
-                deploy.nn.Quantizer(),
+                deploy.nn.OnlineTrans(self.intermediate_size, trans=options.trans, groupsize=groupsize),
+                deploy.nn.Quantizer(groupsize=groupsize),
                 deploy.nn.Linear4bit.from_float(self.down_proj)
             )
         else:
             self.down_proj = torch.nn.Sequential(
-                deploy.nn.Quantizer(),
+                deploy.nn.Quantizer(groupsize=groupsize),
                 deploy.nn.Linear4bit.from_float(self.down_proj)
             )
-        if "up_gate_proj" in self.options.online_trans:
+        if "up_gate_proj" in self.options.online_trans and not up_gate_fp16:
             if not self.options.fuseLN:
-                self.inp_trans = deploy.nn.OnlineTrans(self.hidden_size, trans=options.trans)
+                self.inp_trans = deploy.nn.OnlineTrans(self.hidden_size, trans=options.trans, groupsize=groupsize)
 
     def forward(self, x):            
         if not self.options.fuseLN and hasattr(self, "inp_trans"):
             x = self.inp_trans(x)
         x = self.quantizer(x)
+        if self.act_trans is not None:
+            return self.down_proj(self.act_trans(self.gate_proj(x), self.up_proj(x)))
         return super().forward(x)
 
 
+def build_fuseLN_norm(args, config, trans_name, fp16=False):
+    # with the kronecker online transform, norm + transform + quantizer of the layer inputs run as one kernel
+    if args.trans == "matmul" and trans_name in args.online_trans and not fp16:
+        return deploy.nn.RMSNormOnlineTrans(config.hidden_size, eps=config.rms_norm_eps,
+                                            groupsize=getattr(args, "a_groupsize", -1))
+    return deploy.nn.RMSNorm(config.hidden_size, eps=config.rms_norm_eps)
+
+
 class FlatQuantFP16LlamaForCausalLM(LlamaForCausalLM):
     def __init__(self, config, args=None):
         super().__init__(config)
@@ -155,6 +207,8 @@ class FlatQuantFP16LlamaForCausalLM(LlamaForCausalLM):
         for layer_idx, layer in enumerate(self.model.layers):
             layer.self_attn = FlatQuantFP16LlamaAttention(config=config, layer_idx=layer_idx)
         self.cache_dtype = "float16"
+        self.kv_groupsize = -1
+        self.kv_clip_ratios = None
         self._expected_max_length = None
         if args is not None:
             self.trans = args.trans
@@ -168,6 +222,21 @@ class FlatQuantFP16LlamaForCausalLM(LlamaForCausalLM):
         model_dim = self.config.hidden_size
         head_dim = model_dim // num_heads
         disable_quant = self.cache_dtype == "float16" 
+        if self.cache_dtype in ("int2", "int3"):
+            return deploy.transformers.MultiLayerPagedKVCacheLowBit(
+                batch_size=batch_size,
+                page_size=page_size, 
+                max_seq_len=max_length, 
+                device=device, 
+                n_layers=len(self.model.layers),
+                num_heads=num_heads,
+                head_dim=head_dim,
+                bits=int(self.cache_dtype[3:]),
+                groupsize=self.kv_groupsize,
+                clip_ratios=self.kv_clip_ratios,
+                trans_dtype=torch.float16,
+                trans=self.trans if "qk" in self.online_trans else "none",
+            )
         return deploy.transformers.MultiLayerPagedKVCache4Bit(
             batch_size=batch_size,
             page_size=page_size, 
@@ -210,7 +279,29 @@ class FlatQuantLlamaForCausalLM(FlatQuantFP16LlamaForCausalLM):
         for layer_idx, layer in enumerate(self.model.layers):
             layer.self_attn = FlatQuantLlamaAttention(options=args, config=config, layer_idx=layer_idx)
             if args.fuseLN:
-                layer.input_layernorm = deploy.nn.RMSNorm(config.hidden_size, eps=config.rms_norm_eps)
-                layer.post_attention_layernorm = deploy.nn.RMSNorm(config.hidden_size, eps=config.rms_norm_eps)
-            layer.mlp = FlatQuantLlamaMLP(options=args, config=config)
-        self.cache_dtype = "int4"
+                layer.input_layernorm = build_fuseLN_norm(
+                    args, config, "qkv_proj", fp16=is_fp16_unit(args, layer_idx, "self_attn.q_proj"))
+                layer.post_attention_layernorm = build_fuseLN_norm(
+                    args, config, "up_gate_proj", fp16=is_fp16_unit(args, layer_idx, "mlp.up_proj"))
+            layer.mlp = FlatQuantLlamaMLP(options=args, config=config, layer_idx=layer_idx)
+        # 2/3-bit caches use the generic bit-packed format, 4-bit keeps the flashinfer kernels
+        assert args.kv_bits in (2, 3, 4), "Only support 2/3/4-bit KV cache"
+        self.cache_dtype = f"int{args.kv_bits}"
+        self.kv_groupsize = args.kv_groupsize
+
+    def load_kv_clip_ratios(self, flat_matrices):
+        # the 2/3-bit caches clip their ranges like the k/v cache quantizers calibrated with --lac
+        self.kv_clip_ratios = deploy.transformers.kv_clip_ratios(flat_matrices, len(self.model.layers))
+
+    def load_act_static_scales(self, flat_matrices, clip_ratio=None):
+        # per-tensor scales of the Quantizers calibrated with --a_static, the kronecker kernels of
+        # trans="matmul" quantize their outputs with their own scales and ignore them
+        scales = deploy.nn.act_static_scales(flat_matrices, len(self.model.layers), clip_ratio)
+        for layer, layer_scales in zip(self.model.layers, scales):
+            quantizers = {"qkv": getattr(layer.self_attn, "quantizer", None), "o": layer.self_attn.o_proj[0],
+                          "up_gate": layer.mlp.quantizer, "down": layer.mlp.down_proj[0]}
+            for unit, quantizer in quantizers.items():
+                if isinstance(quantizer, deploy.nn.Quantizer) and layer_scales[unit] is not None:
+                    device = layer.self_attn.o_proj[-1].weight.device
+                    quantizer.static_scale = torch.tensor(layer_scales[unit], dtype=torch.float16,
+                                                          device=device).reshape(1, 1)
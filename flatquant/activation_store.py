@@ -0,0 +1,60 @@
+import os
+
+import torch
+
+
+class ActivationStore:
+    '''
+    The fp activation chain of the calibration on disk: the inputs of every decoder layer (the fp outputs of the
+    previous one), the attention mask and position ids, and the running maxima of the sq_style diagonal init. It
+    only depends on the model and the calibration samples, so the calibrations of a sweep share it: the first one
+    fills the store, the next ones skip the capture of the inputs and the fp forward of every layer.
+    '''
+    def __init__(self, path):
+        self.path = path
+        os.makedirs(path, exist_ok=True)
+
+    @property
+    def meta_path(self):
+        return os.path.join(self.path, "meta.pth")
+
+    @property
+    def complete(self):
+        # the meta file is written last
+        return os.path.exists(self.meta_path)
+
+    def save_inputs(self, i, inps):
+        torch.save(inps.cpu(), os.path.join(self.path, f"inputs_{i}.pth"))
+
+    def load_inputs(self, i, dev, dtype):
+        return torch.load(os.path.join(self.path, f"inputs_{i}.pth"), mmap=True, weights_only=True).to(dev, dtype)
+
+    def save_smax(self, i, layer):
+        smax = {}
+        for name, module in layer.named_modules():
+            for attr, value in vars(module).items():
+                if attr.endswith("_smax") and isinstance(value, torch.Tensor):
+                    smax[f"{name}.{attr}"] = value.cpu()
+        torch.save(smax, os.path.join(self.path, f"smax_{i}.pth"))
+
+    def load_smax(self, i, layer):
+        smax = torch.load(os.path.join(self.path, f"smax_{i}.pth"), weights_only=True)
+        for name, module in layer.named_modules():
+            for attr, value in list(vars(module).items()):
+                if attr.endswith("_smax") and isinstance(value, torch.Tensor):
+                    if f"{name}.{attr}" not in smax:
+                        raise ValueError(f"The activation store {self.path} was filled without the sq_style diag init.")
+                    setattr(module, attr, smax[f"{name}.{attr}"].to(value.device))
+
+    def save_meta(self, nsamples, attention_mask, position_ids):
+        cpu = lambda x: x.cpu() if x is not None else None
+        torch.save({"nsamples": nsamples, "attention_mask": cpu(attention_mask), "position_ids": cpu(position_ids)},
+                   self.meta_path)
+
+    def load_meta(self, nsamples, dev, dtype):
+        """Inputs of the first layer, attention mask and position ids."""
+        meta = torch.load(self.meta_path, weights_only=True)
+        if meta["nsamples"] != nsamples:
+            raise ValueError(f"The activation store {self.path} holds {meta['nsamples']} samples, not {nsamples}.")
+        to_dev = lambda x: x.to(dev) if x is not None else None
+        return self.load_inputs(0, dev, dtype), to_dev(meta["attention_mask"]), to_dev(meta["position_ids"])
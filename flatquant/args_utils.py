@@ -43,15 +43,32 @@ def parser_gen():
                         help='Model to load.', choices=supported_models)
     parser.add_argument('--seed', type=int, default=0, help='Random seed for HuggingFace and PyTorch.')
     parser.add_argument('--hf_token', type=str, default=None, help='HuggingFace token for model access.')
+    parser.add_argument('--lazy_load', action="store_true", default=False,
+                        help='''Build the model on the meta device and load each decoder layer from the safetensors shards when it is
+                                calibrated. The calibrated layers are written to <exp_dir>/lazy_layers and released, and are folded
+                                and weight-quantized one at a time as well, so that the whole run needs host memory for one layer.
+                                The model is not evaluated.''')
+    parser.add_argument('--attn_impl', type=str, default="sdpa", choices=["sdpa", "eager"],
+                        help='''Attention of the calibration and evaluation forwards. sdpa runs the fused kernels of
+                                scaled_dot_product_attention on the quantized queries/keys/values, without materializing the
+                                attention weights; eager reproduces the matmul + softmax attention.''')
 
     # Activation Quantization Arguments
     parser.add_argument('--a_bits', type=int, default=16,
                         help='''Number of bits for inputs of the linear layers.
                                 This applies to all linear layers in the model, including down-projection and out-projection.''')
     parser.add_argument('--a_groupsize', type=int, default=-1, 
-                        help='Groupsize for activation quantization. Note that this should be the same as w_groupsize.')
+                        help='''Groupsize for activation quantization. -1 means per-token quantization.
+                                Note that this should be the same as w_groupsize.''')
     parser.add_argument('--a_asym', action="store_true", default=False,
                         help='Use asymmetric activation quantization.')
+    parser.add_argument('--a_static', action="store_true", default=False,
+                        help='''Quantize the inputs of the linear layers with per-tensor ranges collected after the calibration of
+                                each layer instead of per-token ranges computed at runtime. Saved in flat_matrices.pth.''')
+    parser.add_argument('--a_static_percentile', type=float, default=1.0,
+                        help='Quantile of the per-token maxima (minima) of a batch used as its static range, 1 for the maximum.')
+    parser.add_argument('--a_static_momentum', type=float, default=0.9,
+                        help='Momentum of the EMA of the static ranges over the calibration batches.')
 
     # Weight Quantization Arguments
     parser.add_argument('--w_bits', type=int, default=16, 
@@ -94,13 +111,55 @@ def parser_gen():
                         help='Save the matrix-style parameters of FlatQuant.')
     parser.add_argument('--reload_matrix', action="store_true", default=False, 
                         help='Reload matrices and the inverse matrices for evaluation.')
+    parser.add_argument('--export_int4', action="store_true", default=False,
+                        help='Save the packed int4 weights and scales for the flatquant_int4 quantization of vLLM.')
     parser.add_argument('--matrix_path', type=str, default=None,
                         help='Path to the pre-trained matrix-style parameters of FlatQuant.')
+    parser.add_argument('--rep_workers', type=int, default=4,
+                        help='Number of threads folding the decoder layers concurrently in the reparameterization.')
+    parser.add_argument('--rep_chunk_size', type=int, default=4096,
+                        help='Number of output channels of a weight folded at a time in float64, bounding the peak memory of the reparameterization.')
+    parser.add_argument('--rep_device', type=str, default=None,
+                        help='Device to fold the layers on (e.g. cuda), the layers are moved back afterwards. Default: where the layers are.')
     parser.add_argument("--diag_init", type=str, default="sq_style", choices=["sq_style", "one_style"], 
                         help='The way to initialize per-channel scaling. Default is SmoothQuant style.')
     parser.add_argument("--diag_alpha", type=float, default=0.3, 
                         help='Hyperparameter for the SmoothQuant style initialization of per-channel scaling.')
     parser.add_argument("--warmup", default=False, action="store_true", help="Warm up the learning rate during training.")
+    parser.add_argument("--adaptive_epochs", default=False, action="store_true",
+                        help="Stop the calibration of a layer once its MSE plateaus and give the saved epochs to the layers with a high error.")
+    parser.add_argument("--epoch_budget", type=int, default=None,
+                        help="Total number of epochs over all layers with --adaptive_epochs, epochs * num_layers by default.")
+    parser.add_argument("--min_epochs", type=int, default=3, help="Minimum number of epochs per layer with --adaptive_epochs.")
+    parser.add_argument("--max_epochs", type=int, default=None,
+                        help="Maximum number of epochs per layer with --adaptive_epochs, 2 * epochs by default.")
+    parser.add_argument("--plateau_patience", type=int, default=2,
+                        help="Number of epochs without improvement after which the MSE of a layer has plateaued.")
+    parser.add_argument("--plateau_tol", type=float, default=1e-2,
+                        help="Minimum relative decrease of the MSE of a layer counted as an improvement.")
+    parser.add_argument("--bit_budget", type=float, default=None,
+                        help='''Average number of bits per weight of the linear layers. Measures the sensitivity of every projection
+                                during the calibration and allocates their bits (--bit_candidates) under this budget.''')
+    parser.add_argument("--bit_candidates", type=int, nargs="+", default=[3, 4, 16],
+                        help="Weight bits the projections can be allocated with --bit_budget, 16 keeps a projection unquantized.")
+    parser.add_argument("--sensitivity_samples", type=int, default=32,
+                        help="Number of calibration samples the sensitivity of each projection is measured on.")
+    parser.add_argument("--bit_config", type=str, default=None,
+                        help="Per-module bits (bit_config.json saved with --bit_budget) applied instead of the global w_bits/a_bits.")
+    parser.add_argument("--compile", default=False, action="store_true",
+                        help="torch.compile the layers during the calibration, falling back to eager mode if compiling fails.")
+    parser.add_argument("--cali_profile", default=False, action="store_true",
+                        help="Profile the calibration: per layer and step timings and peak memory, saved as a Chrome trace and a summary.")
+    parser.add_argument("--activation_store", type=str, default=None,
+                        help='''Directory of the fp activations of the calibration (layer inputs and targets), filled by the first
+                                calibration on the samples and reused by the next ones.''')
+    parser.add_argument("--sweep", type=str, nargs="+", default=None,
+                        help='''Grid of calibration configs for sweep.py, e.g. flat_lr=1e-5,5e-5 diag_alpha=0.3,0.5. The configs share
+                                the activation store (<exp_dir>/activation_store by default).''')
+    parser.add_argument("--sweep_devices", type=str, nargs="+", default=None,
+                        help="Devices the configs of sweep.py run on in parallel, one process per device (the default device otherwise).")
+    parser.add_argument("--sweep_eval", default=False, action="store_true",
+                        help="Evaluate the wikitext2 perplexity of every config of sweep.py, not only the calibration MSE.")
     parser.add_argument("--deactive_amp", default=False, action="store_true", help="Disable AMP training.")
     parser.add_argument("--direct_inv", default=False, action="store_true", 
                         help="Use the inverse method in PyTorch to directly get the inverse matrix rather than SVD.")
@@ -113,7 +172,8 @@ def parser_gen():
                         Note that quantizing the queries needs another rotation for the keys/queries.''')
     parser.add_argument('--q_asym', action="store_true", default=False, 
                         help='Use asymmetric quantization for queries.')
-    parser.add_argument('--q_groupsize', type=int, default=-1)
+    parser.add_argument('--q_groupsize', type=int, default=-1, 
+                    help='Groupsize for queries quantization.')
 
     parser.add_argument('--k_bits', type=int, default=16,
                         help='''Number of bits for K-cache quantization.
@@ -127,7 +187,8 @@ def parser_gen():
                         help='Number of bits for V-cache quantization.')
     parser.add_argument('--v_asym', action="store_true", default=False,
                         help='Use asymmetric quantization for V-cache.')
-    parser.add_argument('--v_groupsize', type=int, default=-1)
+    parser.add_argument('--v_groupsize', type=int, default=-1, 
+                    help='Groupsize for V-cache quantization.')
     
     # Experiments Arguments
     parser.add_argument("--output_dir", type=str, default="./outputs", help="Output directory path.")
@@ -147,11 +208,18 @@ def parser_gen():
         help="Distribute the model across multiple GPUs for evaluation.")
 
     args = parser.parse_args()
-    if args.a_groupsize > -1:
-        raise NotImplementedError
+    for groupsize in [args.a_groupsize, args.q_groupsize, args.k_groupsize, args.v_groupsize]:
+        if groupsize == 0 or groupsize < -1:
+            raise ValueError(f"Groupsize should be -1 (per-token) or a positive integer, but got {groupsize}.")
+    if args.bit_budget is not None and not (args.cali_trans or args.add_diag or args.lwc or args.lac):
+        raise ValueError("--bit_budget measures the sensitivity during the calibration, which is disabled.")
+    if not 0 < args.a_static_percentile <= 1:
+        raise ValueError(f"a_static_percentile should be in (0, 1], but got {args.a_static_percentile}.")
     
     os.environ["TOKENIZERS_PARALLELISM"] = "false"
     args.quantize = (args.w_bits < 16) or (args.a_bits < 16) or (args.q_bits < 16) or (args.k_bits < 16) or (args.v_bits < 16)
+    if args.lazy_load and not args.quantize:
+        raise ValueError("--lazy_load streams the layers of the calibration, but nothing is quantized.")
     # cache path
     args.cache_dir = os.path.join(args.output_dir, ".cache")
     os.makedirs(args.cache_dir, exist_ok=True)
@@ -0,0 +1,177 @@
+import json
+import os
+
+import torch
+import torch.distributed as dist
+
+from flatquant.flat_linear import FlatQuantizedLinear
+from flatquant.quant_utils import get_qmin_qmax
+
+
+# groups of projections with one input (and one activation quantizer), fused into one GEMM by vLLM and deploy,
+# so they get the same bits
+UNITS = {
+    "qkv": ["self_attn.q_proj", "self_attn.k_proj", "self_attn.v_proj"],
+    "o": ["self_attn.o_proj"],
+    "up_gate": ["mlp.up_proj", "mlp.gate_proj"],
+    "down": ["mlp.down_proj"],
+}
+
+
+def unit_a_bits(w_bits, a_bits):
+    """A unit kept in 16 bits is not quantized at all, the others quantize their inputs to the global a_bits."""
+    return 16 if w_bits == 16 else a_bits
+
+
+def layer_units(layer):
+    modules = dict(layer.named_modules())
+    units = {}
+    for unit, names in UNITS.items():
+        linears = [modules[name] for name in names if isinstance(modules.get(name), FlatQuantizedLinear)]
+        if linears:
+            units[unit] = linears
+    return units
+
+
+def set_linear_bits(linear, w_bits, a_bits):
+    wq = linear.weight_quantizer
+    wq.configure(w_bits, perchannel=wq.perchannel, sym=wq.sym, mse=wq.mse)
+    aq = linear.act_quantizer
+    aq.bits = a_bits
+    if a_bits < 16:
+        aq.q_max, aq.q_min = get_qmin_qmax(a_bits, aq.sym)
+
+
+@torch.no_grad()
+def measure_layer_sensitivity(layer, inps, outs, loss_func, candidates, a_bits, bsz, nbatches, **forward_kwargs):
+    """
+    Sensitivity of the projections of a calibrated layer to their bits: the MSE of the layer output (the loss
+    of the calibration) with one unit at each candidate bits and the rest of the layer as it is configured.
+    Returns {unit: {"params": number of weights, "mse": {bits: mse}}}.
+    """
+    def layer_mse():
+        mse = 0.
+        for j in range(nbatches):
+            index = j * bsz
+            quant_out = layer(inps[index:index+bsz,], **forward_kwargs)[0]
+            mse += loss_func(outs[index:index+bsz,], quant_out).item()
+        return mse / nbatches
+
+    base = layer_mse()
+    sensitivity = {}
+    for unit, linears in layer_units(layer).items():
+        mse = {}
+        configured = [(linear.weight_quantizer.bits, linear.act_quantizer.bits) for linear in linears]
+        for bits in candidates:
+            if all(config == (bits, unit_a_bits(bits, a_bits)) for config in configured):
+                mse[bits] = base
+                continue
+            for linear in linears:
+                set_linear_bits(linear, bits, unit_a_bits(bits, a_bits))
+            mse[bits] = layer_mse()
+            for linear, config in zip(linears, configured):
+                set_linear_bits(linear, *config)
+        params = sum(linear.linear.weight.numel() for linear in linears)
+        sensitivity[unit] = {"params": params, "mse": mse}
+    return sensitivity
+
+
+def plan_bits(sensitivity, budget):
+    """
+    Bits of every unit minimizing the sum of their MSEs under an average number of bits per weight of `budget`,
+    for sensitivity = {key: {"params": n, "mse": {bits: mse}}}. Greedy multiple-choice knapsack: starts from the
+    fewest bits of every unit and upgrades the unit with the largest MSE reduction per extra bit of memory
+    while the budget allows.
+    """
+    total = sum(s["params"] for s in sensitivity.values())
+    bits = {key: min(s["mse"]) for key, s in sensitivity.items()}
+    spent = sum(bits[key] * s["params"] for key, s in sensitivity.items())
+    if spent > budget * total:
+        raise ValueError(f"The budget of {budget} bits is below the minimum of {spent / total:.3f} bits.")
+    while True:
+        best = None
+        for key, s in sensitivity.items():
+            for option, mse in s["mse"].items():
+                cost = (option - bits[key]) * s["params"]
+                gain = s["mse"][bits[key]] - mse
+                if cost <= 0 or gain <= 0 or spent + cost > budget * total:
+                    continue
+                if best is None or gain / cost > best[0]:
+                    best = (gain / cost, key, option, cost)
+        if best is None:
+            return bits
+        _, key, option, cost = best
+        bits[key] = option
+        spent += cost
+
+
+def average_bits(sensitivity, bits):
+    total = sum(s["params"] for s in sensitivity.values())
+    return sum(bits[key] * s["params"] for key, s in sensitivity.items()) / total
+
+
+def build_bit_config(sensitivity, bits, a_bits, budget=None):
+    """The per-module config of a plan: {"modules": {"model.layers.{i}.{projection}": {"w_bits", "a_bits"}}}."""
+    modules = {}
+    for key, unit_bits in bits.items():
+        layer, unit = key.rsplit(".", 1)
+        for name in UNITS[unit]:
+            modules[f"model.{layer}.{name}"] = {"w_bits": unit_bits, "a_bits": unit_a_bits(unit_bits, a_bits)}
+    return {"budget": budget, "average_bits": average_bits(sensitivity, bits), "modules": modules}
+
+
+def save_bit_config(path, bit_config):
+    with open(path, "w") as f:
+        json.dump(bit_config, f, indent=2)
+
+
+def load_bit_config(path):
+    with open(path) as f:
+        return json.load(f)
+
+
+def module_bits(bit_config, name, w_bits, a_bits):
+    """(w_bits, a_bits) of the module `name` (e.g. model.layers.3.mlp.down_proj), the global ones if not planned."""
+    if bit_config is None:
+        return w_bits, a_bits
+    config = bit_config["modules"].get(name.replace(".linear", ""))
+    if config is None:
+        return w_bits, a_bits
+    return config["w_bits"], config["a_bits"]
+
+
+def apply_bit_config(model, bit_config, w_bits, a_bits):
+    """Configures the quantizers of the FlatQuantizedLinear layers of model with the plan."""
+    for i, layer in enumerate(model.model.layers):
+        modules = dict(layer.named_modules())
+        for names in UNITS.values():
+            for name in names:
+                if isinstance(modules.get(name), FlatQuantizedLinear):
+                    set_linear_bits(modules[name], *module_bits(bit_config, f"model.layers.{i}.{name}", w_bits, a_bits))
+    return model
+
+
+def plan_from_calibration(args, logger=None, group=None):
+    """
+    Plans the bits for args.bit_budget from the sensitivities saved by cali_flat_quant, saves the config. With
+    the process group of a sharded calibration, rank 0 plans from the bit_sensitivity.json it wrote and saves
+    the config, and broadcasts it to the other ranks, which may not see the file.
+    """
+    if group is not None and dist.get_rank(group) != 0:
+        bit_config = [None]
+        dist.broadcast_object_list(bit_config, src=0, group=group)
+        return bit_config[0]
+    with open(os.path.join(args.exp_dir, "bit_sensitivity.json")) as f:
+        sensitivity = {key: {"params": s["params"], "mse": {int(b): mse for b, mse in s["mse"].items()}}
+                       for key, s in json.load(f).items()}
+    bits = plan_bits(sensitivity, args.bit_budget)
+    bit_config = build_bit_config(sensitivity, bits, args.a_bits, budget=args.bit_budget)
+    path = os.path.join(args.exp_dir, "bit_config.json")
+    save_bit_config(path, bit_config)
+    if logger is not None:
+        counts = {b: list(bits.values()).count(b) for b in sorted(set(bits.values()))}
+        logger.info(f"planned {bit_config['average_bits']:.3f} bits per weight for a budget of {args.bit_budget}, "
+                    f"units per bits {counts}, saved at {path}")
+    if group is not None:
+        dist.broadcast_object_list([bit_config], src=0, group=group)
+    return bit_config
@@ -0,0 +1,65 @@
+import torch
+import torch.distributed as dist
+from torch._utils import _flatten_dense_tensors, _unflatten_dense_tensors
+
+
+def get_group():
+    """The process group the calibration samples are sharded over, None without one or with a single rank."""
+    if dist.is_available() and dist.is_initialized() and dist.get_world_size() > 1:
+        return dist.group.WORLD
+    return None
+
+
+def shard_sample_ids(nsamples, cali_bsz, rank, world_size):
+    '''
+    Calibration samples of a rank: every mini-batch of cali_bsz samples is split into world_size contiguous parts
+    of cali_bsz // world_size samples, so that the gradients averaged over the ranks are those of the mini-batch.
+    '''
+    if cali_bsz % world_size != 0:
+        raise ValueError(f"cali_bsz ({cali_bsz}) should be a multiple of the number of ranks ({world_size}).")
+    local_bsz = cali_bsz // world_size
+    return [i for i in range(nsamples) if (i % cali_bsz) // local_bsz == rank]
+
+
+def all_reduce_mean(value, group, device):
+    """Mean of a float or tensor over the ranks, on device for the backends without CPU tensors (nccl)."""
+    tensor = torch.as_tensor(value, dtype=torch.float64, device=device).clone()
+    dist.all_reduce(tensor, group=group)
+    tensor /= dist.get_world_size(group)
+    return tensor.item() if tensor.dim() == 0 else tensor
+
+
+def all_reduce_gradients(params, group):
+    """Averages the gradients over the ranks, in one all-reduce per dtype and device."""
+    world_size = dist.get_world_size(group)
+    buckets = {}
+    for param in params:
+        if param.grad is not None:
+            buckets.setdefault((param.grad.dtype, param.grad.device), []).append(param.grad)
+    for grads in buckets.values():
+        flat = _flatten_dense_tensors(grads)
+        dist.all_reduce(flat, group=group)
+        flat /= world_size
+        for grad, reduced in zip(grads, _unflatten_dense_tensors(flat, grads)):
+            grad.copy_(reduced)
+
+
+def broadcast_parameters(params, group, src=0):
+    for param in params:
+        dist.broadcast(param.data, src=src, group=group)
+
+
+def all_reduce_running_maxima(layer, group):
+    # the running maxima of the sq_style diagonal init, over the samples of all the ranks
+    for module in layer.modules():
+        for attr, value in vars(module).items():
+            if attr.endswith("_smax") and isinstance(value, torch.Tensor):
+                dist.all_reduce(value, op=dist.ReduceOp.MAX, group=group)
+
+
+def all_reduce_static_ranges(layer, group):
+    world_size = dist.get_world_size(group)
+    for name, param in layer.named_parameters():
+        if name.endswith("static_xmax") or name.endswith("static_xmin"):
+            dist.all_reduce(param.data, group=group)
+            param.data /= world_size
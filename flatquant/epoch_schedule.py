@@ -0,0 +1,83 @@
+import math
+import statistics
+
+
+class MSEPlateau:
+    """
+    Detects the plateau of the per-epoch MSE of a layer: the layer has converged once the best MSE has
+    not improved by more than `rel_tol` (relative) for `patience` epochs, and at least `min_epochs`
+    epochs have been run.
+    """
+    def __init__(self, patience=2, rel_tol=1e-2, min_epochs=3):
+        self.patience = patience
+        self.rel_tol = rel_tol
+        self.min_epochs = min_epochs
+        self.best = math.inf
+        self.bad_epochs = 0
+        self.epochs = 0
+
+    def step(self, mse):
+        self.epochs += 1
+        if mse < self.best * (1 - self.rel_tol):
+            self.bad_epochs = 0
+        else:
+            self.bad_epochs += 1
+        self.best = min(self.best, mse)
+        return self.converged()
+
+    def converged(self):
+        return self.epochs >= self.min_epochs and self.bad_epochs >= self.patience
+
+
+class EpochBudget:
+    """
+    Distributes a total budget of epochs over the layers, which are calibrated one after the other.
+
+    Every layer is planned `epochs` epochs, as with the fixed schedule, and stops early once its MSE
+    plateaus. The epochs saved this way go to a pool, from which a layer whose relative error after its
+    first epoch is above the median of the previous layers gets up to `max_epochs` epochs. The budget is
+    never exceeded: a layer is only granted epochs beyond `min_epochs` for each of the following layers.
+    """
+    def __init__(self, num_layers, epochs, total=None, min_epochs=3, max_epochs=None):
+        self.num_layers = num_layers
+        self.epochs = epochs
+        self.total = total if total is not None else epochs * num_layers
+        self.min_epochs = min(min_epochs, epochs)
+        self.max_epochs = max_epochs if max_epochs is not None else 2 * epochs
+        self.used = {}
+        self.first_errors = []
+
+    @property
+    def spent(self):
+        return sum(self.used.values())
+
+    def _available(self, layer_idx):
+        remaining_layers = self.num_layers - layer_idx - 1
+        return self.total - self.spent - self.min_epochs * remaining_layers
+
+    def pool(self, layer_idx):
+        """Epochs saved by the previous layers, on top of `epochs` for this and the following layers."""
+        return max(0, self.total - self.spent - self.epochs * (self.num_layers - layer_idx))
+
+    def plan(self, layer_idx):
+        return max(1, min(self.epochs, self.max_epochs, self._available(layer_idx)))
+
+    def extend(self, layer_idx, planned, first_error):
+        """Returns the new number of epochs of a layer given its relative error after the first epoch."""
+        high_error = len(self.first_errors) > 0 and first_error > statistics.median(self.first_errors)
+        self.first_errors.append(first_error)
+        if not high_error:
+            return planned
+        extra = min(self.pool(layer_idx), self.max_epochs - planned, self._available(layer_idx) - planned)
+        return planned + max(0, extra)
+
+    def finish(self, layer_idx, epochs_used):
+        self.used[layer_idx] = epochs_used
+
+
+def set_cosine_horizon(scheduler, total_steps):
+    """
+    Changes the number of steps of a running CosineAnnealingLR. Its recursive form continues from the
+    current learning rate, so the learning rate stays continuous and reaches eta_min after total_steps.
+    """
+    scheduler.T_max = max(total_steps, scheduler.last_epoch + 1)
@@ -13,7 +13,8 @@ class FlatQuantizedLinear(nn.Module):
 
         self.weight_quantizer = WeightQuantizer()
         self.weight_quantizer.configure(args.w_bits, perchannel=True, sym=not(args.w_asym), mse=False)
-        self.act_quantizer = ActivationQuantizer(bits=args.a_bits, sym=not(args.a_asym), lac=args.lac, groupsize=args.a_groupsize, )
+        self.act_quantizer = ActivationQuantizer(bits=args.a_bits, sym=not(args.a_asym), lac=args.lac, groupsize=args.a_groupsize,
+                                                 static=getattr(args, "a_static", False))
 
         self.lwc = args.lwc
         if self.lwc:
@@ -25,10 +26,10 @@ class FlatQuantizedLinear(nn.Module):
 
         self._eval_mode = False
 
-    def apply_wclip(self, weight):
+    def apply_wclip(self, weight, rows=slice(None)):
         wmin, wmax = weight.min(1, keepdim=True)[0], weight.max(1, keepdim=True)[0]
-        wmax *= self.sigmoid(self.clip_factor_w_max)
-        wmin *= self.sigmoid(self.clip_factor_w_min)
+        wmax *= self.sigmoid(self.clip_factor_w_max[rows])
+        wmin *= self.sigmoid(self.clip_factor_w_min[rows])
         weight = torch.clamp(weight, min=wmin, max=wmax)
         return weight
 
@@ -54,8 +55,7 @@ class FlatQuantizedLinear(nn.Module):
             weight = out_trans(weight.T).T
         
         # quantize weight
-        self.weight_quantizer.find_params(weight)
-        weight = self.weight_quantizer(weight)
+        weight = self.weight_quantizer.fake_quant(weight)
         # quantize activation
         hidden_states = self.act_quantizer(hidden_states)
 
@@ -79,20 +79,36 @@ class FlatQuantizedLinear(nn.Module):
         output = self.linear(hidden_states)
         return output
 
-    def reparameterize(self, qa_trans=None, out_trans=None):
-        weight = self.linear.weight.data
-        ori_dtype = weight.dtype
+    def fold_weight(self, weight, qa_trans=None, out_trans=None, rows=slice(None)):
         weight = weight.to(torch.float64)
         # quantization-adaptive transform
         if qa_trans is not None:
             weight = self.apply_trans(weight, qa_trans)
         if self.lwc:
-            weight = self.apply_wclip(weight)
+            weight = self.apply_wclip(weight, rows)
         if out_trans is not None:
             weight = out_trans(weight.T).T
+        return weight
+
+    def reparameterize(self, qa_trans=None, out_trans=None):
+        weight = self.linear.weight.data
+        ori_dtype = weight.dtype
+        # the float64 copies are bounded to rep_chunk_size output channels at a time
+        chunk_size = getattr(self.args, "rep_chunk_size", None)
+        if chunk_size is None or chunk_size >= weight.shape[0]:
+            folded = self.fold_weight(weight, qa_trans, out_trans).to(ori_dtype)
+        else:
+            if out_trans is not None:
+                # out_trans mixes the output channels of a head
+                head_dim = out_trans.get_matrix().shape[0]
+                chunk_size = max(chunk_size // head_dim, 1) * head_dim
+            folded = torch.empty_like(weight)
+            for start in range(0, weight.shape[0], chunk_size):
+                rows = slice(start, start + chunk_size)
+                folded[rows] = self.fold_weight(weight[rows], qa_trans, out_trans, rows).to(ori_dtype)
         if out_trans is not None and self.linear.bias is not None:
             self.linear.bias.data = out_trans(self.linear.bias.data)
         
-        self.linear.weight.data = weight.to(ori_dtype)
+        self.linear.weight.data = folded
         self._eval_mode = True
 
@@ -1,6 +1,8 @@
 import os
 import torch
+from concurrent.futures import ThreadPoolExecutor
 from flatquant.function_utils import get_paras_dict_by_name
+from flatquant.quant_utils import set_static_act_quantizer_state
 import logging
 
 def kronecker_matmul(x, hadL, hadR):
@@ -27,16 +29,44 @@ def reparameterize_ln(ln, trans):
     trans.use_diag = False
 
 
-def reparameterize_model(model):
-    for idx in range(model.config.num_hidden_layers):
-        layer = model.model.layers[idx]
-        layer.self_attn.reparameterize()
-        layer.mlp.reparameterize()
-        # fuse per-channel scaling to layernorm
-        if layer.self_attn.ln_trans is not None and layer.self_attn.ln_trans.add_diag:
-            reparameterize_ln(layer.input_layernorm, layer.self_attn.ln_trans)
-        if layer.mlp.up_gate_trans is not None and layer.mlp.up_gate_trans.add_diag:
-            reparameterize_ln(layer.post_attention_layernorm, layer.mlp.up_gate_trans)
+def reparameterize_layer(layer, device=None):
+    # with device, the folding runs there and the layer is moved back to where it was
+    ori_device = next(layer.parameters()).device
+    if device is not None:
+        layer.to(device)
+    layer.self_attn.reparameterize()
+    layer.mlp.reparameterize()
+    # fuse per-channel scaling to layernorm
+    if layer.self_attn.ln_trans is not None and layer.self_attn.ln_trans.add_diag:
+        reparameterize_ln(layer.input_layernorm, layer.self_attn.ln_trans)
+    if layer.mlp.up_gate_trans is not None and layer.mlp.up_gate_trans.add_diag:
+        reparameterize_ln(layer.post_attention_layernorm, layer.mlp.up_gate_trans)
+    if device is not None:
+        layer.to(ori_device)
+    return layer
+
+
+def reparameterize_model(model, num_workers=1, device=None):
+    """
+    Folds the transforms and clipping factors of every decoder layer into its weights. The layers are independent,
+    with num_workers > 1 they are folded concurrently by a thread pool (the float64 matmuls release the GIL).
+    """
+    layers = [model.model.layers[idx] for idx in range(model.config.num_hidden_layers)]
+    lazy_loader = getattr(model, "lazy_loader", None)
+    if lazy_loader is not None:
+        # one layer in host memory at a time, the folded layer replaces its offloaded copy
+        for i, layer in enumerate(layers):
+            lazy_loader.materialize(layer, i)
+            reparameterize_layer(layer, device)
+            lazy_loader.release(layer, i)
+        return model
+    if num_workers <= 1:
+        for layer in layers:
+            reparameterize_layer(layer, device)
+        return model
+    with ThreadPoolExecutor(max_workers=num_workers) as pool:
+        # list() re-raises the exception of a failed layer
+        list(pool.map(lambda layer: reparameterize_layer(layer, device), layers))
     return model
 
 
@@ -59,17 +89,25 @@ def load_flat_parameters(args, model, path=None):
     for i in range(len(flat_parameters.keys())):
         flat_param = flat_parameters[i]
         layers[i].load_state_dict(flat_param, strict=False)
+        if any("static_x" in name for name in flat_param):
+            set_static_act_quantizer_state(layers[i])
     return model
 
 
 def save_flat_matrices(args, model, rank=None):
     flat_matrices = {}
+    lazy_loader = getattr(model, "lazy_loader", None)
     for i in range(len(model.model.layers)):
         layer = model.model.layers[i]
+        if lazy_loader is not None:
+            lazy_loader.materialize(layer, i)
         layer.self_attn.rep_matrix_only()
         layer.mlp.rep_matrix_only()
-        paras_name = ["trans.matrix", "trans.diag_scale", "clip_factor_w", "clip_factor_a"]
+        paras_name = ["trans.matrix", "trans.diag_scale", "clip_factor_w", "clip_factor_a", "static_x"]
         flat_matrices[i] = get_paras_dict_by_name(layer, required_names=paras_name)
+        if lazy_loader is not None:
+            # the offloaded copy is rewritten with the matrices in eval mode
+            lazy_loader.release(layer, i)
     if rank is not None:
         matrices_path = os.path.join(args.exp_dir, f"flat_matrices_{rank}.pth")
     else:
@@ -78,6 +116,70 @@ def save_flat_matrices(args, model, rank=None):
     logging.info("saved paramaters at {}".format(matrices_path))
 
 
+def pack_i4(q):
+    """Two int4 values per uint8 along the last dim, the layout of deploy.functional.pack_i4."""
+    q = (q.to(torch.int8) & 0x0F).to(torch.uint8)
+    return q[..., 0::2] | (q[..., 1::2] << 4)
+
+
+def save_int4_checkpoint(args, model, quantizers, path=None, bit_config=None):
+    """
+    Saves the weight-quantized model for the flatquant_int4 quantization of vLLM: the int4 codes of the
+    quantized linear layers packed along the input dim with their per-channel scales, the other weights as
+    they are, and the config with the quantization_config. The transforms and clipping factors are loaded
+    by vLLM from flat_matrices.pth (--save_matrix).
+    With the per-module bits of bit_config (--bit_budget/--bit_config), the 2/3-bit weights are packed on
+    the int4 grid, and the units at 16 bits are saved as they are and listed in quantization_config["modules"],
+    which flatquant_int4 keeps unquantized.
+    """
+    from safetensors.torch import save_file
+    from flatquant.bit_allocation import module_bits
+    assert not args.w_asym and args.w_groupsize == -1, \
+        "only symmetric per-channel weights can be exported to int4"
+    modules = {}
+    for i, layer in enumerate(model.model.layers):
+        for name, module in layer.named_modules():
+            if not isinstance(module, torch.nn.Linear):
+                continue
+            name = f"model.layers.{i}.{name}".replace(".linear", "")
+            w_bits, a_bits = module_bits(bit_config, name, args.w_bits, args.a_bits)
+            if (w_bits, a_bits) != (16, 16) and (w_bits not in (2, 3, 4) or a_bits != 4):
+                raise ValueError(f"{name} has {w_bits}-bit weights and {a_bits}-bit activations, only 2/3/4-bit "
+                                 f"weights with 4-bit activations or unquantized layers can be exported to int4.")
+            assert (w_bits == 16) != (name in quantizers or f"{name}.linear" in quantizers)
+            modules[name] = {"w_bits": w_bits, "a_bits": a_bits}
+    path = os.path.join(args.exp_dir, "int4_checkpoint") if path is None else path
+    os.makedirs(path, exist_ok=True)
+    model_state = model.state_dict()
+    lazy_loader = getattr(model, "lazy_loader", None)
+    if lazy_loader is not None:
+        # the tensors of a released layer stay memory-mapped from its offloaded copy
+        for i, layer in enumerate(model.model.layers):
+            lazy_loader.materialize(layer, i)
+            model_state.update(layer.state_dict(prefix=f"model.layers.{i}."))
+            lazy_loader.release(layer, i, save=False)
+    state_dict = {}
+    for name, param in model_state.items():
+        # transforms and clipping factors are in flat_matrices.pth, the quantizer buffers are not needed
+        if "_trans." in name or "quantizer" in name or "clip_factor" in name:
+            continue
+        if name == "lm_head.weight" and model.config.tie_word_embeddings:
+            continue
+        state_dict[name.replace(".linear.", ".")] = param
+    for name, quantizer in quantizers.items():
+        name = name.replace(".linear", "")
+        weight = state_dict[f"{name}.weight"]
+        scale = quantizer.scale.reshape(-1, 1).to(weight.device, torch.float32)
+        state_dict[f"{name}.weight"] = pack_i4(torch.clamp(torch.round(weight.float() / scale), -8, 7))
+        state_dict[f"{name}.weight_scales"] = scale.to(torch.float16)
+    save_file({name: param.contiguous().cpu() for name, param in state_dict.items()}, os.path.join(path, "model.safetensors"))
+    model.config.quantization_config = {"quant_method": "flatquant_int4"}
+    if bit_config is not None:
+        model.config.quantization_config["modules"] = modules
+    model.config.save_pretrained(path)
+    logging.info("saved int4 checkpoint at {}".format(path))
+
+
 def load_flat_matrices(args, model, path=None):
     if path is None:
         flat_parameters = torch.load(os.path.join(args.exp_dir, f"flat_matrices.pth"))
@@ -90,6 +192,8 @@ def load_flat_matrices(args, model, path=None):
         layers[i].self_attn.rep_matrix_only()
         layers[i].mlp.rep_matrix_only()
         layers[i].load_state_dict(flat_param, strict=False)
+        if any("static_x" in name for name in flat_param):
+            set_static_act_quantizer_state(layers[i])
     return model
 
 
@@ -17,25 +17,59 @@ import flatquant.hadamard_utils as hadamard_utils
 import flatquant.quant_utils as quant_utils
 
 
+# histogram bins of |x| per channel, one bin per power of two in [2^HIST_MIN_EXP, 2^HIST_MAX_EXP),
+# values outside are counted in the first / last bin
+HIST_MIN_EXP, HIST_MAX_EXP = -16, 16
+
+
+def init_act_stats(hidden_dim, device):
+    return {
+        "count": 0,
+        "sumsq": torch.zeros(hidden_dim, dtype=torch.float64, device=device),
+        "maxabs": torch.zeros(hidden_dim, dtype=torch.float32, device=device),
+        "hist": torch.zeros((hidden_dim, HIST_MAX_EXP - HIST_MIN_EXP), dtype=torch.int32, device=device),
+    }
+
+
+def update_act_stats(stats, x):
+    """Accumulates the per-channel statistics of a [..., hidden_dim] activation on its device."""
+    hidden_dim = x.shape[-1]
+    x = x.reshape(-1, hidden_dim).float()
+    x_abs = x.abs()
+    stats["count"] += x.shape[0]
+    stats["sumsq"] += x.square().sum(dim=0, dtype=torch.float64)
+    torch.maximum(stats["maxabs"], x_abs.amax(dim=0), out=stats["maxabs"])
+    num_bins = stats["hist"].shape[1]
+    bins = torch.log2(x_abs).floor_().clamp_(HIST_MIN_EXP, HIST_MAX_EXP - 1).long() - HIST_MIN_EXP
+    bins += torch.arange(hidden_dim, device=x.device) * num_bins
+    stats["hist"] += torch.bincount(bins.flatten(), minlength=hidden_dim * num_bins).view(hidden_dim, num_bins).to(torch.int32)
+
+
 @torch.no_grad()
-def get_act_stats(model, dataset):
+def get_act_stats(model, dataset, act_transform=None, num_batches=None):
+    """
+    Streams the calibration set through the model and collects per-channel statistics of the input of
+    every nn.Linear: number of tokens, sum of squares, max-abs and a log2 histogram of |x|. The statistics
+    are accumulated on the device of the layer, so the memory is O(hidden_dim) per layer for any number of
+    batches. act_transform, if given, is applied to the inputs before accumulation.
+    """
     model.eval()
     device = next(model.parameters()).device
 
     # activations
-    inps = {}
+    act_stats = {}
     # weights
     weights = {}
 
     target_layer_type = torch.nn.Linear
 
     def stat_tensor(name, m, x, y):
-        if not name in inps:
-            inps[name] = []
-            weights[name] = []
-        w = m.weight
-        inps[name].append(x.float().cpu())
-        weights[name] = w.float().cpu()
+        if not name in act_stats:
+            act_stats[name] = init_act_stats(x.shape[-1], x.device)
+            weights[name] = m.weight.float().cpu()
+        if act_transform is not None:
+            x = act_transform(x.float())
+        update_act_stats(act_stats[name], x)
 
     def stat_input_hook(m, x, y, name):
         if isinstance(x, tuple):
@@ -52,23 +86,28 @@ def get_act_stats(model, dataset):
                     functools.partial(stat_input_hook, name=name))
             )
 
-    for data in dataset:
+    for i, data in enumerate(tqdm(dataset)):
+        if num_batches is not None and i >= num_batches:
+            break
         model(data[0].to(device))
-        break
-
-    for name in list(inps.keys()):
-        in_dim = inps[name][0].shape[-1]
-        inps[name] = inps[name][0].reshape(-1, in_dim)
 
     for h in hooks:
         h.remove()
 
-    return inps, weights
+    for stats in act_stats.values():
+        for key in ["sumsq", "maxabs", "hist"]:
+            stats[key] = stats[key].cpu()
+
+    return act_stats, weights
+
+
+def hadamard_transform(x):
+    return hadamard_utils.StructuredHadamard(x.shape[-1]).apply(x)
 
 
 @torch.no_grad()
 def get_flatness(args, logger, transform_type=None):
-    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token)
+    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token, attn_impl=args.attn_impl)
     model.eval()
 
     # get calibration data
@@ -86,7 +125,7 @@ def get_flatness(args, logger, transform_type=None):
             model = apply_flatquant_to_model(args, model)
             logger.info("Finished applying FlatQuant to model.")
             flat_utils.load_flat_matrices(args, model, path=args.matrix_path)
-            flat_utils.reparameterize_model(model)
+            flat_utils.reparameterize_model(model, num_workers=args.rep_workers, device=args.rep_device)
             logger.info("Finished reparameterize model.")
             quant_utils.set_quantizer_state(model, enable=False)
         elif transform_type == "hadamard":
@@ -103,46 +142,38 @@ def get_flatness(args, logger, transform_type=None):
     else:
         model.to(utils.DEV)
 
-    inps, weights = get_act_stats(model, trainloader)
+    # the hadamard transform is applied to the activations inside the hooks, FWHT instead of a dense
+    # hidden_dim x hidden_dim matmul, runs on CPU without fast_hadamard_transform
+    act_stats, weights = get_act_stats(model, trainloader, act_transform=hadamard_transform if transform_type == "hadamard" else None)
     flatness = {}
-    for name in tqdm(inps.keys()):
-        x = inps[name]
+    for name in tqdm(act_stats.keys()):
+        # per-channel l2 norm of the activations over all tokens
+        x_norm = act_stats[name]["sumsq"].sqrt().float()
         w = weights[name]
 
         if transform_type is None or transform_type == "flatquant":
-            x_flatness = LA.norm(x.cpu().numpy(), axis=0)
+            x_flatness = x_norm.numpy()
             w_flatness = LA.norm(w.cpu().numpy(), axis=0)
             flatness[name] = {
                 "x": x_flatness, "w": w_flatness
             }
         elif transform_type == "hadamard":
-            hidden_dim = x.shape[-1]
-            device = x.device
-            if hadamard_utils.is_pow2(hidden_dim):
-                had = hadamard_utils.get_had_pow2(hidden_dim).to(device)
-                x_had = x.to(device) @ had
-                w_had = w.to(device) @ had
-            else:
-                had_right, k = hadamard_utils.get_hadK(hidden_dim)
-                had_right = had_right.to(device) / math.sqrt(k)
-                had_left = hadamard_utils.get_had_pow2(hidden_dim // k).to(device)
-                x_had = flat_utils.kronecker_matmul(x.to(device), had_left, had_right)
-                w_had = flat_utils.kronecker_matmul(w.to(device), had_left, had_right)
-            x_had_flatness = LA.norm(x_had.cpu().numpy(), axis=0)
+            w_had = hadamard_transform(w)
+            x_had_flatness = x_norm.numpy()
             w_had_flatness = LA.norm(w_had.cpu().numpy(), axis=0)
             flatness[name] = {
                 "x": x_had_flatness, "w": w_had_flatness
             }
         elif transform_type == "smoothquant":
-            act_scales = args.act_scales[name].to(x.device)
+            act_scales = args.act_scales[name].to(w.device)
             weight_scales = w.abs().max(dim=0)[0].clamp(min=1e-5)
             scales = (
                 (act_scales.pow(args.smooth_alpha) / weight_scales.pow(1 - args.smooth_alpha))
                 .clamp(min=1e-5)
             )
-            x_sq = x / scales
+            # the smoothing is per channel, so ||x / s|| = ||x|| / s
+            x_sq_flatness = (x_norm / scales).numpy()
             w_sq = w * scales
-            x_sq_flatness = LA.norm(x_sq.cpu().numpy(), axis=0)
             w_sq_flatness = LA.norm(w_sq.cpu().numpy(), axis=0)
             flatness[name] = {
                 "x": x_sq_flatness, "w": w_sq_flatness
@@ -160,7 +191,7 @@ def get_flatness(args, logger, transform_type=None):
 
 
 def get_act_scales(args, logger):
-    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token)
+    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token, attn_impl=args.attn_impl)
     model.eval()
 
     # get calibration data
@@ -81,3 +81,41 @@ def set_require_grad_all(model, requires_grad):
     for name, param in model.named_parameters():
         param.requires_grad = requires_grad
     return
+
+
+def causal_mask(q_len, kv_len, device):
+    # the queries are the last q_len of the kv_len positions, as when decoding with a kv cache
+    return torch.ones(q_len, kv_len, dtype=torch.bool, device=device).tril(kv_len - q_len)
+
+
+def attention_forward(query_states, key_states, value_states, attention_mask, dropout_p=0.0, sdpa=True):
+    '''
+    Attention of the (quantized) query/key/value states [bsz, num_heads, seq_len, head_dim], returns the output and
+    the attention weights. With sdpa, scaled_dot_product_attention runs a fused kernel without materializing the
+    [bsz, num_heads, q_len, kv_len] weights, which are returned as None. As prepared by transformers for the sdpa
+    implementation, attention_mask None stands for the causal mask.
+    '''
+    q_len, kv_len = query_states.shape[-2], key_states.shape[-2]
+    if attention_mask is not None:
+        attention_mask = attention_mask[:, :, :, :kv_len]
+    if sdpa:
+        is_causal = attention_mask is None and q_len > 1 and q_len == kv_len
+        if attention_mask is None and q_len > 1 and not is_causal:
+            attention_mask = causal_mask(q_len, kv_len, query_states.device)
+        elif attention_mask is not None:
+            attention_mask = attention_mask.to(query_states.dtype)
+        attn_output = torch.nn.functional.scaled_dot_product_attention(
+            query_states, key_states, value_states, attn_mask=attention_mask, dropout_p=dropout_p, is_causal=is_causal)
+        return attn_output, None
+
+    attn_weights = torch.matmul(query_states, key_states.transpose(2, 3)) / math.sqrt(query_states.shape[-1])
+    if attention_mask is not None:
+        attn_weights = attn_weights + attention_mask
+    elif q_len > 1:
+        attn_weights = attn_weights.masked_fill(~causal_mask(q_len, kv_len, attn_weights.device),
+                                                torch.finfo(attn_weights.dtype).min)
+    # upcast attention to fp32
+    attn_weights = torch.nn.functional.softmax(attn_weights, dim=-1, dtype=torch.float32).to(query_states.dtype)
+    attn_weights = torch.nn.functional.dropout(attn_weights, p=dropout_p, training=dropout_p > 0)
+    attn_output = torch.matmul(attn_weights, value_states)
+    return attn_output, attn_weights
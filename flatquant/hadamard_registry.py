@@ -0,0 +1,61 @@
+import os
+import functools
+
+import numpy as np
+import torch
+
+# hadamard matrices for had12, had36.pal2, had52,will, 
+# # had60.pal, had108.pal, had140.pal, had156.will, had172.will:
+# http://www.neilsloane.com/hadamard/index.html
+# The factors are stored as packed sign bits (1 for +1, 0 for -1, row-major) in `hadamard_factors.npy`,
+# one after another in the order of HAD_FACTOR_SIZES. The file is memory-mapped on first use.
+HAD_FACTOR_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "hadamard_factors.npy")
+# get_hadK tries the factors in this order
+HAD_FACTOR_SIZES = (172, 156, 140, 108, 60, 52, 36, 28, 40, 20, 12)
+
+
+def is_pow2(n):
+    return (n & (n - 1) == 0) and (n > 0)
+
+
+@functools.lru_cache(maxsize=None)
+def _load_factor_offsets():
+    data = np.load(HAD_FACTOR_PATH, mmap_mode="r")
+    offsets, offset = {}, 0
+    for K in HAD_FACTOR_SIZES:
+        offsets[K] = offset
+        offset += K * K // 8
+    assert offset == data.shape[0], f"Corrupted hadamard factor file {HAD_FACTOR_PATH}"
+    return data, offsets
+
+
+@functools.lru_cache(maxsize=None)
+def _get_factor(K, transpose, dtype, device):
+    data, offsets = _load_factor_offsets()
+    bits = np.unpackbits(data[offsets[K]: offsets[K] + K * K // 8])
+    had = torch.from_numpy(bits.astype(np.float32) * 2 - 1).reshape(K, K)
+    if transpose:
+        had = had.T.contiguous()
+    return had.to(device=device, dtype=dtype)
+
+
+@functools.lru_cache(maxsize=None)
+def get_hadK_size(n):
+    """Return K such that n = K * 2^m and a K x K Hadamard factor is available (K = 1 for powers of 2)."""
+    for K in HAD_FACTOR_SIZES:
+        if n % K == 0 and is_pow2(n // K):
+            return K
+    assert is_pow2(n), f"No hadamard factor available for dimension {n}."
+    return 1
+
+
+def get_hadK(n, transpose=False, dtype=torch.float32, device="cpu"):
+    """
+    Return (hadK, K) where hadK is the unnormalized K x K Hadamard factor of n (None if n is a power of 2).
+    The tensors are cached per (K, transpose, dtype, device) and shared between callers, so treat them as read-only.
+    """
+    K = get_hadK_size(n)
+    if K == 1:
+        return None, K
+    return _get_factor(K, transpose, dtype, torch.device(device)), K
+
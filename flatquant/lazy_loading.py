@@ -0,0 +1,134 @@
+import os
+import json
+
+import torch
+from accelerate import init_empty_weights
+from safetensors import safe_open
+
+
+def resolve_checkpoint(model_name, hf_token=None):
+    """Local directory of the checkpoint, only the configs and safetensors shards are downloaded from the hub."""
+    if os.path.isdir(model_name):
+        return model_name
+    from huggingface_hub import snapshot_download
+    return snapshot_download(model_name, allow_patterns=["*.json", "*.safetensors"], token=hf_token)
+
+
+def safetensors_weight_map(checkpoint_dir):
+    """{tensor name: shard file} of a sharded (model.safetensors.index.json) or single-file checkpoint."""
+    index = os.path.join(checkpoint_dir, "model.safetensors.index.json")
+    if os.path.exists(index):
+        with open(index) as f:
+            return json.load(f)["weight_map"]
+    single = os.path.join(checkpoint_dir, "model.safetensors")
+    if os.path.exists(single):
+        with safe_open(single, framework="pt", device="cpu") as f:
+            return {name: "model.safetensors" for name in f.keys()}
+    raise FileNotFoundError(f"--lazy_load needs a safetensors checkpoint, none found in {checkpoint_dir}.")
+
+
+def set_module_tensor(module, name, tensor):
+    """Replaces the parameter or buffer `name` (e.g. self_attn.q_proj.linear.weight) of module by tensor."""
+    *path, attr = name.split(".")
+    for child in path:
+        module = getattr(module, child)
+    if attr in module._parameters:
+        module._parameters[attr] = torch.nn.Parameter(tensor, requires_grad=False)
+    else:
+        module._buffers[attr] = tensor
+
+
+def checkpoint_name(name):
+    # the FlatQuantizedLinear layers keep the original nn.Linear as .linear
+    return name.replace(".linear.", ".")
+
+
+def init_running_maxima(layer):
+    # the running maxima of the sq_style diagonal init are built from the device of the (meta) weights
+    for module in layer.modules():
+        for attr, value in list(vars(module).items()):
+            if attr.endswith("_smax") and isinstance(value, torch.Tensor) and value.is_meta:
+                setattr(module, attr, torch.ones(value.shape, dtype=value.dtype) * 1e-5)
+
+
+class LazyLayerLoader:
+    '''
+    Streams the decoder layers of a model built on the meta device, so that the calibration, the reparameterization
+    and the weight quantization need host memory for one layer only. materialize() loads the weights of a layer from
+    the safetensors shards of the checkpoint, or from its offloaded copy once it was released, and release() writes
+    the layer to offload_dir and puts its parameters back on the meta device.
+    '''
+    def __init__(self, checkpoint_dir, offload_dir, prefix="model.layers."):
+        self.checkpoint_dir = checkpoint_dir
+        self.offload_dir = offload_dir
+        self.prefix = prefix
+        self.weight_map = safetensors_weight_map(checkpoint_dir)
+        # the layers released by this run, the files of a previous run in offload_dir are not reused
+        self.offloaded = set()
+
+    def offload_path(self, i):
+        return os.path.join(self.offload_dir, f"layer_{i}.pth")
+
+    def load_tensors(self, names):
+        """{name: tensor} read from the shards, one shard open at a time."""
+        missing = [name for name in names if name not in self.weight_map]
+        if missing:
+            raise KeyError(f"Tensors not found in the checkpoint {self.checkpoint_dir}: {missing}")
+        shards = {}
+        for name in names:
+            shards.setdefault(self.weight_map[name], []).append(name)
+        tensors = {}
+        for shard, shard_names in shards.items():
+            with safe_open(os.path.join(self.checkpoint_dir, shard), framework="pt", device="cpu") as f:
+                for name in shard_names:
+                    tensors[name] = f.get_tensor(name)
+        return tensors
+
+    def materialize(self, layer, i):
+        meta = [name for name, param in layer.named_parameters() if param.is_meta]
+        if meta:
+            if i in self.offloaded:
+                state = torch.load(self.offload_path(i), map_location="cpu", mmap=True, weights_only=True)
+                tensors = {name: state[name] for name in meta}
+            else:
+                names = {name: checkpoint_name(f"{self.prefix}{i}.{name}") for name in meta}
+                loaded = self.load_tensors(list(names.values()))
+                tensors = {name: loaded[names[name]] for name in meta}
+            for name, tensor in tensors.items():
+                set_module_tensor(layer, name, tensor)
+        init_running_maxima(layer)
+        return layer
+
+    def release(self, layer, i, save=True):
+        # with data-parallel calibration, the ranks hold the same layer and only one of them writes it
+        if save:
+            os.makedirs(self.offload_dir, exist_ok=True)
+            # the layer may be memory-mapped from its previous copy, which must stay intact until the new one is written
+            tmp_path = f"{self.offload_path(i)}.{os.getpid()}.tmp"
+            torch.save(layer.state_dict(), tmp_path)
+            os.replace(tmp_path, self.offload_path(i))
+        self.offloaded.add(i)
+        for name, param in list(layer.named_parameters()):
+            set_module_tensor(layer, name, torch.empty_like(param, device="meta"))
+        return layer
+
+
+def get_lazy_model(model_cls, model_name, config, hf_token=None, offload_dir="./offload"):
+    '''
+    Builds model_cls(config) on the meta device with the weights outside of the decoder layers loaded, the
+    layers are materialized on demand by model.lazy_loader.
+    '''
+    checkpoint_dir = resolve_checkpoint(model_name, hf_token)
+    with init_empty_weights():
+        model = model_cls(config)
+    loader = LazyLayerLoader(checkpoint_dir, offload_dir)
+    names = [name for name, param in model.named_parameters() if not name.startswith(loader.prefix)]
+    for name, tensor in loader.load_tensors([name for name in names if name in loader.weight_map]).items():
+        set_module_tensor(model, name, tensor)
+    model.tie_weights()
+    missing = [name for name, param in model.named_parameters()
+               if param.is_meta and not name.startswith(loader.prefix)]
+    if missing:
+        raise KeyError(f"Tensors not found in the checkpoint {checkpoint_dir}: {missing}")
+    model.lazy_loader = loader
+    return model
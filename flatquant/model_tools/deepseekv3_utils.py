@@ -6,6 +6,7 @@ import torch
 from torch import nn
 import torch.nn.functional as F
 import torch.distributed as dist
+import torch.distributed.nn.functional as dist_nn
 
 from flatquant.quant_utils import WeightQuantizer, ActivationQuantizer
 from flatquant.flat_utils import kronecker_matmul
@@ -14,10 +15,46 @@ from flatquant.function_utils import get_init_scale, get_decompose_dim
 
 from deepseek_v3.kernel import act_quant, weight_dequant, fp8_gemm
 from deepseek_v3.model import ModelArgs, apply_rotary_emb, MLA, MLP, MoE, RowParallelLinear, \
-            gemm_impl, attn_impl, block_size
+            gemm_impl, attn_impl, block_size, sort_by_expert, cache_index
 from deepseek_v3.model import linear as deepseek_linear
 
 
+class _ReduceGrad(torch.autograd.Function):
+    """Identity in the forward, sums the gradient over ranks in the backward."""
+    @staticmethod
+    def forward(ctx, x):
+        return x
+
+    @staticmethod
+    def backward(ctx, grad):
+        grad = grad.contiguous()
+        dist.all_reduce(grad)
+        return grad
+
+
+class _GatherTokens(torch.autograd.Function):
+    """
+    Concatenates the equally sized token slices of all ranks. The loss is replicated on every rank,
+    so the backward only keeps the gradient of the local slice.
+    """
+    @staticmethod
+    def forward(ctx, x):
+        ctx.rank, ctx.num_tokens = dist.get_rank(), x.shape[0]
+        out = [torch.empty_like(x) for _ in range(dist.get_world_size())]
+        dist.all_gather(out, x.contiguous())
+        return torch.cat(out)
+
+    @staticmethod
+    def backward(ctx, grad):
+        return grad[ctx.rank * ctx.num_tokens:(ctx.rank + 1) * ctx.num_tokens]
+
+
+def all_to_all_tokens(x, send_counts, recv_counts):
+    """Differentiable all-to-all of the rows of x, the backward sends the gradients back to their source."""
+    out = x.new_empty((sum(recv_counts), ) + tuple(x.shape[1:]))
+    return dist_nn.all_to_all_single(out, x.contiguous(), output_split_sizes=recv_counts, input_split_sizes=send_counts)
+
+
 class FlatQuantizedLinear(nn.Module):
     def __init__(self, flat_args, linear, is_rowparallel=False, act_quantizer=None):
         super(FlatQuantizedLinear, self).__init__()
@@ -86,8 +123,7 @@ class FlatQuantizedLinear(nn.Module):
             weight = out_trans(weight.T).T
         
         # quantize weight
-        self.weight_quantizer.find_params(weight)
-        weight = self.weight_quantizer(weight)
+        weight = self.weight_quantizer.fake_quant(weight)
         # quantize activation
         hidden_states = self.act_quantizer(hidden_states)
 
@@ -179,7 +215,9 @@ class FlatQuantMLA(nn.Module):
 
     def forward(self, x: torch.Tensor, start_pos: int, freqs_cis: torch.Tensor, mask: Optional[torch.Tensor]):
         bsz, seqlen, _ = x.size()
-        end_pos = start_pos + seqlen
+        end_pos = start_pos + seqlen if isinstance(start_pos, int) else mask.size(-1)
+        # prefill attends to the fresh kv only
+        prefill = isinstance(start_pos, int) and start_pos == 0
 
         # ---- here quant the q and kv_a ----
         if self._ori_mode:
@@ -201,21 +239,22 @@ class FlatQuantMLA(nn.Module):
             q_nope = torch.einsum("bshd,hdc->bshc", q_nope, wkv_b[:, :self.qk_nope_head_dim])
             kv = self.kv_norm(kv)
             if self._eval_mode:
-                self.kv_cache[:bsz, start_pos:end_pos] = kv
-                self.pe_cache[:bsz, start_pos:end_pos] = k_pe.squeeze(2)
-            if start_pos == 0:
+                index = cache_index(bsz, start_pos, seqlen)
+                self.kv_cache[index] = kv
+                self.pe_cache[index] = k_pe.squeeze(2)
+            if prefill:
                 scores = (torch.einsum("bshc,btc->bsht", q_nope, kv) +
                         torch.einsum("bshr,btr->bsht", q_pe, k_pe.squeeze(2))) * self.softmax_scale
             else:
                 scores = (torch.einsum("bshc,btc->bsht", q_nope, self.kv_cache[:bsz, :end_pos]) +
                         torch.einsum("bshr,btr->bsht", q_pe, self.pe_cache[:bsz, :end_pos])) * self.softmax_scale
         if mask is not None:
-            scores += mask.unsqueeze(1)
+            scores += mask.unsqueeze(-2)
         scores = scores.softmax(dim=-1, dtype=torch.float32).type_as(x)
         if attn_impl == "naive":
             raise NotImplementedError
         else:
-            if start_pos == 0:
+            if prefill:
                 x = torch.einsum("bsht,btc->bshc", scores, kv)
                 x = torch.einsum("bshc,hdc->bshd", x, wkv_b[:, -self.v_head_dim:])
             else:
@@ -423,29 +462,101 @@ class FlatQuantMoE(nn.Module):
         self.add_fq_trans()
         self.world_size = dist.get_world_size() if dist.is_initialized() else 1
         self._ori_mode = False
-
-    def forward(self, x: torch.Tensor) -> torch.Tensor:
-        shape = x.size()
-        x = x.view(-1, self.dim)
-        weights, indices = self.gate(x)
-        y = torch.zeros_like(x)
-        if not self._ori_mode and self.w1_trans is not None:
-            x = self.w1_trans(x)
-        counts = torch.bincount(indices.flatten(), minlength=self.n_routed_experts).tolist()
-        for i in range(self.experts_start_idx, self.experts_end_idx):
-            if counts[i] == 0:
+        # route each rank's slice of the tokens to the ranks owning the experts instead of running
+        # every rank on all tokens, see _expert_parallel_forward
+        self.expert_parallel = False
+
+    def _run_experts(self, x_sorted, offsets):
+        out = torch.empty_like(x_sorted)
+        for i, (seg_start, seg_end) in enumerate(zip(offsets[:-1], offsets[1:]), start=self.experts_start_idx):
+            if seg_start == seg_end:
                 continue
             expert = self.experts[i]
-            idx, top = torch.where(indices == i)
             if self._ori_mode:
-                y[idx] += expert._ori_forward(x[idx]) * weights[idx, top, None]
+                out[seg_start:seg_end] = expert._ori_forward(x_sorted[seg_start:seg_end])
             else:
                 # independent_w2_trans = True
                 independent_w2_trans = False
                 if independent_w2_trans:
-                    y[idx] += expert(x[idx], self.w1_trans, self.routed_w2_trans[i]) * weights[idx, top, None]
+                    out[seg_start:seg_end] = expert(x_sorted[seg_start:seg_end], self.w1_trans, self.routed_w2_trans[i])
                 else:
-                    y[idx] += expert(x[idx], self.w1_trans, self.routed_w2_trans) * weights[idx, top, None]
+                    out[seg_start:seg_end] = expert(x_sorted[seg_start:seg_end], self.w1_trans, self.routed_w2_trans)
+        return out
+
+    def _expert_parallel_forward(self, x):
+        """
+        Expert-parallel forward for calibration. The tokens are replicated on all ranks, every rank gates
+        its own slice of them and sends the routed (token, expert) pairs to the rank owning the expert
+        with an all-to-all, so each routed pair is computed exactly once and only the locally hit experts
+        run. The results travel back with a second all-to-all and the combined slices are all-gathered.
+        """
+        rank, num_tokens = dist.get_rank(), x.shape[0]
+        # the input gradient of every rank only covers its own token slice and its shard of the shared experts
+        x = _ReduceGrad.apply(x)
+        x_ts = x
+        if not self._ori_mode and self.w1_trans is not None:
+            x_ts = self.w1_trans(x)
+        if self._ori_mode:
+            z = self.shared_experts._ori_forward(x_ts)
+        else:
+            z = self.shared_experts(x_ts, self.w1_trans, self.w2_trans)
+
+        chunk = (num_tokens + self.world_size - 1) // self.world_size
+        x_local = x[rank * chunk:(rank + 1) * chunk]
+        weights, indices = self.gate(x_local)
+        # pairs sorted by the global expert id are grouped by their destination rank as well
+        order, offsets = sort_by_expert(indices, 0, self.n_routed_experts)
+        idx = order // self.n_activated_experts
+        send_counts = [offsets[(r + 1) * self.n_local_experts] - offsets[r * self.n_local_experts] for r in range(self.world_size)]
+        recv_counts = torch.empty(self.world_size, dtype=torch.long, device=x.device)
+        dist.all_to_all_single(recv_counts, torch.tensor(send_counts, dtype=torch.long, device=x.device))
+        recv_counts = recv_counts.tolist()
+
+        recv_x = all_to_all_tokens(x_ts[rank * chunk:(rank + 1) * chunk][idx], send_counts, recv_counts)
+        recv_experts = indices.new_empty(sum(recv_counts))
+        dist.all_to_all_single(recv_experts, indices.flatten()[order].contiguous(), output_split_sizes=recv_counts, input_split_sizes=send_counts)
+        # the received pairs are sorted per source rank only
+        recv_order, recv_offsets = sort_by_expert(recv_experts, self.experts_start_idx, self.experts_end_idx)
+        out = self._run_experts(recv_x[recv_order], recv_offsets)
+        out = torch.empty_like(out).index_copy(0, recv_order, out)
+        out = all_to_all_tokens(out, recv_counts, send_counts)
+
+        y = x.new_zeros((chunk, self.dim))
+        y.index_add_(0, idx, out * weights.flatten()[order, None])
+        y = _GatherTokens.apply(y)[:num_tokens]
+        return y + z
+
+    def all_reduce_shared_grads(self):
+        """Sums the gradients of the parameters every rank holds a replica of, before the optimizer step."""
+        for param in self.shared_parameters():
+            if param.grad is not None:
+                dist.all_reduce(param.grad)
+
+    def broadcast_shared_parameters(self, src=0):
+        with torch.no_grad():
+            for param in self.shared_parameters():
+                dist.broadcast(param.data, src)
+
+    def shared_parameters(self):
+        """Parameters replicated on all ranks: the input transform, the routed down_proj transform and
+        the activation clipping of the routed experts."""
+        modules = [self.w1_trans, self.routed_w2_trans, self.act_quantizer_w1_routed, self.act_quantizer_w2_routed]
+        return [param for module in modules if module is not None for param in module.parameters()]
+
+    def forward(self, x: torch.Tensor) -> torch.Tensor:
+        shape = x.size()
+        x = x.view(-1, self.dim)
+        if self.expert_parallel and self.world_size > 1:
+            return self._expert_parallel_forward(x).view(shape)
+        weights, indices = self.gate(x)
+        y = torch.zeros_like(x)
+        if not self._ori_mode and self.w1_trans is not None:
+            x = self.w1_trans(x)
+        # gather once in expert order, run each expert on its contiguous segment, scatter back once
+        order, offsets = sort_by_expert(indices, self.experts_start_idx, self.experts_end_idx)
+        idx = order // self.n_activated_experts
+        out = self._run_experts(x[idx], offsets)
+        y.index_add_(0, idx, out * weights.flatten()[order, None])
         if self._ori_mode:
             z = self.shared_experts._ori_forward(x)
         else:
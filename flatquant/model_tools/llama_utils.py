@@ -5,7 +5,7 @@ import torch.nn as nn
 
 from flatquant.quant_utils import ActivationQuantizer
 from flatquant.utils import skip_initialization
-from flatquant.function_utils import get_init_scale, get_decompose_dim
+from flatquant.function_utils import get_init_scale, get_decompose_dim, attention_forward
 from flatquant.trans_utils import SVDSingleTransMatrix, SVDDecomposeTransMatrix
 from flatquant.trans_utils import InvSingleTransMatrix, InvDecomposeTransMatrix
 from flatquant.flat_linear import FlatQuantizedLinear
@@ -121,13 +121,13 @@ class FlatQuantLlamaAttention(LlamaAttention):
 
         if args.q_bits < 16:
             self.q_cache_quantizer = ActivationQuantizer(bits=args.q_bits, \
-                                        sym=not(args.q_asym), lac=args.lac, groupsize=-1, )
+                                        sym=not(args.q_asym), lac=args.lac, groupsize=args.q_groupsize, )
         if args.k_bits < 16:
             self.k_cache_quantizer = ActivationQuantizer(bits=args.k_bits, \
-                                        sym=not(args.k_asym), lac=args.lac, groupsize=-1, )
+                                        sym=not(args.k_asym), lac=args.lac, groupsize=args.k_groupsize, )
         if args.v_bits < 16:
             self.v_cache_quantizer = ActivationQuantizer(bits=args.v_bits, \
-                                        sym=not(args.v_asym), lac=args.lac, groupsize=-1, )
+                                        sym=not(args.v_asym), lac=args.lac, groupsize=args.v_groupsize, )
 
         self._ori_mode = False
         self._eval_mode = False
@@ -193,7 +193,7 @@ class FlatQuantLlamaAttention(LlamaAttention):
             k = self.kcache_trans(k)
         if self.args.q_bits < 16:
             q = self.q_cache_quantizer(q).to(q)
-        # TODO: by default do the per-head quantizaion for k-v-cache
+        # per-head quantization for k-v-cache by default, per-group if k_groupsize < head_dim
         if self.args.k_bits < 16:
             k = self.k_cache_quantizer(k).to(q)
         return q, k
@@ -232,25 +232,15 @@ class FlatQuantLlamaAttention(LlamaAttention):
 
         key_states = repeat_kv(key_states, self.num_key_value_groups)
         value_states = repeat_kv(value_states, self.num_key_value_groups) # bnsh
-        attn_weights = torch.matmul(query_states, key_states.transpose(2, 3)) / math.sqrt(self.head_dim)
-
-        if attn_weights.size() != (bsz, self.num_heads, q_len, kv_seq_len):
-            raise ValueError(
-                f"Attention weights should be of size {(bsz, self.num_heads, q_len, kv_seq_len)}, but is"
-                f" {attn_weights.size()}"
-            )
-
         if attention_mask is not None:
             if attention_mask.size() != (bsz, 1, q_len, kv_seq_len):
                 raise ValueError(
                     f"Attention mask should be of size {(bsz, 1, q_len, kv_seq_len)}, but is {attention_mask.size()}"
                 )
-            attn_weights = attn_weights + attention_mask
-
-        # upcast attention to fp32
-        attn_weights = nn.functional.softmax(attn_weights, dim=-1, dtype=torch.float32).to(query_states.dtype)
-        attn_weights = nn.functional.dropout(attn_weights, p=self.attention_dropout, training=self.training)
-        attn_output = torch.matmul(attn_weights, value_states)
+        sdpa = self.config._attn_implementation == "sdpa" and not output_attentions
+        attn_output, attn_weights = attention_forward(query_states, key_states, value_states, attention_mask,
+                                                      dropout_p=self.attention_dropout if self.training else 0.0,
+                                                      sdpa=sdpa)
 
         if attn_output.size() != (bsz, self.num_heads, q_len, self.head_dim):
             raise ValueError(
@@ -2,6 +2,7 @@ import torch
 import transformers
 import logging
 from flatquant.utils import skip
+from flatquant.lazy_loading import get_lazy_model
 from flatquant.model_tools.llama_utils import apply_flatquant_to_llama
 from flatquant.model_tools.llama31_utils import apply_flatquant_to_llama_31
 
@@ -12,35 +13,38 @@ def skip_initialization():
     torch.nn.init.normal_ = skip
 
 
-def get_llama(model_name, hf_token):
+def from_pretrained(model_cls, model_name, config, hf_token, offload_dir=None):
+    # with offload_dir, the decoder layers stay on the meta device and are streamed by model.lazy_loader
+    if offload_dir is not None:
+        return get_lazy_model(model_cls, model_name, config, hf_token=hf_token, offload_dir=offload_dir)
+    return model_cls.from_pretrained(model_name,
+                                     torch_dtype='auto',
+                                     config=config,
+                                     use_auth_token=hf_token,
+                                     low_cpu_mem_usage=True)
+
+
+def get_llama(model_name, hf_token, offload_dir=None, attn_impl="eager"):
     skip_initialization()
     config = transformers.LlamaConfig.from_pretrained(model_name)
-    config._attn_implementation_internal = "eager"
-    model = transformers.LlamaForCausalLM.from_pretrained(model_name,
-                                                          torch_dtype='auto',
-                                                          config=config,
-                                                          use_auth_token=hf_token,
-                                                          low_cpu_mem_usage=True)
+    config._attn_implementation_internal = attn_impl
+    model = from_pretrained(transformers.LlamaForCausalLM, model_name, config, hf_token, offload_dir)
     model.seqlen = 2048
     logging.info(f'---> Loading {model_name} Model with seq_len: {model.seqlen}')
     return model, apply_flatquant_to_llama
 
 
-def get_llama_31(model_name, hf_token):
+def get_llama_31(model_name, hf_token, offload_dir=None, attn_impl="eager"):
     skip_initialization()
     config = transformers.LlamaConfig.from_pretrained(model_name)
-    config._attn_implementation_internal = "eager"
-    model = transformers.LlamaForCausalLM.from_pretrained(model_name,
-                                                          torch_dtype='auto',
-                                                          config=config,
-                                                          use_auth_token=hf_token,
-                                                          low_cpu_mem_usage=True)
+    config._attn_implementation_internal = attn_impl
+    model = from_pretrained(transformers.LlamaForCausalLM, model_name, config, hf_token, offload_dir)
     model.seqlen = 2048
     logging.info(f'---> Loading {model_name} Model with seq_len: {model.seqlen}')
     return model, apply_flatquant_to_llama_31
 
 
-def get_qwen2(model_name, hf_token):
+def get_qwen2(model_name, hf_token, offload_dir=None, attn_impl="eager"):
     skip_initialization()
     try:
         from transformers import Qwen2ForCausalLM
@@ -49,12 +53,8 @@ def get_qwen2(model_name, hf_token):
         raise ImportError("Qwen2 model is not available. Ensure you're using a compatible version of the 'transformers' library.")
 
     config = transformers.Qwen2Config.from_pretrained(model_name)
-    config._attn_implementation_internal = "eager"
-    model = Qwen2ForCausalLM.from_pretrained(model_name,
-                                                          torch_dtype='auto',
-                                                          config=config,
-                                                          use_auth_token=hf_token,
-                                                          low_cpu_mem_usage=True)
+    config._attn_implementation_internal = attn_impl
+    model = from_pretrained(Qwen2ForCausalLM, model_name, config, hf_token, offload_dir)
     model.seqlen = 2048
     logging.info(f'---> Loading {model_name} Model with seq_len: {model.seqlen}')
 
@@ -73,13 +73,13 @@ def get_opt(model_name):
 
 
 # Unified model loading function
-def get_model(model_name, hf_token=None):
+def get_model(model_name, hf_token=None, offload_dir=None, attn_impl="eager"):
     if 'llama-3.1' in model_name.lower():
-        return get_llama_31(model_name, hf_token)
+        return get_llama_31(model_name, hf_token, offload_dir, attn_impl)
     elif 'llama' in model_name:
-        return get_llama(model_name, hf_token)
+        return get_llama(model_name, hf_token, offload_dir, attn_impl)
     elif 'Qwen2.5' in model_name:
-        return get_qwen2(model_name, hf_token)
+        return get_qwen2(model_name, hf_token, offload_dir, attn_impl)
     else:
         raise ValueError(f'Unknown model {model_name}')
 
@@ -0,0 +1,133 @@
+import os
+import json
+import time
+import resource
+from contextlib import contextmanager, nullcontext
+from collections import OrderedDict
+
+import torch
+
+
+def _synchronize(device):
+    device = torch.device(device)
+    if device.type == "cuda":
+        torch.cuda.synchronize(device)
+    elif device.type == "npu":
+        torch.npu.synchronize(device)
+
+
+def _reset_peak_memory(device):
+    device = torch.device(device)
+    if device.type == "cuda":
+        torch.cuda.reset_peak_memory_stats(device)
+    elif device.type == "npu":
+        torch.npu.reset_peak_memory_stats(device)
+
+
+def _peak_memory_mb(device):
+    """Peak allocated device memory since the last reset, or the peak RSS of the process on CPU."""
+    device = torch.device(device)
+    if device.type == "cuda":
+        return torch.cuda.max_memory_allocated(device) / 2 ** 20
+    if device.type == "npu":
+        return torch.npu.max_memory_allocated(device) / 2 ** 20
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+class CaliProfiler:
+    """
+    Opt-in timeline of the calibration. Every region is timed on the host between two device
+    synchronizations, so the recorded time includes the queued device work of the region, and the peak
+    memory of the device is recorded per layer. When disabled all hooks are no-ops and nothing is
+    synchronized.
+
+    The timeline is saved as a Chrome trace (chrome://tracing or https://ui.perfetto.dev), the per-region
+    and per-layer totals as a JSON summary.
+    """
+    def __init__(self, enabled=False, device="cpu"):
+        self.enabled = enabled
+        self.device = device
+        self.events = []
+        self.layer_peak_memory = OrderedDict()
+        self._start = time.perf_counter()
+
+    def _now_us(self):
+        return (time.perf_counter() - self._start) * 1e6
+
+    def region(self, name, layer=None, step=None, **info):
+        if not self.enabled:
+            return nullcontext()
+        return self._region(name, layer, step, info)
+
+    @contextmanager
+    def _region(self, name, layer, step, info):
+        _synchronize(self.device)
+        start = self._now_us()
+        try:
+            yield
+        finally:
+            _synchronize(self.device)
+            self.events.append({"name": name, "layer": layer, "step": step, "ts": start,
+                                "dur": self._now_us() - start, "args": info})
+
+    def layer_start(self, layer):
+        if self.enabled:
+            _reset_peak_memory(self.device)
+
+    def layer_end(self, layer):
+        if self.enabled:
+            self.layer_peak_memory[layer] = _peak_memory_mb(self.device)
+
+    def chrome_trace(self):
+        trace = []
+        for event in self.events:
+            args = dict(event["args"])
+            if event["step"] is not None:
+                args["step"] = event["step"]
+            # one row per layer
+            tid = -1 if event["layer"] is None else event["layer"]
+            trace.append({"name": event["name"], "cat": "calibration", "ph": "X", "pid": 0, "tid": tid,
+                          "ts": event["ts"], "dur": event["dur"], "args": args})
+        for layer, peak in self.layer_peak_memory.items():
+            ts = max(e["ts"] + e["dur"] for e in self.events if e["layer"] == layer) if self.events else 0
+            trace.append({"name": "peak_memory_mb", "ph": "C", "pid": 0, "ts": ts, "args": {"peak_memory_mb": peak}})
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def summary(self):
+        regions, layers = OrderedDict(), OrderedDict()
+        for event in self.events:
+            region = regions.setdefault(event["name"], {"count": 0, "total_ms": 0.0, "max_ms": 0.0})
+            region["count"] += 1
+            region["total_ms"] += event["dur"] / 1e3
+            region["max_ms"] = max(region["max_ms"], event["dur"] / 1e3)
+            if event["layer"] is not None:
+                layer = layers.setdefault(event["layer"], OrderedDict())
+                layer[event["name"]] = layer.get(event["name"], 0.0) + event["dur"] / 1e3
+        for region in regions.values():
+            region["mean_ms"] = region["total_ms"] / region["count"]
+        for layer, peak in self.layer_peak_memory.items():
+            layers.setdefault(layer, OrderedDict())["peak_memory_mb"] = peak
+        return {"regions": regions, "layers": layers}
+
+    def summary_table(self):
+        regions = self.summary()["regions"]
+        total = sum(region["total_ms"] for region in regions.values()) or 1.0
+        lines = [f"{'region':<20}{'count':>8}{'total (s)':>12}{'mean (ms)':>12}{'max (ms)':>12}{'share':>8}"]
+        for name, region in sorted(regions.items(), key=lambda item: -item[1]["total_ms"]):
+            lines.append(f"{name:<20}{region['count']:>8}{region['total_ms'] / 1e3:>12.3f}{region['mean_ms']:>12.3f}"
+                         f"{region['max_ms']:>12.3f}{region['total_ms'] / total:>8.1%}")
+        if self.layer_peak_memory:
+            lines.append(f"peak memory {max(self.layer_peak_memory.values()):.1f} MB "
+                         f"(layer {max(self.layer_peak_memory, key=self.layer_peak_memory.get)})")
+        return "\n".join(lines)
+
+    def save(self, exp_dir, logger=None):
+        if not self.enabled:
+            return
+        with open(os.path.join(exp_dir, "cali_trace.json"), "w") as f:
+            json.dump(self.chrome_trace(), f)
+        with open(os.path.join(exp_dir, "cali_profile.json"), "w") as f:
+            json.dump(self.summary(), f, indent=2)
+        if logger is not None:
+            logger.info("calibration profile:\n" + self.summary_table())
+            logger.info(f"saved calibration trace at {os.path.join(exp_dir, 'cali_trace.json')}")
@@ -33,7 +33,8 @@ def sym_quant_dequant(x, scale, maxq):
 def asym_quant(x, scale, zero, maxq):
     scale = scale.to(x.device)
     zero = zero.to(x.device)
-    q = torch.clamp(round_ste(x / scale) + zero, 0, maxq)
+    # tensor bounds, a scalar bound would turn maxq into a graph-breaking Python number
+    q = torch.clamp(round_ste(x / scale) + zero, torch.zeros_like(maxq), maxq)
     return q, scale, zero
 
 
@@ -45,19 +46,45 @@ def asym_quant_dequant(x, scale, zero, maxq):
     return asym_dequant(*asym_quant(x, scale, zero, maxq))
 
 
+class RangeObserver:
+    '''
+        Streaming estimate of the range of the activations for the static quantization: the `percentile`
+        quantile of the per-token maxima (and the 1 - `percentile` quantile of the minima) of every batch,
+        averaged over the batches with an EMA of the given momentum. percentile=1 tracks the batch maxima.
+    '''
+    def __init__(self, percentile=1.0, momentum=0.9):
+        self.percentile = percentile
+        self.momentum = momentum
+        self.xmax, self.xmin = None, None
+
+    @torch.no_grad()
+    def update(self, xmax, xmin):
+        xmax, xmin = xmax.flatten().float(), xmin.flatten().float()
+        if self.percentile < 1:
+            batch_max, batch_min = torch.quantile(xmax, self.percentile), torch.quantile(xmin, 1 - self.percentile)
+        else:
+            batch_max, batch_min = xmax.max(), xmin.min()
+        if self.xmax is None:
+            self.xmax, self.xmin = batch_max, batch_min
+        else:
+            self.xmax = self.momentum * self.xmax + (1 - self.momentum) * batch_max
+            self.xmin = self.momentum * self.xmin + (1 - self.momentum) * batch_min
+
+
 class ActivationQuantizer(torch.nn.Module):
     '''
-        A class for quantizing the activations. We only support (both sym. and asym.) per-token quantization
-        for the activations.
+        A class for quantizing the activations. We support (both sym. and asym.) per-token and per-group
+        quantization for the activations. With `groupsize > 0`, the last dimension is split into contiguous
+        groups of `groupsize` channels, each with its own scale (and zero point).
+        With `static=True` the quantizer also holds a per-tensor range (static_xmax, static_xmin), collected by
+        a RangeObserver after the calibration, which replaces the per-token ranges once `use_static` is set.
     '''
-    def __init__(self, bits, sym=False, lac=False, groupsize=-1, clip_ratio=None, ):
+    def __init__(self, bits, sym=False, lac=False, groupsize=-1, clip_ratio=None, static=False):
         super(ActivationQuantizer, self).__init__()
         self.bits = bits
         self.q_max, self.q_min = get_qmin_qmax(bits, sym)
         self.sym = sym
         self.groupsize = groupsize
-        if self.groupsize > 0:
-            raise NotImplementedError("Not support per-group quantization for activation yet.")
         self.lac = lac
         self._clip_ratio = clip_ratio
         if self.lac:
@@ -65,12 +92,24 @@ class ActivationQuantizer(torch.nn.Module):
             self.sigmoid = torch.nn.Sigmoid()
             self.clip_factor_a_max = torch.nn.Parameter(torch.ones((1, ))*init_value, requires_grad=True)
             self.clip_factor_a_min = torch.nn.Parameter(torch.ones((1, ))*init_value, requires_grad=True)
+        if static:
+            # parameters (not buffers) to be saved in flat_matrices.pth with the clipping factors
+            self.static_xmax = torch.nn.Parameter(torch.zeros((1, )), requires_grad=False)
+            self.static_xmin = torch.nn.Parameter(torch.zeros((1, )), requires_grad=False)
+        self.use_static = False
+        self.observer = None
         
         self.enable = True
 
     def forward(self, x):
         if self.bits == 16 or (not self.enable):
             return x
+        if self.groupsize > 0 and self.groupsize < x.shape[-1]:
+            assert x.shape[-1] % self.groupsize == 0, \
+                f"The last dim {x.shape[-1]} should be divisible by groupsize {self.groupsize}."
+            init_shape = x.shape
+            fq_x = self.fake_quant(x.reshape(-1, self.groupsize))
+            return fq_x.reshape(init_shape)
         fq_x = self.fake_quant(x)
         return fq_x
 
@@ -86,35 +125,36 @@ class ActivationQuantizer(torch.nn.Module):
         q_max = self.q_max.to(x)
         init_shape = x.shape
         reshaped_x = x.reshape((-1, x.shape[-1]))
-        xmax, xmin = reshaped_x.amax(1, keepdim=True), reshaped_x.amin(1, keepdim=True)
-        tmp = torch.zeros_like(xmax)
-        xmax, xmin = torch.maximum(xmax, tmp), torch.minimum(xmin, tmp)
-        # # if self.groupsize > 0:
-        # #     assert x.shape[-1] % self.groupsize == 0
-        # #     x = x.reshape((-1, self.groupsize))
-        # #     # TODO: add padding
+        if self.use_static:
+            # calibrated range, no reduction over the tokens
+            xmax, xmin = self.static_xmax.to(x).reshape(1, 1), self.static_xmin.to(x).reshape(1, 1)
+        else:
+            xmax, xmin = reshaped_x.amax(1, keepdim=True), reshaped_x.amin(1, keepdim=True)
+            tmp = torch.zeros_like(xmax)
+            xmax, xmin = torch.maximum(xmax, tmp), torch.minimum(xmin, tmp)
+            if self.observer is not None:
+                self.observer.update(xmax, xmin)
         if self.lac:
             xmax = xmax * self.sigmoid(self.clip_factor_a_max)
             xmin = xmin * self.sigmoid(self.clip_factor_a_min)
         elif self._clip_ratio is not None:
             xmax = xmax * self._clip_ratio
             xmin = xmin * self._clip_ratio
+        # torch.where instead of masked assignments, which break torch.compile graphs
         if self.sym:
             xmax = torch.maximum(torch.abs(xmin), xmax)
-            tmp = xmax == 0
-            scale = (xmax / q_max)
-            scale[tmp] = 1
-            scale = scale.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
+            scale = torch.where(xmax == 0, torch.ones_like(xmax), xmax / q_max)
+            scale = scale.expand_as(reshaped_x).reshape(init_shape)
             zero = torch.zeros_like(scale)
         else:
             tmp = (xmin == 0) & (xmax == 0)
-            xmin[tmp] = -1
-            xmax[tmp] = +1
+            xmin = torch.where(tmp, -torch.ones_like(xmin), xmin)
+            xmax = torch.where(tmp, torch.ones_like(xmax), xmax)
             scale = (xmax - xmin) / q_max
             zero = torch.round(-xmin / scale)
 
-            scale = scale.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
-            zero = zero.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
+            scale = scale.expand_as(reshaped_x).reshape(init_shape)
+            zero = zero.expand_as(reshaped_x).reshape(init_shape)
 
         return scale, zero
 
@@ -159,20 +199,8 @@ class WeightQuantizer(torch.nn.Module):
         else:
             x = x.flatten().unsqueeze(0)
 
-        tmp = torch.zeros(x.shape[0], device=dev)
-        xmin = torch.minimum(x.min(1)[0], tmp)
-        xmax = torch.maximum(x.max(1)[0], tmp)
-
-        if self.sym:
-            xmax = torch.maximum(torch.abs(xmin), xmax).clamp(min=1e-5)
-            self.scale = xmax / self.maxq
-            self.zero = torch.zeros_like(self.scale)
-        else:
-            tmp = (xmin == 0) & (xmax == 0)
-            xmin[tmp] = -1
-            xmax[tmp] = +1
-            self.scale = (xmax - xmin).clamp(min=1e-5) / self.maxq
-            self.zero = torch.round(-xmin / self.scale)
+        xmin, xmax = self._minmax(x)
+        self.scale, self.zero = self._minmax_scale_zero(xmin, xmax, self.maxq)
 
         if self.mse:
             best = torch.full([x.shape[0]], float('inf'), device=dev)
@@ -211,6 +239,41 @@ class WeightQuantizer(torch.nn.Module):
         self.zero = self.zero.reshape(shape)
         return
 
+    @staticmethod
+    def _minmax(x):
+        tmp = torch.zeros(x.shape[0], device=x.device)
+        return torch.minimum(x.min(1)[0], tmp), torch.maximum(x.max(1)[0], tmp)
+
+    def _minmax_scale_zero(self, xmin, xmax, maxq):
+        if self.sym:
+            xmax = torch.maximum(torch.abs(xmin), xmax).clamp(min=1e-5)
+            scale = xmax / maxq
+            return scale, torch.zeros_like(scale)
+        tmp = (xmin == 0) & (xmax == 0)
+        xmin = torch.where(tmp, -torch.ones_like(xmin), xmin)
+        xmax = torch.where(tmp, torch.ones_like(xmax), xmax)
+        scale = (xmax - xmin).clamp(min=1e-5) / maxq
+        return scale, torch.round(-xmin / scale)
+
+    def fake_quant(self, x):
+        '''
+            Stateless per-channel quantize-dequantize of the calibration forward. Equivalent to find_params
+            followed by quantize, but the scales are neither stored nor checked, so the graph has no
+            data-dependent branches or module mutations and can be captured by torch.compile.
+        '''
+        if self.bits == 16 or (not self.enable):
+            return x
+        if self.mse or not self.perchannel:
+            self.find_params(x)
+            return self.quantize(x)
+        maxq = self.maxq.to(x.device)
+        xmin, xmax = self._minmax(x.flatten(1))
+        scale, zero = self._minmax_scale_zero(xmin, xmax, maxq)
+        shape = [-1] + [1] * (len(x.shape) - 1)
+        if self.sym:
+            return sym_quant_dequant(x, scale.reshape(shape), maxq).to(x.dtype)
+        return asym_quant_dequant(x, scale.reshape(shape), zero.reshape(shape), maxq).to(x.dtype)
+
     def quantize(self, x):
         x_dtype = x.dtype
         if self.enable and self.ready() and self.bits < 16:
@@ -249,3 +312,33 @@ def set_act_quantizer_state(model, enable=True):
             m.enable = enable
     return model
 
+
+def static_act_quantizers(model):
+    return [m for m in model.modules() if isinstance(m, ActivationQuantizer) and hasattr(m, "static_xmax")]
+
+
+def observe_static_ranges(model, percentile=1.0, momentum=0.9):
+    '''Starts collecting the ranges of the static activation quantizers of model, on its dynamic quantization.'''
+    for m in static_act_quantizers(model):
+        m.use_static = False
+        m.observer = RangeObserver(percentile, momentum)
+    return model
+
+
+def set_static_ranges(model):
+    '''Stores the ranges collected since observe_static_ranges and switches the quantizers to them.'''
+    for m in static_act_quantizers(model):
+        if m.observer is not None and m.observer.xmax is not None:
+            m.static_xmax.data.fill_(m.observer.xmax.item())
+            m.static_xmin.data.fill_(m.observer.xmin.item())
+            m.use_static = True
+        m.observer = None
+    return model
+
+
+def set_static_act_quantizer_state(model, enable=True):
+    '''Switches between the stored static ranges (e.g. loaded from flat_matrices.pth) and the per-token ranges.'''
+    for m in static_act_quantizers(model):
+        m.use_static = enable
+    return model
+
@@ -1,4 +1,5 @@
 import os
+import json
 import time
 import gc
 import functools
@@ -6,42 +7,51 @@ from contextlib import nullcontext
 
 import torch
 import torch.nn as nn
+import torch.distributed as dist
 import transformers
 
 from flatquant.function_utils import set_require_grad_all, get_n_set_parameters_byname, get_paras_dict_by_name, check_params_grad
-from flatquant.quant_utils import set_quantizer_state
+from flatquant.quant_utils import set_quantizer_state, observe_static_ranges, set_static_ranges
+from flatquant.profiling import CaliProfiler
+from flatquant.epoch_schedule import EpochBudget, MSEPlateau, set_cosine_horizon
+from flatquant.bit_allocation import measure_layer_sensitivity
+from flatquant.data_parallel import get_group, shard_sample_ids, all_reduce_mean, all_reduce_gradients, \
+    broadcast_parameters, all_reduce_running_maxima, all_reduce_static_ranges
 
-def cali_flat_quant(args, model, dataloader, dev, logger):
-    model.eval()
-    use_cache = model.config.use_cache
-    model.config.use_cache = False
-
-    # check trainable parameters
-    for name, param in model.named_parameters():
-        param.requires_grad = False
 
-    # activate AMP
-    if args.deactive_amp:
-        dtype = torch.float32
-        traincast = nullcontext
-    else:
-        dtype = torch.float16 if isinstance(model, transformers.LlamaForCausalLM) else torch.bfloat16
-        # Support both CUDA and NPU for autocast
-        if hasattr(torch, 'npu') and torch.npu.is_available():
-            traincast = functools.partial(torch.amp.autocast, device_type="npu", dtype=dtype)
-        else:
-            traincast = functools.partial(torch.amp.autocast, device_type="cuda", dtype=dtype)
+def compile_layer(layer, logger, traincast, *example_args, **example_kwargs):
+    """
+    torch.compile the calibration forward of a layer. Compilation is lazy, so the compiled layer is run
+    forward and backward once on an example batch, and the eager layer is returned if that fails.
+    """
+    try:
+        compiled = torch.compile(layer)
+        with traincast():
+            out = compiled(*example_args, **example_kwargs)[0]
+        out.float().pow(2).mean().backward()
+    except Exception as e:
+        logger.warning(f"torch.compile failed, falling back to eager mode: {type(e).__name__}: {e}")
+        compiled = layer
+    layer.zero_grad(set_to_none=True)
+    return compiled
 
-    # move embedding layer and first layer to target device
+def capture_layer_inputs(args, model, dataloader, dev, dtype, profiler, lazy_loader=None, sample_ids=None):
+    """
+    Inputs of the first decoder layer for the calibration samples (only those of sample_ids if given), with its
+    attention mask and position ids.
+    """
+    sample_ids = set(sample_ids) if sample_ids is not None else set(range(args.nsamples))
     layers = model.model.layers
-    layers[0] = layers[0].to(dev)
+    # move embedding layer and first layer to target device
+    if lazy_loader is None:
+        layers[0] = layers[0].to(dev)
     model.model.embed_tokens = model.model.embed_tokens.to(dev)
     if hasattr(model.model, "rotary_emb"):
         model.model.rotary_emb = model.model.rotary_emb.to(dev)
 
     # catch the first layer input
     inps = torch.zeros(
-        (args.nsamples, model.seqlen, model.config.hidden_size), dtype=dtype, device=dev
+        (len(sample_ids), model.seqlen, model.config.hidden_size), dtype=dtype, device=dev
     )
     cache = {"i": 0}
     class Catcher(nn.Module):
@@ -56,28 +66,80 @@ def cali_flat_quant(args, model, dataloader, dev, logger):
             cache["position_ids"] = kwargs["position_ids"]
             raise ValueError
     layers[0] = Catcher(layers[0])
-    with torch.no_grad():
-        for batch in dataloader:
-            if cache["i"] >= args.nsamples:
+    with torch.no_grad(), profiler.region("capture_inputs"):
+        for sample_id, batch in enumerate(dataloader):
+            if sample_id >= args.nsamples:
                 break
+            if sample_id not in sample_ids:
+                continue
             try:
                 sample = batch[0]
                 model(sample.to(dev))
             except ValueError:
                 pass
-    position_ids = cache["position_ids"]
-    attention_mask = cache["attention_mask"]
-    if attention_mask is not None:
-        attention_mask_batch = attention_mask.repeat(args.cali_bsz, 1, 1, 1).float()
-    else:
-        attention_mask_batch = None
-    
+
     # move embedding layer and first layer to cpu
     layers[0] = layers[0].module
-    layers[0] = layers[0].cpu()
+    if lazy_loader is None:
+        layers[0] = layers[0].cpu()
     model.model.embed_tokens = model.model.embed_tokens.cpu()
     if hasattr(model.model, "rotary_emb"):
         model.model.rotary_emb = model.model.rotary_emb.cpu()
+    return inps, cache["attention_mask"], cache["position_ids"]
+
+
+def cali_flat_quant(args, model, dataloader, dev, logger, store=None):
+    model.eval()
+    use_cache = model.config.use_cache
+    model.config.use_cache = False
+
+    # check trainable parameters
+    for name, param in model.named_parameters():
+        param.requires_grad = False
+
+    profiler = CaliProfiler(enabled=getattr(args, "cali_profile", False), device=dev)
+
+    # activate AMP
+    if args.deactive_amp:
+        dtype = torch.float32
+        traincast = nullcontext
+    else:
+        dtype = torch.float16 if isinstance(model, transformers.LlamaForCausalLM) else torch.bfloat16
+        # Support both CUDA and NPU for autocast
+        if hasattr(torch, 'npu') and torch.npu.is_available():
+            traincast = functools.partial(torch.amp.autocast, device_type="npu", dtype=dtype)
+        else:
+            traincast = functools.partial(torch.amp.autocast, device_type="cuda", dtype=dtype)
+
+    # the decoder layers of a lazily loaded model stay on the meta device until they are calibrated
+    lazy_loader = getattr(model, "lazy_loader", None)
+
+    # with a process group, every rank calibrates on a shard of each mini-batch and the gradients are averaged
+    group = get_group()
+    rank, world_size = (dist.get_rank(group), dist.get_world_size(group)) if group is not None else (0, 1)
+    sample_ids = None
+    if group is not None:
+        if store is not None:
+            raise NotImplementedError("The activation store holds all the samples, not the shards of the ranks.")
+        sample_ids = shard_sample_ids(args.nsamples, args.cali_bsz, rank, world_size)
+        logger.info(f"rank {rank}/{world_size} calibrates on {len(sample_ids)} samples")
+    cali_bsz = args.cali_bsz // world_size
+    nsamples = len(sample_ids) if sample_ids is not None else args.nsamples
+
+    layers = model.model.layers
+    if store is not None and store.complete:
+        # the fp activation chain of a previous calibration on the same samples
+        inps, attention_mask, position_ids = store.load_meta(args.nsamples, dev, dtype)
+    else:
+        inps, attention_mask, position_ids = capture_layer_inputs(args, model, dataloader, dev, dtype, profiler, lazy_loader,
+                                                                  sample_ids=sample_ids)
+        if store is not None:
+            store.save_inputs(0, inps)
+    if attention_mask is not None:
+        attention_mask_batch = attention_mask.repeat(cali_bsz, 1, 1, 1).float()
+    else:
+        attention_mask_batch = None
+    
     # raise ValueError("Only support for llama-2/Llama-3/qwen-2 now")
     # Clear memory based on device type
     if hasattr(torch, 'npu') and torch.npu.is_available():
@@ -94,22 +156,51 @@ def cali_flat_quant(args, model, dataloader, dev, logger):
     flat_parameters = {}
     num_train_layer = len(layers)
     mse_dict = {}
+    steps_per_epoch = args.nsamples // args.cali_bsz
+    budget = None
+    sensitivity = {}
+    if getattr(args, "adaptive_epochs", False):
+        budget = EpochBudget(num_train_layer, args.epochs, total=getattr(args, "epoch_budget", None),
+                             min_epochs=getattr(args, "min_epochs", 3), max_epochs=getattr(args, "max_epochs", None))
     for i in range(num_train_layer):
         logger.info(f"========= Layer {i} =========")
+        profiler.layer_start(i)
         dtype_dict = {}
-        layer = layers[i].to(dev)
-        for name, param in layer.named_parameters():
-            dtype_dict[name] = param.dtype
-        with torch.no_grad():
-            layer.float()
-
-        layer.self_attn._ori_mode = True
-        layer.mlp._ori_mode = True
-        with torch.no_grad():
-            for j in range(args.nsamples):
-                fp_outs[j] = layer(fp_inps[j].unsqueeze(0), attention_mask=attention_mask, position_ids=position_ids)[0]
-        layer.self_attn._ori_mode = False
-        layer.mlp._ori_mode = False
+        with profiler.region("to_device", layer=i):
+            if lazy_loader is not None:
+                lazy_loader.materialize(layers[i], i)
+            layer = layers[i].to(dev)
+            for name, param in layer.named_parameters():
+                dtype_dict[name] = param.dtype
+            with torch.no_grad():
+                layer.float()
+
+        out_energy = 0.
+        if store is not None and store.complete:
+            with torch.no_grad(), profiler.region("fp_reference", layer=i):
+                fp_outs = store.load_inputs(i + 1, dev, dtype)
+                store.load_smax(i, layer)
+                if budget is not None:
+                    out_energy = fp_outs.float().pow(2).mean(dim=(1, 2)).sum()
+        else:
+            layer.self_attn._ori_mode = True
+            layer.mlp._ori_mode = True
+            with torch.no_grad(), profiler.region("fp_reference", layer=i):
+                for j in range(nsamples):
+                    fp_outs[j] = layer(fp_inps[j].unsqueeze(0), attention_mask=attention_mask, position_ids=position_ids)[0]
+                    if budget is not None:
+                        out_energy += fp_outs[j].float().pow(2).mean()
+            layer.self_attn._ori_mode = False
+            layer.mlp._ori_mode = False
+            if store is not None:
+                with profiler.region("store", layer=i):
+                    store.save_inputs(i + 1, fp_outs)
+                    store.save_smax(i, layer)
+        if group is not None:
+            if budget is not None:
+                out_energy = all_reduce_mean(out_energy, group, dev) * world_size
+            if args.diag_init == "sq_style":
+                all_reduce_running_maxima(layer, group)
         if args.diag_init == "sq_style":
             layer.self_attn.init_diag_scale(alpha=args.diag_alpha)
             layer.mlp.init_diag_scale(alpha=args.diag_alpha)
@@ -133,9 +224,19 @@ def cali_flat_quant(args, model, dataloader, dev, logger):
         if args.lac:
             trained_params.append({"params": get_n_set_parameters_byname(layer, ["clip_factor_a", ]), "lr": args.flat_lr * 10})
             paras_name.append("clip_factor_a")
+        params = [param for param_group in trained_params for param in param_group["params"]]
+        if group is not None:
+            broadcast_parameters(params, group)
 
+        if budget is not None:
+            num_epochs = budget.plan(i)
+            plateau = MSEPlateau(patience=getattr(args, "plateau_patience", 2), rel_tol=getattr(args, "plateau_tol", 1e-2),
+                                 min_epochs=budget.min_epochs)
+            cooling_down = False
+        else:
+            num_epochs = args.epochs
         optimizer = torch.optim.AdamW(trained_params)
-        scheduler_main = torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=args.epochs * (args.nsamples // args.cali_bsz), eta_min=args.flat_lr * 1e-3)
+        scheduler_main = torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=num_epochs * steps_per_epoch, eta_min=args.flat_lr * 1e-3)
         if args.warmup:
             scheduler_warmup = torch.optim.lr_scheduler.LinearLR(optimizer, start_factor=0.01, total_iters=16)
             scheduler = torch.optim.lr_scheduler.ChainedScheduler([scheduler_warmup, scheduler_main])
@@ -143,35 +244,114 @@ def cali_flat_quant(args, model, dataloader, dev, logger):
             scheduler = scheduler_main
         # check_params_grad(layer)
         # set_quantizer_state(layer, False)
-        for epoch in range(args.epochs):
+        train_layer = layer
+        if getattr(args, "compile", False):
+            with profiler.region("compile", layer=i):
+                train_layer = compile_layer(layer, logger, traincast, fp_inps[:cali_bsz],
+                                            attention_mask=attention_mask_batch, position_ids=position_ids)
+        epoch = 0
+        while epoch < num_epochs:
             mse = 0
             start_tick = time.time()
             with traincast():
-                for j in range(args.nsamples // args.cali_bsz):
-                    index = j * args.cali_bsz
-                    quant_out = layer(fp_inps[index:index+args.cali_bsz,], attention_mask=attention_mask_batch, position_ids=position_ids)[0]
-                    loss = loss_func(fp_outs[index:index+args.cali_bsz,], quant_out)
-                    mse += loss.detach().cpu()
-                    loss = loss / loss.clone().detach()
-                    optimizer.zero_grad()
-                    loss.backward()
-                    optimizer.step()
-                    scheduler.step()
+                for j in range(steps_per_epoch):
+                    index = j * cali_bsz
+                    step = epoch * steps_per_epoch + j
+                    with profiler.region("forward", layer=i, step=step):
+                        quant_out = train_layer(fp_inps[index:index+cali_bsz,], attention_mask=attention_mask_batch, position_ids=position_ids)[0]
+                        loss = loss_func(fp_outs[index:index+cali_bsz,], quant_out)
+                        mse += loss.detach().cpu()
+                        if group is not None:
+                            # normalized by the loss of the whole mini-batch
+                            loss = loss / all_reduce_mean(loss.detach(), group, dev)
+                        else:
+                            loss = loss / loss.clone().detach()
+                    with profiler.region("backward", layer=i, step=step):
+                        optimizer.zero_grad()
+                        loss.backward()
+                        if group is not None:
+                            all_reduce_gradients(params, group)
+                    with profiler.region("optimizer", layer=i, step=step):
+                        optimizer.step()
+                        scheduler.step()
+            if group is not None:
+                mse = all_reduce_mean(mse, group, dev)
             cur_lr = optimizer.state_dict()['param_groups'][0]['lr']
             logger.info(f"layer {i} lwc lac iter {epoch}, lr {cur_lr:.8f}  time {time.time() - start_tick:.6f}s, mse: {mse:.8f}" )
+            if budget is not None:
+                new_epochs = num_epochs
+                converged = plateau.step(float(mse))
+                if epoch == 0:
+                    # more epochs for the layers that are hard to fit
+                    new_epochs = budget.extend(i, num_epochs, float(mse) / steps_per_epoch / (float(out_energy) / args.nsamples))
+                elif converged and not cooling_down:
+                    # anneal the learning rate over one last epoch
+                    new_epochs = min(num_epochs, epoch + 2)
+                    cooling_down = True
+                if new_epochs != num_epochs:
+                    num_epochs = new_epochs
+                    set_cosine_horizon(scheduler_main, num_epochs * steps_per_epoch)
+            epoch += 1
+        mse_dict[i] = float(mse) / steps_per_epoch if epoch > 0 else None
+        if rank == 0:
+            with open(os.path.join(args.exp_dir, "cali_mse.json"), "w") as f:
+                json.dump(mse_dict, f, indent=2)
+        if budget is not None:
+            budget.finish(i, epoch)
+            logger.info(f"layer {i} calibrated for {epoch} epochs, {budget.spent}/{budget.total} epochs of the budget used")
 
+        del train_layer
+        if getattr(args, "a_static", False):
+            # static activation ranges of the calibrated layer
+            with profiler.region("observe", layer=i), torch.no_grad(), traincast():
+                observe_static_ranges(layer, args.a_static_percentile, args.a_static_momentum)
+                for j in range(steps_per_epoch):
+                    index = j * cali_bsz
+                    layer(fp_inps[index:index+cali_bsz,], attention_mask=attention_mask_batch, position_ids=position_ids)
+                set_static_ranges(layer)
+                if group is not None:
+                    all_reduce_static_ranges(layer, group)
+            paras_name.append("static_x")
+        if getattr(args, "bit_budget", None) is not None:
+            # MSE of the layer output with each projection at each candidate bits, for the bit allocation
+            with profiler.region("sensitivity", layer=i), traincast():
+                candidates = sorted(set(args.bit_candidates) | {args.w_bits})
+                nbatches = min(steps_per_epoch, max(1, args.sensitivity_samples // args.cali_bsz))
+                layer_sensitivity = measure_layer_sensitivity(layer, fp_inps, fp_outs, loss_func, candidates, args.a_bits,
+                                                              cali_bsz, nbatches,
+                                                              attention_mask=attention_mask_batch, position_ids=position_ids)
+            for unit, unit_sensitivity in layer_sensitivity.items():
+                if group is not None:
+                    unit_sensitivity["mse"] = {bits: all_reduce_mean(mse, group, dev)
+                                               for bits, mse in unit_sensitivity["mse"].items()}
+                sensitivity[f"layers.{i}.{unit}"] = unit_sensitivity
+            if rank == 0:
+                with open(os.path.join(args.exp_dir, "bit_sensitivity.json"), "w") as f:
+                    json.dump(sensitivity, f, indent=2)
         fp_inps, fp_outs = fp_outs, fp_inps
-        layers[i] = layer.to("cpu")
-        flat_parameters[i] = get_paras_dict_by_name(layer, required_names=paras_name)
-        torch.save(flat_parameters, os.path.join(args.exp_dir, f"flat_parameters.pth"))
+        with profiler.region("to_host", layer=i):
+            layers[i] = layer.to("cpu")
+        with profiler.region("save_params", layer=i):
+            flat_parameters[i] = get_paras_dict_by_name(layer, required_names=paras_name)
+            if rank == 0:
+                torch.save(flat_parameters, os.path.join(args.exp_dir, f"flat_parameters.pth"))
         logger.info("saved paramaters at {}".format(os.path.join(args.exp_dir, f"flat_parameters.pth")))
+        profiler.layer_end(i)
         for name, param in layer.named_parameters():
             param.requires_grad = False
             if name in dtype_dict.keys():
                 param.data = param.to(dtype_dict[name])
+        if lazy_loader is not None:
+            with profiler.region("release", layer=i):
+                lazy_loader.release(layer, i, save=rank == 0)
+                if group is not None:
+                    dist.barrier(group)
         del layer
         torch.cuda.empty_cache()
 
+    profiler.save(args.exp_dir, logger)
+    if store is not None and not store.complete:
+        store.save_meta(args.nsamples, attention_mask, position_ids)
     del inps, fp_inps, fp_outs
     gc.collect()
     torch.cuda.empty_cache()
@@ -7,6 +7,7 @@ import logging
 
 from flatquant.utils import cleanup_memory
 from flatquant.quant_utils import WeightQuantizer
+from flatquant.bit_allocation import module_bits
 
 torch.backends.cuda.matmul.allow_tf32 = False
 torch.backends.cudnn.allow_tf32 = False
@@ -149,7 +150,7 @@ class GPTQ:
         
         
 @torch.no_grad()
-def gptq_fwrd(model, dataloader, dev, args):
+def gptq_fwrd(model, dataloader, dev, args, bit_config=None):
     '''
     From GPTQ repo 
     TODO: Make this function general to support both OPT and LLaMA models
@@ -159,11 +160,14 @@ def gptq_fwrd(model, dataloader, dev, args):
     use_cache = model.config.use_cache
     model.config.use_cache = False
     layers = model.model.layers
+    lazy_loader = getattr(model, "lazy_loader", None)
 
     model.model.embed_tokens = model.model.embed_tokens.to(dev)
     model.model.norm = model.model.norm.to(dev)
     if hasattr(model.model, "rotary_emb"):
         model.model.rotary_emb = model.model.rotary_emb.to(dev)
+    if lazy_loader is not None:
+        lazy_loader.materialize(layers[0], 0)
     layers[0] = layers[0].to(dev)
 
     dtype = next(iter(model.parameters())).dtype
@@ -214,6 +218,8 @@ def gptq_fwrd(model, dataloader, dev, args):
     #         ]
     for i in range(len(layers)):
         print(f'\nLayer {i}:', flush=True, end=' ')
+        if lazy_loader is not None:
+            lazy_loader.materialize(layers[i], i)
         layer = layers[i].to(dev)
         full = find_qlayers(layer, layers=[torch.nn.Linear])
         for names in sequential:
@@ -222,9 +228,9 @@ def gptq_fwrd(model, dataloader, dev, args):
             gptq = {}
             for name in subset:
                 print(f'{name}', end='  ', flush=True)
-                layer_weight_bits = args.w_bits
+                layer_weight_bits, _ = module_bits(bit_config, 'model.layers.%d.%s' % (i, name), args.w_bits, args.a_bits)
                 layer_weight_sym = not(args.w_asym)
-                if 'lm_head' in name:
+                if 'lm_head' in name or layer_weight_bits == 16:
                     layer_weight_bits = 16
                     continue
                 gptq[name] = GPTQ(subset[name])
@@ -238,14 +244,14 @@ def gptq_fwrd(model, dataloader, dev, args):
                     gptq[name].add_batch(inp[0].data, out.data)
                 return tmp
             handles = []
-            for name in subset:
+            for name in gptq:
                 handles.append(subset[name].register_forward_hook(add_batch(name)))
             for j in range(args.nsamples):
                 outs[j] = layer(inps[j].unsqueeze(0), attention_mask=attention_mask, position_ids=position_ids)[0]
             for h in handles:
                 h.remove()
 
-            for name in subset:
+            for name in gptq:
                 layer_w_groupsize = args.w_groupsize
                 gptq[name].fasterquant(
                     percdamp=args.percdamp, groupsize=layer_w_groupsize, actorder=args.act_order, static_groups=False
@@ -257,6 +263,8 @@ def gptq_fwrd(model, dataloader, dev, args):
             outs[j] = layer(inps[j].unsqueeze(0), attention_mask=attention_mask, position_ids=position_ids)[0]
 
         layers[i] = layer.cpu()
+        if lazy_loader is not None:
+            lazy_loader.release(layers[i], i)
         del layer
         del gptq 
         torch.cuda.empty_cache()
@@ -270,26 +278,29 @@ def gptq_fwrd(model, dataloader, dev, args):
 
 
 @torch.no_grad()
-def rtn_fwrd(model, dev, args):
+def rtn_fwrd(model, dev, args, bit_config=None):
     '''
     From GPTQ repo 
     TODO: Make this function general to support both OPT and LLaMA models
     '''
     assert args.w_groupsize ==-1, "Groupsize not supported in RTN!"
     layers = model.model.layers
+    lazy_loader = getattr(model, "lazy_loader", None)
     torch.cuda.empty_cache()
 
     quantizers = {}
 
     for i in tqdm.tqdm(range(len(layers)), desc="(RtN Quant.) Layers"):
+        if lazy_loader is not None:
+            lazy_loader.materialize(layers[i], i)
         layer = layers[i].to(dev)
 
         subset = find_qlayers(layer,
                                             layers=[torch.nn.Linear])
 
         for name in subset:
-            layer_weight_bits = args.w_bits
-            if 'lm_head' in name:
+            layer_weight_bits, _ = module_bits(bit_config, 'model.layers.%d.%s' % (i, name), args.w_bits, args.a_bits)
+            if 'lm_head' in name or layer_weight_bits == 16:
                 layer_weight_bits = 16
                 continue
 
@@ -303,6 +314,8 @@ def rtn_fwrd(model, dev, args):
             subset[name].weight.data = quantizer.quantize(W).to(w_dtype)
             quantizers['model.layers.%d.%s' % (i, name)] = quantizer.cpu()
         layers[i] = layer.cpu()
+        if lazy_loader is not None:
+            lazy_loader.release(layers[i], i)
         torch.cuda.empty_cache()
         del layer
             
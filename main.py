@@ -1,3 +1,4 @@
+import os
 import transformers
 import torch_npu
 
@@ -8,13 +9,17 @@ import flatquant.data_utils as data_utils
 import flatquant.eval_utils as eval_utils
 import flatquant.train_utils as train_utils
 import flatquant.flat_utils as flat_utils
+import flatquant.bit_allocation as bit_allocation
+from flatquant.activation_store import ActivationStore
 import gptq_utils
 
 def main():
     args, logger = args_utils.parser_gen()
     utils.seed_everything(seed=args.seed)
 
-    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token)
+    model, apply_flatquant_to_model = model_utils.get_model(
+        args.model, args.hf_token, offload_dir=os.path.join(args.exp_dir, "lazy_layers") if args.lazy_load else None,
+        attn_impl=args.attn_impl)
     model.eval()
     tokenizer = transformers.AutoTokenizer.from_pretrained(args.model, use_fast=False, use_auth_token=args.hf_token)
 
@@ -26,27 +31,42 @@ def main():
     )
     logger.info("Finished loading training data.")
 
+    bit_config = None
     if args.quantize:
         model = apply_flatquant_to_model(args, model)
+        if args.bit_config is not None:
+            bit_config = bit_allocation.load_bit_config(args.bit_config)
+            bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
         logger.info("Finished applying FlatQuant to model.")
         if args.resume:
             flat_utils.load_flat_parameters(args, model)
         elif args.reload_matrix:
             flat_utils.load_flat_matrices(args, model, path=args.matrix_path)
         elif (args.cali_trans or args.add_diag or args.lwc or args.lac):
-            train_utils.cali_flat_quant(args, model, trainloader, utils.DEV, logger=logger)
+            store = ActivationStore(args.activation_store) if args.activation_store is not None else None
+            train_utils.cali_flat_quant(args, model, trainloader, utils.DEV, logger=logger, store=store)
+        if args.bit_budget is not None:
+            bit_config = bit_allocation.plan_from_calibration(args, logger=logger)
+            bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
         if args.save_matrix and not args.reload_matrix:
             flat_utils.save_flat_matrices(args, model)
-        flat_utils.reparameterize_model(model)
+        flat_utils.reparameterize_model(model, num_workers=args.rep_workers, device=args.rep_device)
         logger.info("Finished reparameterize model.")
 
     if args.w_bits < 16:
         save_dict = {}
         if args.gptq: # GPTQ Weight Quantization
-            quantizers = gptq_utils.gptq_fwrd(model, trainloader, utils.DEV, args)
+            quantizers = gptq_utils.gptq_fwrd(model, trainloader, utils.DEV, args, bit_config=bit_config)
         else: # RTN Weight Quantization
-            quantizers = gptq_utils.rtn_fwrd(model, utils.DEV, args)
+            quantizers = gptq_utils.rtn_fwrd(model, utils.DEV, args, bit_config=bit_config)
         save_dict["w_quantizers"] = quantizers
+        if args.export_int4:
+            flat_utils.save_int4_checkpoint(args, model, quantizers, bit_config=bit_config)
+
+    if args.lazy_load:
+        # the layers were folded and quantized one at a time, the evaluation needs the whole model in memory
+        logger.info(f"Finished with --lazy_load, the quantized layers are in {model.lazy_loader.offload_dir}.")
+        return
 
     if args.distribute_model:
         utils.distribute_model(model)
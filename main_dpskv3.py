@@ -9,6 +9,7 @@ from transformers import AutoTokenizer
 from safetensors.torch import load_model
 
 from deepseek_v3.model import Transformer, ModelArgs, MLP, MoE
+from deepseek_v3.generate import generate
 
 from contextlib import nullcontext
 
@@ -21,69 +22,11 @@ import logging
 from termcolor import colored
 from datetime import datetime
 
-from typing import List
 from deepseek_v3.eval_utils import ppl_eval
 from flatquant.model_tools.deepseekv3_utils import FlatQuantMLP, FlatQuantMLA, FlatQuantMoE
 from flatquant.function_utils import set_require_grad_all, get_n_set_parameters_byname, get_paras_dict_by_name, check_params_grad
 
 
-def sample(logits, temperature: float = 1.0):
-    """
-    Samples a token from the logits using temperature scaling.
-
-    Args:
-        logits (torch.Tensor): The logits tensor for token predictions.
-        temperature (float, optional): Temperature for scaling logits. Defaults to 1.0.
-
-    Returns:
-        torch.Tensor: The sampled token.
-    """
-    logits = logits / max(temperature, 1e-5)
-    probs = torch.softmax(logits, dim=-1)
-    return probs.div_(torch.empty_like(probs).exponential_(1)).argmax(dim=-1)
-
-
-@torch.inference_mode()
-def generate(
-    model: Transformer,
-    prompt_tokens: List[List[int]],
-    max_new_tokens: int,
-    eos_id: int,
-    temperature: float = 1.0
-) -> List[List[int]]:
-
-    prompt_lens = [len(t) for t in prompt_tokens]
-    assert max(prompt_lens) <= model.max_seq_len, f"Prompt length exceeds model maximum sequence length (max_seq_len={model.max_seq_len})"
-    total_len = min(model.max_seq_len, max_new_tokens + max(prompt_lens))
-    # Use device from utils for NPU support
-    from flatquant.utils import DEV
-    tokens = torch.full((len(prompt_tokens), total_len), -1, dtype=torch.long, device=DEV)
-    for i, t in enumerate(prompt_tokens):
-        tokens[i, :len(t)] = torch.tensor(t, dtype=torch.long, device=DEV)
-    prev_pos = 0
-    finished = torch.tensor([False] * len(prompt_tokens), device=DEV)
-    prompt_mask = tokens != -1
-    for cur_pos in range(min(prompt_lens), total_len):
-        logits = model.forward(tokens[:, prev_pos:cur_pos], prev_pos)
-        if temperature > 0:
-            next_token = sample(logits, temperature)
-        else:
-            next_token = logits.argmax(dim=-1)
-        next_token = torch.where(prompt_mask[:, cur_pos], tokens[:, cur_pos], next_token)
-        tokens[:, cur_pos] = next_token
-        finished |= torch.logical_and(~prompt_mask[:, cur_pos], next_token == eos_id)
-        prev_pos = cur_pos
-        if finished.all():
-            break
-    completion_tokens = []
-    for i, toks in enumerate(tokens.tolist()):
-        toks = toks[prompt_lens[i]:prompt_lens[i]+max_new_tokens]
-        if eos_id in toks:
-            toks = toks[:toks.index(eos_id)]
-        completion_tokens.append(toks)
-    return completion_tokens
-
-
 def create_logger(exp_dir, dist_rank=0, name=''):
     # create logger
     os.makedirs(exp_dir, exist_ok=True)
@@ -304,6 +247,7 @@ def cali_flat_quant(args, model_args, model, dataloader, dev, rank, logger):
     else:
         num_train_layer = len(layers)
     mse_dict = {}
+    expert_parallel = getattr(args, "expert_parallel", False) and dist.is_initialized() and dist.get_world_size() > 1
     for i in range(num_train_layer):
         torch.distributed.barrier()
         logger.info(f"========= Layer {i} =========")
@@ -315,6 +259,11 @@ def cali_flat_quant(args, model_args, model, dataloader, dev, rank, logger):
             with torch.no_grad():
                 layer.float() # NOTE: here
 
+        moe_ep = expert_parallel and isinstance(layer.ffn, FlatQuantMoE)
+        if moe_ep:
+            layer.ffn.expert_parallel = True
+            layer.ffn.broadcast_shared_parameters()
+
         torch.distributed.barrier()
         layer.attn._ori_mode = True
         layer.ffn._ori_mode = True
@@ -365,12 +314,16 @@ def cali_flat_quant(args, model_args, model, dataloader, dev, rank, logger):
                     loss = loss / loss.clone().detach()
                     optimizer.zero_grad()
                     loss.backward()
+                    if moe_ep:
+                        layer.ffn.all_reduce_shared_grads()
                     optimizer.step()
                     scheduler.step()
             cur_lr = optimizer.state_dict()['param_groups'][0]['lr']
             logger.info(f"layer {i} lwc lac iter {epoch}, rank {rank}, lr {cur_lr:.8f}  time {time.time() - start_tick:.6f}s, mse: {mse:.8f}" )
 
         fp_inps, fp_outs = fp_outs, fp_inps
+        if moe_ep:
+            layer.ffn.expert_parallel = False
         layers[i] = layer.to("cpu")
         flat_parameters[i] = get_paras_dict_by_name(layer, required_names=paras_name)
         torch.save(flat_parameters, os.path.join(args.exp_dir, f"flat_parameters_{rank}.pth"))
@@ -588,6 +541,8 @@ if __name__ == "__main__":
     
     parser.add_argument('--v3_not_last', action="store_true", default=False, 
                         help='Not QUANT the last two layers of the deepseek V3/R1. ')
+    parser.add_argument("--expert_parallel", default=False, action="store_true",
+                        help="Calibrate the MoE layers expert-parallel: tokens are all-to-all routed to the rank owning the expert.")
     parser.add_argument("--output_dir", type=str, default="./outputs", help="Output directory path.")
     parser.add_argument("--exp_name", type=str, default="exp", help="Experiment name.")
     
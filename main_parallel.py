@@ -10,6 +10,8 @@ import flatquant.data_utils as data_utils
 import flatquant.eval_utils as eval_utils
 import flatquant.train_utils as train_utils
 import flatquant.flat_utils as flat_utils
+import flatquant.bit_allocation as bit_allocation
+from flatquant.data_parallel import get_group
 import gptq_utils
 
 def setup_distributed():
@@ -33,7 +35,9 @@ def main():
     args, logger = args_utils.parser_gen()
     utils.seed_everything(seed=args.seed)
 
-    model, apply_flatquant_to_model = model_utils.get_model(args.model, args.hf_token)
+    model, apply_flatquant_to_model = model_utils.get_model(
+        args.model, args.hf_token, offload_dir=os.path.join(args.exp_dir, "lazy_layers") if args.lazy_load else None,
+        attn_impl=args.attn_impl)
     model.eval()
     tokenizer = transformers.AutoTokenizer.from_pretrained(args.model, use_fast=False, use_auth_token=args.hf_token)
 
@@ -46,8 +50,12 @@ def main():
     if rank == 0:
         logger.info("Finished loading training data.")
 
+    bit_config = None
     if args.quantize:
         model = apply_flatquant_to_model(args, model)
+        if args.bit_config is not None:
+            bit_config = bit_allocation.load_bit_config(args.bit_config)
+            bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
         if rank == 0:
             logger.info("Finished applying FlatQuant to model.")
         if args.resume:
@@ -55,20 +63,35 @@ def main():
         elif args.reload_matrix:
             flat_utils.load_flat_matrices(args, model, path=args.matrix_path)
         elif (args.cali_trans or args.add_diag or args.lwc or args.lac):
-            train_utils.cali_flat_quant(args, model, trainloader, utils.DEV, logger=logger)
+            # the calibration samples are sharded over the ranks of the process group
+            cali_dev = torch.device("cuda", local_rank) if world_size > 1 else utils.DEV
+            train_utils.cali_flat_quant(args, model, trainloader, cali_dev, logger=logger)
+        if args.bit_budget is not None:
+            bit_config = bit_allocation.plan_from_calibration(args, logger=logger, group=get_group())
+            bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
+        if args.lazy_load and rank != 0:
+            # the offloaded layers are folded and quantized by rank 0 only
+            return
         if args.save_matrix and not args.reload_matrix:
             flat_utils.save_flat_matrices(args, model)
-        flat_utils.reparameterize_model(model)
+        flat_utils.reparameterize_model(model, num_workers=args.rep_workers, device=args.rep_device)
         if rank == 0:
             logger.info("Finished reparameterize model.")
 
     if args.w_bits < 16:
         save_dict = {}
         if args.gptq: # GPTQ Weight Quantization
-            quantizers = gptq_utils.gptq_fwrd(model, trainloader, utils.DEV, args)
+            quantizers = gptq_utils.gptq_fwrd(model, trainloader, utils.DEV, args, bit_config=bit_config)
         else: # RTN Weight Quantization
-            quantizers = gptq_utils.rtn_fwrd(model, utils.DEV, args)
+            quantizers = gptq_utils.rtn_fwrd(model, utils.DEV, args, bit_config=bit_config)
         save_dict["w_quantizers"] = quantizers
+        if args.export_int4 and rank == 0:
+            flat_utils.save_int4_checkpoint(args, model, quantizers, bit_config=bit_config)
+
+    if args.lazy_load:
+        # the layers were folded and quantized one at a time, the evaluation needs the whole model in memory
+        logger.info(f"Finished with --lazy_load, the quantized layers are in {model.lazy_loader.offload_dir}.")
+        return
 
     # 分布式处理
     if world_size > 1:
@@ -0,0 +1,167 @@
+import os
+import copy
+import json
+import time
+import itertools
+
+import torch.multiprocessing as mp
+
+import flatquant.utils as utils
+import flatquant.args_utils as args_utils
+import flatquant.model_utils as model_utils
+import flatquant.data_utils as data_utils
+import flatquant.eval_utils as eval_utils
+import flatquant.train_utils as train_utils
+import flatquant.flat_utils as flat_utils
+import flatquant.bit_allocation as bit_allocation
+from flatquant.activation_store import ActivationStore
+import gptq_utils
+
+# the configs share the fp activations of the calibration samples, which depend on these arguments
+SHARED_ARGS = ["model", "cali_dataset", "nsamples", "seed", "deactive_amp", "activation_store"]
+
+
+def cast_value(default, value):
+    if isinstance(default, bool):
+        return value.lower() in ("1", "true", "yes")
+    if default is None:
+        for cast in (int, float):
+            try:
+                return cast(value)
+            except ValueError:
+                pass
+        return value
+    return type(default)(value)
+
+
+def parse_sweep(args):
+    """Configs of the grid args.sweep = ["name=v1,v2", ...], with the values cast to the type of the argument."""
+    names, values = [], []
+    for item in args.sweep:
+        name, _, choices = item.partition("=")
+        if not hasattr(args, name) or not choices:
+            raise ValueError(f"--sweep expects name=v1,v2 with the name of an argument, but got {item}.")
+        if name in SHARED_ARGS:
+            raise ValueError(f"--sweep {name} would change the activations shared by the configs.")
+        names.append(name)
+        values.append([cast_value(getattr(args, name), value) for value in choices.split(",")])
+    return [dict(zip(names, config)) for config in itertools.product(*values)]
+
+
+def config_name(config):
+    return "_".join(f"{name}={value}" for name, value in config.items())
+
+
+def run_config(args, config, store_path, dev, testloader=None):
+    """Calibrates the model with the overrides of config on the activation store, returns a row of the table."""
+    args = copy.copy(args)
+    for name, value in config.items():
+        setattr(args, name, value)
+    args.quantize = (args.w_bits < 16) or (args.a_bits < 16) or (args.q_bits < 16) or (args.k_bits < 16) or (args.v_bits < 16)
+    args.exp_dir = os.path.join(args.exp_dir, "sweep", config_name(config))
+    os.makedirs(args.exp_dir, exist_ok=True)
+    logger = args_utils.create_logger(args.exp_dir, name=config_name(config))
+    logger.info(f"sweep config {config} on {dev}")
+    utils.seed_everything(seed=args.seed)
+
+    model, apply_flatquant_to_model = model_utils.get_model(
+        args.model, args.hf_token, offload_dir=os.path.join(args.exp_dir, "lazy_layers") if args.lazy_load else None,
+        attn_impl=args.attn_impl)
+    model.eval()
+    model = apply_flatquant_to_model(args, model)
+    store = ActivationStore(store_path)
+    trainloader = None
+    if not store.complete or args.gptq:
+        trainloader = data_utils.get_loaders(
+            args, args.cali_dataset, nsamples=args.nsamples,
+            seed=args.seed, model=args.model,
+            seqlen=model.seqlen, eval_mode=False
+        )
+    tick = time.time()
+    train_utils.cali_flat_quant(args, model, trainloader, dev, logger=logger, store=store)
+    with open(os.path.join(args.exp_dir, "cali_mse.json")) as f:
+        layer_mse = json.load(f)
+    result = dict(config, cali_time=time.time() - tick, mse=sum(mse for mse in layer_mse.values() if mse is not None))
+
+    if testloader is not None:
+        bit_config = None
+        if args.bit_budget is not None:
+            bit_config = bit_allocation.plan_from_calibration(args, logger=logger)
+            bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
+        flat_utils.reparameterize_model(model, num_workers=args.rep_workers, device=args.rep_device)
+        if args.w_bits < 16:
+            if args.gptq:
+                gptq_utils.gptq_fwrd(model, trainloader, dev, args, bit_config=bit_config)
+            else:
+                gptq_utils.rtn_fwrd(model, dev, args, bit_config=bit_config)
+        model.to(dev)
+        result["wikitext2_ppl"] = eval_utils.ppl_eval(model, testloader)
+    logger.info(result)
+    with open(os.path.join(args.exp_dir, "sweep_result.json"), "w") as f:
+        json.dump(result, f, indent=2)
+    return result
+
+
+_device = None
+
+
+def _init_worker(devices):
+    global _device
+    _device = devices.get()
+
+
+def _run_on_worker(task):
+    args, config, store_path, testloader = task
+    return run_config(args, config, store_path, _device, testloader)
+
+
+def report(results, exp_dir, logger):
+    key = "wikitext2_ppl" if all("wikitext2_ppl" in result for result in results) else "mse"
+    results = sorted(results, key=lambda result: result[key])
+    columns = list(results[0].keys())
+    widths = [max(len(column), 12) for column in columns]
+    fmt = lambda value: f"{value:.6g}" if isinstance(value, float) else str(value)
+    logger.info("  ".join(column.rjust(width) for column, width in zip(columns, widths)))
+    for result in results:
+        logger.info("  ".join(fmt(result[column]).rjust(width) for column, width in zip(columns, widths)))
+    path = os.path.join(exp_dir, "sweep_results.json")
+    with open(path, "w") as f:
+        json.dump(results, f, indent=2)
+    logger.info(f"saved the results of {len(results)} configs at {path}")
+
+
+def main():
+    args, logger = args_utils.parser_gen()
+    if args.sweep is None:
+        raise ValueError("sweep.py needs a grid of configs, e.g. --sweep flat_lr=1e-5,5e-5 diag_alpha=0.3,0.5.")
+    if args.sweep_eval and args.lazy_load:
+        raise ValueError("--sweep_eval needs the whole model in host memory, it cannot be used with --lazy_load.")
+    configs = parse_sweep(args)
+    store_path = args.activation_store or os.path.join(args.exp_dir, "activation_store")
+    devices = args.sweep_devices or [str(utils.DEV)]
+    testloader = None
+    if args.sweep_eval:
+        testloader = data_utils.get_loaders(
+            args, "wikitext2", seed=args.seed, model=args.model, seqlen=2048, hf_token=args.hf_token, eval_mode=True
+        )
+
+    results = []
+    if not ActivationStore(store_path).complete:
+        # the first config fills the activation store
+        results.append(run_config(args, configs[0], store_path, devices[0], testloader))
+        configs = configs[1:]
+    if len(devices) == 1:
+        results += [run_config(args, config, store_path, devices[0], testloader) for config in configs]
+    elif configs:
+        ctx = mp.get_context("spawn")
+        queue = ctx.Queue()
+        for dev in devices:
+            queue.put(dev)
+        with ctx.Pool(len(devices), initializer=_init_worker, initargs=(queue,)) as pool:
+            results += pool.map(_run_on_worker, [(args, config, store_path, testloader) for config in configs],
+                                chunksize=1)
+    report(results, args.exp_dir, logger)
+
+
+if __name__ == '__main__':
+    main()
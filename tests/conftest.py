@@ -0,0 +1,24 @@
+import types
+
+import pytest
+import torch
+
+
+@pytest.fixture
+def flat_args():
+    """
+    Builds the args of FlatQuantizedLinear: W4A4, symmetric, per-channel weights and per-token activations with
+    learnable weight and activation clipping. Keyword arguments override or add fields.
+    """
+    def make(**overrides):
+        args = dict(w_bits=4, a_bits=4, w_asym=False, a_asym=False, lac=True, lwc=True, a_groupsize=-1)
+        args.update(overrides)
+        return types.SimpleNamespace(**args)
+    return make
+
+
+@pytest.fixture
+def keep_init(monkeypatch):
+    """The model tools call skip_initialization, which replaces the torch.nn.init functions of the process."""
+    for name in ("kaiming_uniform_", "uniform_", "normal_"):
+        monkeypatch.setattr(torch.nn.init, name, getattr(torch.nn.init, name))
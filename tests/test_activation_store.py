@@ -0,0 +1,37 @@
+import pytest
+import torch
+
+from flatquant.activation_store import ActivationStore
+
+
+class _Layer(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.mlp = torch.nn.Module()
+        self.mlp.up_smax = torch.ones(4) * 1e-5
+
+
+def test_store_roundtrip(tmp_path):
+    torch.manual_seed(0)
+    store = ActivationStore(str(tmp_path))
+    inps, outs = torch.randn(2, 3, 4), torch.randn(2, 3, 4)
+    store.save_inputs(0, inps)
+    layer = _Layer()
+    layer.mlp.up_smax = torch.rand(4)
+    store.save_inputs(1, outs)
+    store.save_smax(0, layer)
+    assert not store.complete
+    position_ids = torch.arange(3).unsqueeze(0)
+    store.save_meta(2, None, position_ids)
+    assert store.complete
+
+    store = ActivationStore(str(tmp_path))
+    loaded, attention_mask, loaded_position_ids = store.load_meta(2, "cpu", torch.float16)
+    assert loaded.dtype == torch.float16 and torch.equal(loaded, inps.half())
+    assert attention_mask is None and torch.equal(loaded_position_ids, position_ids)
+    assert torch.equal(store.load_inputs(1, "cpu", torch.float32), outs)
+    fresh = _Layer()
+    store.load_smax(0, fresh)
+    assert torch.equal(fresh.mlp.up_smax, layer.mlp.up_smax)
+    with pytest.raises(ValueError):
+        store.load_meta(4, "cpu", torch.float32)
@@ -0,0 +1,40 @@
+import numpy as np
+import torch
+
+from flatquant.function_utils import attention_forward, causal_mask
+from flatquant.quant_utils import ActivationQuantizer
+from flatquant.trans_utils import SVDSingleTransMatrix
+
+
+def _quantized_attention(q, k, v, attention_mask, sdpa):
+    np.random.seed(0)
+    trans = SVDSingleTransMatrix(q.shape[-1])
+    quantizer = ActivationQuantizer(bits=4, sym=True, lac=True)
+    q, k = trans(q, inv_t=True), quantizer(trans(k)).to(q)
+    out, _ = attention_forward(q, k, v, attention_mask, sdpa=sdpa)
+    out.pow(2).sum().backward()
+    grads = {name: param.grad for name, param in list(trans.named_parameters()) + list(quantizer.named_parameters())}
+    return out.detach(), grads
+
+
+def test_sdpa_matches_eager_with_gradients():
+    torch.manual_seed(0)
+    q, k, v = torch.randn(3, 2, 4, 16, 8).unbind(0)
+    mask = torch.zeros(2, 1, 16, 16).masked_fill(~causal_mask(16, 16, "cpu"), torch.finfo(torch.float32).min)
+    reference, reference_grads = _quantized_attention(q, k, v, mask, sdpa=False)
+    # the causal mask stands for attention_mask None, with both implementations
+    for attention_mask, sdpa in [(mask, True), (None, True), (None, False)]:
+        out, grads = _quantized_attention(q, k, v, attention_mask, sdpa)
+        torch.testing.assert_close(out, reference, rtol=1e-4, atol=1e-5)
+        for name in reference_grads:
+            torch.testing.assert_close(grads[name], reference_grads[name], rtol=1e-3, atol=1e-4)
+
+
+def test_causal_mask_with_kv_cache():
+    torch.manual_seed(0)
+    q, k, v = torch.randn(1, 2, 3, 8), torch.randn(1, 2, 5, 8), torch.randn(1, 2, 5, 8)
+    eager, weights = attention_forward(q, k, v, None, sdpa=False)
+    sdpa, _ = attention_forward(q, k, v, None, sdpa=True)
+    torch.testing.assert_close(sdpa, eager)
+    # the first query attends to the 3 first keys
+    assert torch.all(weights[..., 0, 3:] == 0) and torch.all(weights[..., 0, :3] > 0)
@@ -0,0 +1,27 @@
+import json
+
+from benchmarks import run
+
+
+def _run(tmp_path, *extra):
+    return run.main(["--cases", "fwht", "kron_quant", "--backends", "cpu", "triton", "--models", "llama-3-8b",
+                     "--tokens", "1", "--warmup", "1", "--repeats", "2", *extra])
+
+
+def test_results_and_baseline(tmp_path):
+    output, csv_output = tmp_path / "results.json", tmp_path / "results.csv"
+    assert _run(tmp_path, "--output", str(output), "--csv", str(csv_output)) == 0
+    results = json.loads(output.read_text())
+    assert results["metadata"]["torch"]
+    records = {(r["case"], r["backend"], r["shape"]): r for r in results["results"]}
+    assert records[("fwht", "cpu", "tokens=1,dim=4096")]["status"] == "ok"
+    assert records[("kron_quant", "cpu", "tokens=1,dim=14336")]["tflops"] > 0
+    assert len(csv_output.read_text().splitlines()) == len(records) + 1
+
+    # a much faster baseline turns every result into a regression
+    for record in results["results"]:
+        if record["status"] == "ok":
+            record["median_ms"] /= 100
+    baseline = tmp_path / "baseline.json"
+    baseline.write_text(json.dumps(results))
+    assert _run(tmp_path, "--baseline", str(baseline)) == 1
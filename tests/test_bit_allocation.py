@@ -0,0 +1,34 @@
+import pytest
+
+from flatquant.bit_allocation import average_bits, build_bit_config, load_bit_config, module_bits, plan_bits, \
+    save_bit_config
+
+
+def _sensitivity():
+    return {
+        "layers.0.qkv": {"params": 3, "mse": {3: 1.0, 4: 0.5, 16: 0.0}},
+        "layers.0.down": {"params": 4, "mse": {3: 10.0, 4: 1.0, 16: 0.0}},
+    }
+
+
+def test_plan_bits_under_budget():
+    sensitivity = _sensitivity()
+    with pytest.raises(ValueError):
+        plan_bits(sensitivity, 2.5)
+    assert plan_bits(sensitivity, 3) == {"layers.0.qkv": 3, "layers.0.down": 3}
+    # a single upgrade to 4 bits fits, the one of the most sensitive unit
+    bits = plan_bits(sensitivity, 3.6)
+    assert bits == {"layers.0.qkv": 3, "layers.0.down": 4}
+    assert average_bits(sensitivity, bits) <= 3.6
+    assert plan_bits(sensitivity, 16) == {"layers.0.qkv": 16, "layers.0.down": 16}
+
+
+def test_bit_config(tmp_path):
+    sensitivity = _sensitivity()
+    bit_config = build_bit_config(sensitivity, {"layers.0.qkv": 16, "layers.0.down": 3}, a_bits=4, budget=10)
+    save_bit_config(tmp_path / "bit_config.json", bit_config)
+    bit_config = load_bit_config(tmp_path / "bit_config.json")
+    assert module_bits(bit_config, "model.layers.0.self_attn.k_proj.linear", 4, 4) == (16, 16)
+    assert module_bits(bit_config, "model.layers.0.mlp.down_proj", 4, 4) == (3, 4)
+    assert module_bits(bit_config, "model.layers.1.mlp.down_proj", 4, 8) == (4, 8)
+    assert module_bits(None, "model.layers.0.mlp.down_proj", 4, 8) == (4, 8)
@@ -0,0 +1,43 @@
+import torch
+
+from flatquant.flat_linear import FlatQuantizedLinear
+from flatquant.quant_utils import ActivationQuantizer
+from flatquant.trans_utils import SVDDecomposeTransMatrix
+
+
+class _Block(torch.nn.Module):
+    """The calibration path of a FlatQuant projection: transform, fake-quantized linear, KV quantizer."""
+    def __init__(self, args):
+        super().__init__()
+        self.trans = SVDDecomposeTransMatrix(4, 8, add_diag=True)
+        self.linear = FlatQuantizedLinear(args, torch.nn.Linear(32, 16))
+        self.cache_quantizer = ActivationQuantizer(bits=4, sym=False, lac=True, groupsize=8)
+
+    def forward(self, x):
+        out = self.linear(self.trans(x), qa_trans=self.trans)
+        return self.cache_quantizer(out)
+
+
+def _loss_and_grads(block, forward, x, target):
+    block.zero_grad(set_to_none=True)
+    loss = torch.nn.functional.mse_loss(forward(x), target)
+    loss.backward()
+    return loss.detach(), {name: param.grad.clone() for name, param in block.named_parameters() if param.grad is not None}
+
+
+def test_compiled_calibration_forward_matches_eager(flat_args):
+    torch.manual_seed(0)
+    # asymmetric weights and KV cache, symmetric activations
+    block = _Block(flat_args(w_asym=True))
+    x, target = torch.randn(2, 5, 32), torch.randn(2, 5, 16)
+    # a zero token exercises the all-zero branch of the quantizers
+    x[0, 0] = 0
+
+    loss_ref, grads_ref = _loss_and_grads(block, block, x, target)
+    # fullgraph: fails on any graph break
+    loss, grads = _loss_and_grads(block, torch.compile(block, fullgraph=True), x, target)
+
+    torch.testing.assert_close(loss, loss_ref, rtol=1e-4, atol=1e-6)
+    assert grads.keys() == grads_ref.keys()
+    for name in grads_ref:
+        torch.testing.assert_close(grads[name], grads_ref[name], rtol=1e-3, atol=1e-5)
@@ -0,0 +1,118 @@
+import functools
+import json
+import logging
+
+import numpy as np
+import pytest
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+from flatquant import bit_allocation
+from flatquant.data_parallel import shard_sample_ids
+
+WORLD_SIZE = 2
+
+
+def _save_checkpoint(path):
+    import transformers
+    config = transformers.LlamaConfig(vocab_size=64, hidden_size=64, intermediate_size=128, num_hidden_layers=2,
+                                      num_attention_heads=4, max_position_embeddings=64)
+    torch.manual_seed(0)
+    transformers.LlamaForCausalLM(config).save_pretrained(path, safe_serialization=True)
+
+
+def _calibrate(args, checkpoint, lazy, rank=0):
+    import transformers
+    from flatquant import bit_allocation, train_utils
+    from flatquant.data_parallel import get_group
+    from flatquant.lazy_loading import get_lazy_model
+    from flatquant.model_tools.llama_utils import apply_flatquant_to_llama
+
+    config = transformers.LlamaConfig.from_pretrained(checkpoint)
+    config._attn_implementation = "eager"
+    if lazy:
+        model = get_lazy_model(transformers.LlamaForCausalLM, checkpoint, config, offload_dir=f"{args.exp_dir}/offload")
+    else:
+        model = transformers.LlamaForCausalLM.from_pretrained(checkpoint, config=config)
+    model.seqlen = 16
+    # the transforms are initialized with numpy, differently on every rank before the broadcast
+    np.random.seed(rank)
+    model = apply_flatquant_to_llama(args, model)
+    generator = torch.Generator().manual_seed(1)
+    dataloader = [(torch.randint(0, 64, (1, model.seqlen), generator=generator), None) for _ in range(args.nsamples)]
+    train_utils.cali_flat_quant(args, model, dataloader, "cpu", logger=logging.getLogger(__name__))
+    if lazy:
+        # every layer was released, the offloaded copies are written by rank 0
+        for i, layer in enumerate(model.model.layers):
+            assert all(param.is_meta for param in layer.parameters())
+            model.lazy_loader.materialize(layer, i)
+    bit_config = bit_allocation.plan_from_calibration(args, group=get_group())
+    return {name: param.detach().clone() for name, param in model.model.layers.named_parameters()}, bit_config
+
+
+def _no_save(*args, **kwargs):
+    raise AssertionError("only rank 0 writes the calibration results")
+
+
+def _worker(rank, init_file, args, checkpoint, lazy, results):
+    dist.init_process_group("gloo", init_method=f"file://{init_file}", rank=rank, world_size=WORLD_SIZE)
+    if rank != 0:
+        torch.save = _no_save
+        bit_allocation.save_bit_config = _no_save
+    results[rank] = _calibrate(args, checkpoint, lazy, rank)
+    dist.destroy_process_group()
+
+
+def test_shard_sample_ids():
+    shards = [shard_sample_ids(10, 4, rank, 2) for rank in range(2)]
+    assert shards == [[0, 1, 4, 5, 8, 9], [2, 3, 6, 7]]
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_sharded_calibration_matches_single_process(tmp_path, flat_args, keep_init, lazy):
+    # the model tools import flatquant.utils
+    pytest.importorskip("torch_npu")
+    checkpoint = str(tmp_path / "ckpt")
+    _save_checkpoint(checkpoint)
+    cali_args = functools.partial(
+        flat_args, q_bits=16, k_bits=4, v_bits=4, q_asym=False, k_asym=True, v_asym=True, q_groupsize=-1, k_groupsize=-1,
+        v_groupsize=-1, cali_trans=True, add_diag=True, direct_inv=False, separate_vtrans=False, diag_init="sq_style",
+        diag_alpha=0.3, epochs=2, nsamples=8, cali_bsz=4, flat_lr=5e-3, warmup=False, deactive_amp=True,
+        bit_budget=4.25, bit_candidates=[3, 4, 16], sensitivity_samples=4)
+    (tmp_path / "single").mkdir()
+    reference, reference_bit_config = _calibrate(cali_args(exp_dir=str(tmp_path / "single")), checkpoint, lazy)
+    with open(tmp_path / "single" / "cali_mse.json") as f:
+        reference_mse = json.load(f)
+
+    exp_dir = tmp_path / "sharded"
+    exp_dir.mkdir()
+    with mp.Manager() as manager:
+        results = manager.dict()
+        mp.spawn(_worker, args=(str(tmp_path / "init"), cali_args(exp_dir=str(exp_dir)), checkpoint, lazy, results),
+                 nprocs=WORLD_SIZE)
+        results = dict(results)
+    with open(exp_dir / "cali_mse.json") as f:
+        mse = json.load(f)
+    assert mse.keys() == reference_mse.keys()
+    for i in mse:
+        assert mse[i] == pytest.approx(reference_mse[i], rel=1e-3)
+    flat_parameters = torch.load(exp_dir / "flat_parameters.pth")
+    assert flat_parameters.keys() == {0, 1}
+    # the plan of rank 0, from the sensitivities averaged over the ranks
+    bit_config = results[0][1]
+    with open(exp_dir / "bit_config.json") as f:
+        assert json.load(f) == bit_config
+    assert bit_config["modules"].keys() == reference_bit_config["modules"].keys()
+    for rank in range(WORLD_SIZE):
+        results[rank], rank_bit_config = results[rank]
+        assert rank_bit_config == bit_config
+    for rank in range(WORLD_SIZE):
+        assert results[rank].keys() == reference.keys()
+        for name in reference:
+            # the parameters stay identical across the ranks
+            assert torch.equal(results[rank][name], results[0][name]), name
+            torch.testing.assert_close(results[rank][name], reference[name], rtol=1e-3, atol=1e-5)
+    for i, layer_parameters in flat_parameters.items():
+        for name, param in layer_parameters.items():
+            assert torch.equal(param, results[0][f"{i}.{name}"]), name
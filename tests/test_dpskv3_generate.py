@@ -0,0 +1,34 @@
+import pytest
+import torch
+
+pytest.importorskip("triton")
+pytest.importorskip("torch_npu")
+
+
+def _tiny_model():
+    import deepseek_v3.model as model
+    from flatquant.utils import DEV
+    torch.manual_seed(0)
+    args = model.ModelArgs(max_batch_size=4, max_seq_len=64, vocab_size=97, dim=64, inter_dim=96, moe_inter_dim=32,
+                           n_layers=2, n_dense_layers=1, n_heads=4, n_routed_experts=8, n_shared_experts=1,
+                           n_activated_experts=2, q_lora_rank=0, kv_lora_rank=32, qk_nope_head_dim=16,
+                           qk_rope_head_dim=8, v_head_dim=16)
+    with torch.device(str(DEV)):
+        transformer = model.Transformer(args).float()
+    with torch.no_grad():
+        for param in transformer.parameters():
+            param.copy_(torch.randn(param.shape) * 0.2)
+    return transformer
+
+
+def test_ragged_batch_matches_per_prompt():
+    from deepseek_v3.generate import generate
+    transformer = _tiny_model()
+    prompts = [[1, 2, 3, 4, 5, 6, 7], [8, 9], [10, 11, 12, 13]]
+    single = [generate(transformer, [prompt], 6, -1, 0.0)[0] for prompt in prompts]
+    assert generate(transformer, prompts, 6, -1, 0.0) == single
+    # a sequence hitting eos early is dropped from the batch while the others keep decoding
+    eos_id = single[2][3]
+    single = [generate(transformer, [prompt], 6, eos_id, 0.0)[0] for prompt in prompts]
+    assert len(single[2]) == 3 and max(len(tokens) for tokens in single) == 6
+    assert generate(transformer, prompts, 6, eos_id, 0.0) == single
@@ -0,0 +1,51 @@
+import torch
+
+from flatquant.epoch_schedule import EpochBudget, MSEPlateau, set_cosine_horizon
+
+
+def test_plateau_waits_for_patience_and_min_epochs():
+    plateau = MSEPlateau(patience=2, rel_tol=0.1, min_epochs=3)
+    assert not plateau.step(1.0)
+    assert not plateau.step(0.5)
+    assert not plateau.step(0.49)
+    assert plateau.step(0.48)
+
+
+def test_budget_redistributes_saved_epochs_to_high_error_layers():
+    budget = EpochBudget(num_layers=3, epochs=4, min_epochs=2, max_epochs=8)
+    planned = budget.plan(0)
+    assert planned == 4
+    # the first layer has no reference and is never extended
+    assert budget.extend(0, planned, first_error=0.1) == 4
+    budget.finish(0, 2)
+    # two epochs saved, the layer with a higher error than the previous ones gets them
+    assert budget.extend(1, budget.plan(1), first_error=0.5) == 6
+    budget.finish(1, 6)
+    assert budget.extend(2, budget.plan(2), first_error=0.01) == 4
+    budget.finish(2, 4)
+    assert budget.spent == budget.total
+
+
+def test_budget_keeps_min_epochs_for_remaining_layers():
+    budget = EpochBudget(num_layers=4, epochs=10, total=12, min_epochs=3)
+    assert budget.plan(0) == 3
+    budget.finish(0, 3)
+    assert [budget.plan(1), budget.pool(1)] == [3, 0]
+
+
+def test_cosine_horizon_keeps_lr_continuous():
+    param = torch.nn.Parameter(torch.zeros(1))
+    optimizer = torch.optim.SGD([param], lr=1.0)
+    scheduler = torch.optim.lr_scheduler.CosineAnnealingLR(optimizer, T_max=10, eta_min=1e-3)
+    for _ in range(4):
+        optimizer.step()
+        scheduler.step()
+    lr = optimizer.param_groups[0]["lr"]
+    set_cosine_horizon(scheduler, 6)
+    lrs = []
+    for _ in range(2):
+        optimizer.step()
+        scheduler.step()
+        lrs.append(optimizer.param_groups[0]["lr"])
+    assert lr > lrs[0] > lrs[1]
+    assert abs(lrs[1] - 1e-3) < 1e-9
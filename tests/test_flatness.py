@@ -0,0 +1,61 @@
+import numpy as np
+import pytest
+import torch
+
+flatness = pytest.importorskip("flatquant.flatness")
+
+
+def _batches(hidden_dim):
+    torch.manual_seed(0)
+    batches = [torch.randn(2, 5, hidden_dim) * torch.logspace(-6, 6, hidden_dim, base=2.0),
+               torch.randn(3, hidden_dim).half(),
+               torch.randn(1, 4, hidden_dim) * 1e6]
+    # exact zeros and values below the first bin
+    batches[1][0, :4] = 0
+    batches[1][1, 4:8] = 1e-7
+    return batches
+
+
+def _reference(x):
+    x = x.reshape(-1, x.shape[-1]).float().numpy()
+    exps = np.clip(np.floor(np.log2(np.abs(x), where=x != 0, out=np.full_like(x, -np.inf))),
+                   flatness.HIST_MIN_EXP, flatness.HIST_MAX_EXP - 1).astype(np.int64) - flatness.HIST_MIN_EXP
+    num_bins = flatness.HIST_MAX_EXP - flatness.HIST_MIN_EXP
+    hist = np.stack([np.bincount(exps[:, c], minlength=num_bins) for c in range(x.shape[1])])
+    return {
+        "count": x.shape[0],
+        "sumsq": torch.from_numpy(np.square(x.astype(np.float64)).sum(0)),
+        "maxabs": torch.from_numpy(np.abs(x).max(0)),
+        "hist": torch.from_numpy(hist).to(torch.int32),
+    }
+
+
+def _check(stats, expected):
+    assert stats["count"] == expected["count"]
+    torch.testing.assert_close(stats["sumsq"], expected["sumsq"])
+    assert torch.equal(stats["maxabs"], expected["maxabs"])
+    assert torch.equal(stats["hist"], expected["hist"])
+    assert stats["hist"].sum(1).eq(expected["count"]).all()
+
+
+def test_streamed_stats_match_concatenated():
+    hidden_dim = 24
+    batches = _batches(hidden_dim)
+    stats = flatness.init_act_stats(hidden_dim, "cpu")
+    for x in batches:
+        flatness.update_act_stats(stats, x)
+    _check(stats, _reference(torch.cat([x.reshape(-1, hidden_dim).float() for x in batches])))
+
+
+def test_get_act_stats_hooks_every_linear():
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(torch.nn.Linear(16, 32), torch.nn.ReLU(), torch.nn.Linear(32, 8))
+    dataset = [(torch.randn(2, 7, 16),) for _ in range(4)]
+    act_stats, weights = flatness.get_act_stats(model, dataset, act_transform=lambda x: x.flip(-1), num_batches=3)
+    assert set(act_stats) == set(weights) == {"0", "2"}
+    x = torch.cat([batch[0] for batch in dataset[:3]]).reshape(-1, 16)
+    _check(act_stats["0"], _reference(torch.flip(x, [-1])))
+    with torch.no_grad():
+        h = torch.relu(model[0](x))
+    _check(act_stats["2"], _reference(torch.flip(h, [-1])))
+    assert torch.equal(weights["2"], model[2].weight)
@@ -0,0 +1,141 @@
+import pytest
+import torch
+
+deploy = pytest.importorskip("deploy")
+
+from deploy.functional.online_trans import rms_norm_kronecker_quant, rms_norm_kronecker_quant_ref
+from deploy.functional.online_trans import swiglu_kronecker_quant, swiglu_kronecker_quant_ref
+from deploy.functional.online_trans import kronecker_matmul, _kronecker_quant_ref
+from deploy.functional.quantization import unpack_i4
+
+
+def _inputs(M, N, device, bsz=2, seq_len=5):
+    torch.manual_seed(0)
+    x = (torch.randn(bsz, seq_len, M * N) * 8).to(device=device, dtype=torch.float16)
+    left = (torch.randn(M, M) / M ** 0.5).to(device=device, dtype=torch.float16)
+    right = (torch.randn(N, N) / N ** 0.5).to(device=device, dtype=torch.float16)
+    return x, left, right
+
+
+def _quant_dequant(x, groupsize=-1):
+    # per-token (or per-group) Quantizer, in fp32
+    groups = x.reshape(*x.shape[:-1], -1, groupsize) if groupsize > 0 else x
+    scales = groups.abs().amax(dim=-1, keepdim=True) / 7
+    out = torch.clamp(torch.round(groups / scales), -8, 7) * scales
+    return out.reshape(x.shape), scales.expand_as(groups).reshape(x.shape)
+
+
+def _assert_codes_close(q_out, q_ref):
+    assert (q_out - q_ref).abs().max() <= 1
+    assert (q_out != q_ref).float().mean() < 0.01
+
+
+def _dequant(packed):
+    bsz, seq_len, _ = packed.quantized_x.shape
+    q = unpack_i4(packed.quantized_x.reshape(bsz * seq_len, -1)).float()
+    if packed.groupsize > 0:
+        q = q.reshape(bsz * seq_len, -1, packed.groupsize) * packed.scales_x.reshape(bsz * seq_len, -1, 1).float()
+        return q.reshape(bsz, seq_len, -1)
+    return (q * packed.scales_x.reshape(-1, 1).float()).reshape(bsz, seq_len, -1)
+
+
+def _assert_matches_ref(out, ref):
+    assert out.groupsize == ref.groupsize
+    assert out.quantized_x.shape == ref.quantized_x.shape and out.scales_x.shape == ref.scales_x.shape
+    torch.testing.assert_close(out.scales_x.cpu(), ref.scales_x, rtol=1e-3, atol=0)
+    q_out = unpack_i4(out.quantized_x.cpu().reshape(-1, out.quantized_x.shape[-1]))
+    q_ref = unpack_i4(ref.quantized_x.reshape(-1, ref.quantized_x.shape[-1]))
+    _assert_codes_close(q_out, q_ref)
+
+
+@pytest.mark.parametrize("M, N, groupsize", [(64, 64, -1), (32, 48, -1), (64, 64, 128), (32, 48, 96)])
+def test_ref_matches_unfused(M, N, groupsize):
+    x, left, right = _inputs(M, N, "cpu")
+    packed = rms_norm_kronecker_quant_ref(x, left, right, eps=1e-5, groupsize=groupsize)
+    if groupsize > 0:
+        assert packed.groupsize == groupsize and packed.scales_x.shape == (2, 5, M * N // groupsize)
+    out = _dequant(packed)
+
+    # RMSNorm -> OnlineTrans -> Quantizer, in fp32
+    x_norm = deploy.nn.RMSNorm(M * N, eps=1e-5)(x).float().reshape(-1, M, N)
+    x_trans = (left.float() @ x_norm @ right.float()).reshape(x.shape)
+    expected, scales = _quant_dequant(x_trans, groupsize)
+
+    # the fused op rounds the intermediate to fp16 like the kernel, so codes may differ by one step
+    torch.testing.assert_close(out, expected, atol=1.01 * scales.max().item(), rtol=0)
+    assert (out - expected).abs().gt(0.5 * scales).float().mean() < 0.01
+
+
+def test_tile_groupsize():
+    from deploy.kernels.quant_epilogue import tile_groupsize
+    assert tile_groupsize(64, 64, -1) == -1 and tile_groupsize(64, 64, 4096) == -1
+    # groups of columns, of rows, and of rows past the end of the token in the padded tile
+    assert tile_groupsize(64, 64, 32) == 32 and tile_groupsize(64, 64, 128) == 128
+    assert tile_groupsize(86, 128, 256) == 256 and tile_groupsize(86, 128, 512) is None
+    # llama-2-13b: 5120 = 64 x 80, the groups are not slices of the tile
+    assert tile_groupsize(64, 80, 128) is None and tile_groupsize(64, 64, 96) is None
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+@pytest.mark.parametrize("M, N, groupsize", [(64, 64, 64), (64, 64, 128), (86, 128, 128), (64, 80, 128)])
+def test_kron_kernel_per_group(M, N, groupsize):
+    # (86, 128) quantizes the fp16 result of the split path, (64, 80) falls back to deploy.nn.Quantizer
+    x, left, right = _inputs(M, N, "cuda")
+    out = kronecker_matmul(x, [left, right], groupsize)
+    ref = _kronecker_quant_ref(x.cpu().reshape(-1, M, N), left.cpu(), right.cpu(), 2, 5, groupsize)
+    _assert_matches_ref(out, ref)
+    # the per-group int4 GEMM of deploy.nn.Linear4bit
+    weight = deploy.functional.pack_i4(torch.randint(-8, 8, (48, M * N), dtype=torch.int8)).cuda()
+    weight_scales = (torch.rand(48, 1) * 0.01).half().cuda()
+    y = deploy.group_matmul(out.quantized_x, weight, out.scales_x, weight_scales, groupsize)
+    y_ref = deploy.group_matmul_ref(ref.quantized_x, weight.cpu(), ref.scales_x, weight_scales.cpu(), groupsize)
+    torch.testing.assert_close(y.cpu(), y_ref, rtol=0.05, atol=0.05)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+@pytest.mark.parametrize("head_dim, num_heads, groupsize", [(128, 32, 128), (128, 40, 128)])
+def test_block_kernel_per_group(head_dim, num_heads, groupsize):
+    # the per-head transform of o_proj, (128, 40) of llama-2-13b falls back to deploy.nn.Quantizer
+    torch.manual_seed(0)
+    x = torch.randn(2, 5, head_dim, num_heads, dtype=torch.float16, device="cuda")
+    inv = (torch.randn(num_heads, num_heads) / num_heads ** 0.5).half().cuda()
+    out = kronecker_matmul(x, [inv], groupsize)
+    eye = torch.eye(head_dim, dtype=torch.float16)
+    ref = _kronecker_quant_ref(x.cpu().reshape(-1, head_dim, num_heads), eye, inv.cpu(), 2, 5, groupsize)
+    out.quantized_x = out.quantized_x.reshape(2, 5, -1)
+    _assert_matches_ref(out, ref)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+@pytest.mark.parametrize("M, N, groupsize", [(64, 64, -1), (32, 48, -1), (64, 80, -1), (64, 64, 128), (64, 80, 128)])
+def test_kernel_matches_ref(M, N, groupsize):
+    x, left, right = _inputs(M, N, "cuda")
+    out = rms_norm_kronecker_quant(x, left, right, eps=1e-5, groupsize=groupsize)
+    ref = rms_norm_kronecker_quant_ref(x.cpu(), left.cpu(), right.cpu(), eps=1e-5, groupsize=groupsize)
+    _assert_matches_ref(out, ref)
+
+
+@pytest.mark.parametrize("M, N, groupsize", [(64, 64, -1), (86, 128, -1), (86, 128, 128)])
+def test_swiglu_ref_matches_unfused(M, N, groupsize):
+    gate, left, right = _inputs(M, N, "cpu")
+    up = torch.randn_like(gate)
+    out = _dequant(swiglu_kronecker_quant_ref(gate, up, left, right, groupsize))
+
+    # act_fn(gate) * up -> OnlineTrans -> Quantizer, in fp32
+    x = (torch.nn.functional.silu(gate.float()) * up.float()).reshape(-1, M, N)
+    x_trans = (left.float() @ x @ right.float()).reshape(gate.shape)
+    expected, scales = _quant_dequant(x_trans, groupsize)
+
+    torch.testing.assert_close(out, expected, atol=1.01 * scales.max().item(), rtol=0)
+    assert (out - expected).abs().gt(0.5 * scales).float().mean() < 0.01
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+@pytest.mark.parametrize("M, N, groupsize", [(64, 64, -1), (86, 128, -1), (112, 128, -1), (64, 64, 64), (112, 128, 128)])
+def test_swiglu_kernel_matches_ref(M, N, groupsize):
+    # (86, 128) and (112, 128) take the split path used for 11008 and 14336
+    gate, left, right = _inputs(M, N, "cuda")
+    up = torch.randn_like(gate)
+    out = swiglu_kronecker_quant(gate, up, left, right, groupsize)
+    ref = swiglu_kronecker_quant_ref(gate.cpu(), up.cpu(), left.cpu(), right.cpu(), groupsize)
+    _assert_matches_ref(out, ref)
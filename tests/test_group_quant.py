@@ -0,0 +1,70 @@
+import pytest
+import torch
+
+from flatquant.quant_utils import ActivationQuantizer
+
+
+def _group_quant_ref(x, bits, sym, groupsize):
+    # fake quantization with one scale (and zero point) per group of groupsize channels
+    groups = x.reshape(*x.shape[:-1], -1, groupsize).double()
+    if sym:
+        q_max = 2 ** (bits - 1) - 1
+        scale = groups.abs().amax(-1, keepdim=True) / q_max
+        out = torch.clamp(torch.round(groups / scale), -q_max - 1, q_max) * scale
+    else:
+        q_max = 2 ** bits - 1
+        xmax, xmin = groups.amax(-1, keepdim=True).clamp(min=0), groups.amin(-1, keepdim=True).clamp(max=0)
+        scale = (xmax - xmin) / q_max
+        zero = torch.round(-xmin / scale)
+        out = (torch.clamp(torch.round(groups / scale) + zero, 0, q_max) - zero) * scale
+    return out.reshape(x.shape).to(x.dtype)
+
+
+@pytest.mark.parametrize("groupsize", [16, 32])
+def test_per_group_activations(groupsize):
+    torch.manual_seed(0)
+    x = torch.randn(2, 5, 64) * torch.linspace(0.1, 10, 64)
+    quantizer = ActivationQuantizer(bits=4, sym=True, groupsize=groupsize)
+    torch.testing.assert_close(quantizer(x), _group_quant_ref(x, 4, True, groupsize))
+    # a group covering the whole row is per-token
+    per_token = ActivationQuantizer(bits=4, sym=True, groupsize=64)
+    torch.testing.assert_close(per_token(x), _group_quant_ref(x, 4, True, 64))
+
+
+@pytest.mark.parametrize("bits, groupsize", [(4, 32), (2, 64), (3, 16)])
+def test_per_group_kv_cache(bits, groupsize):
+    # the k/v cache quantizers of the FlatQuant attention: asymmetric, on [bsz, num_heads, seq_len, head_dim]
+    torch.manual_seed(0)
+    k = torch.randn(2, 4, 7, 128) + torch.randn(2, 4, 1, 128)
+    quantizer = ActivationQuantizer(bits=bits, sym=False, lac=False, groupsize=groupsize)
+    torch.testing.assert_close(quantizer(k), _group_quant_ref(k, bits, False, groupsize))
+
+
+def test_group_matmul_ref():
+    deploy = pytest.importorskip("deploy")
+    from deploy.functional import pack_i4
+    torch.manual_seed(0)
+    M, N, K, groupsize = 6, 40, 256, 64
+    q_a = torch.randint(-8, 8, (M, K), dtype=torch.int8)
+    q_b = torch.randint(-8, 8, (N, K), dtype=torch.int8)
+    scales_a = (torch.rand(M, K // groupsize) + 0.1).half()
+    scales_b = (torch.rand(N, 1) + 0.1).half()
+    out = deploy.group_matmul(pack_i4(q_a), pack_i4(q_b), scales_a, scales_b, groupsize)
+    a = (q_a.double().reshape(M, -1, groupsize) * scales_a.double().unsqueeze(-1)).reshape(M, K)
+    expected = a @ (q_b.double() * scales_b.double()).T
+    torch.testing.assert_close(out.double(), expected, rtol=1e-3, atol=0.25)
+
+
+@pytest.mark.skipif(not torch.cuda.is_available(), reason="requires CUDA")
+@pytest.mark.parametrize("M, N, K, groupsize", [(5, 70, 256, 64), (33, 64, 128, 32), (128, 256, 4096, 128)])
+def test_group_matmul_kernel_matches_ref(M, N, K, groupsize):
+    deploy = pytest.importorskip("deploy")
+    from deploy.functional import pack_i4
+    torch.manual_seed(0)
+    a = pack_i4(torch.randint(-8, 8, (M, K), dtype=torch.int8))
+    b = pack_i4(torch.randint(-8, 8, (N, K), dtype=torch.int8))
+    scales_a = (torch.rand(M, K // groupsize) + 0.1).half()
+    scales_b = (torch.rand(N, 1) + 0.1).half()
+    ref = deploy.group_matmul_ref(a, b, scales_a, scales_b, groupsize)
+    out = deploy.group_matmul(a.cuda(), b.cuda(), scales_a.cuda(), scales_b.cuda(), groupsize)
+    torch.testing.assert_close(out.cpu(), ref, rtol=1e-3, atol=1e-2)
@@ -0,0 +1,181 @@
+import hashlib
+import math
+
+import pytest
+import torch
+
+from flatquant import hadamard_utils
+from flatquant.hadamard_registry import HAD_FACTOR_SIZES, get_hadK, get_hadK_size, is_pow2
+
+# sha256 of the int8 +-1 tables get_hadNNN() of the former hadamard_utils.py
+HAD_FACTOR_SHA256 = {
+    172: "378ef12c7cc31f3e", 156: "99a1b852ce559ffd", 140: "b9ff01506ffe4db5", 108: "690a34c6c9ed2f0e",
+    60: "091e76fba0aef583", 52: "9ee082772819b105", 36: "d674d8240e6b622b", 28: "a6cb994c78f9acd4",
+    40: "b36c95bcae918f98", 20: "f54960fecf1ccf70", 12: "67507aecbe2abee5",
+}
+
+
+def _former_hadK_size(n):
+    # the elif chain of the former get_hadK
+    for K in (172, 156, 140, 108, 60, 52, 36, 28, 40, 20, 12):
+        if n % K == 0:
+            assert is_pow2(n // K)
+            return K
+    assert is_pow2(n)
+    return 1
+
+
+@pytest.mark.parametrize("K", HAD_FACTOR_SIZES)
+def test_factors_match_former_tables(K):
+    hadK, size = get_hadK(K)
+    assert size == K and hadK.dtype == torch.float32
+    digest = hashlib.sha256(hadK.to(torch.int8).numpy().tobytes()).hexdigest()[:16]
+    assert digest == HAD_FACTOR_SHA256[K]
+    torch.testing.assert_close(hadK @ hadK.T, K * torch.eye(K))
+    hadK_t, _ = get_hadK(K, transpose=True, dtype=torch.float64)
+    assert hadK_t.dtype == torch.float64 and torch.equal(hadK_t, hadK.T.double())
+
+
+def test_factor_selection_matches_former_order():
+    for n in range(4, 2 ** 16, 4):
+        try:
+            expected = _former_hadK_size(n)
+        except AssertionError:
+            expected = None
+        if expected is None:
+            with pytest.raises(AssertionError):
+                get_hadK_size(n)
+        else:
+            assert get_hadK_size(n) == expected
+
+
+def test_pow2_and_unsupported_sizes():
+    assert get_hadK(4096) == (None, 1)
+    assert get_hadK(172 * 64)[1] == 172 and get_hadK(20 * 2)[1] == 40
+    for n in (100, 44 * 16, 172 * 3):
+        with pytest.raises(AssertionError):
+            _former_hadK_size(n)
+        with pytest.raises(AssertionError):
+            get_hadK(n)
+
+
+def _dense_hadU(n, transpose=False):
+    # X @ _dense_hadU(n).T is what matmul_hadU_cuda computes: the FWHT over n // K, then hadK over the K chunks
+    hadK, K = get_hadK(n, transpose, dtype=torch.float64)
+    had = hadamard_utils.get_had_pow2(n // K, norm=False).double()
+    if K > 1:
+        had = torch.kron(hadK, had)
+    return had / math.sqrt(n)
+
+
+@pytest.mark.parametrize("n", [2, 64, 4096, 12, 172 * 4, 40 * 32, 28 * 128])
+@pytest.mark.parametrize("transpose", [False, True])
+def test_matmul_hadU_cpu_matches_dense(n, transpose):
+    torch.manual_seed(0)
+    hadK, K = get_hadK(n, transpose)
+    if K == 1:
+        torch.testing.assert_close(_dense_hadU(n), hadamard_utils.get_had_pow2(n).double())
+    # more rows than fit in one block of HAD_BLOCK_BYTES, with a ragged last block
+    rows = hadamard_utils.HAD_BLOCK_BYTES // (n * 4) * 2 + 3
+    X = torch.randn(rows, n)
+    expected = X.double() @ _dense_hadU(n, transpose).T
+    out = hadamard_utils.matmul_hadU_cpu(X, hadK, K)
+    torch.testing.assert_close(out.double(), expected, rtol=1e-4, atol=1e-4)
+    torch.testing.assert_close(hadamard_utils.matmul_hadU(X, transpose), out)
+    # in place on a contiguous input, with leading batch dims
+    X_ = X.reshape(rows, 1, n).clone()
+    assert hadamard_utils.matmul_hadU_cpu(X_, hadK, K, inplace=True) is X_
+    torch.testing.assert_close(X_.reshape(rows, n), out)
+
+
+def test_matmul_hadU_cpu_float64_and_inverse():
+    torch.manual_seed(0)
+    for n in (1024, 156 * 16):
+        X = torch.randn(5, 3, n, dtype=torch.float64)
+        hadK, K = get_hadK(n, dtype=torch.float64)
+        out = hadamard_utils.matmul_hadU_cpu(X, hadK, K)
+        torch.testing.assert_close(out, X @ _dense_hadU(n).T)
+        torch.testing.assert_close(hadamard_utils.matmul_hadUt(out), X)
+        # non-contiguous inputs are copied
+        Xt = X.transpose(0, 1)
+        torch.testing.assert_close(hadamard_utils.matmul_hadU_cpu(Xt, hadK, K), out.transpose(0, 1))
+
+
+def test_fwht_block_matches_get_had_pow2():
+    torch.manual_seed(0)
+    for K, m in ((1, 256), (12, 8), (60, 16)):
+        hadK = get_hadK(K * m, dtype=torch.float64)[0] if K > 1 else None
+        X = torch.randn(7, K * m, dtype=torch.float64)
+        expected = (X.view(7, K, m) @ hadamard_utils.get_had_pow2(m, norm=False).double()).view(7, K * m)
+        if hadK is not None:
+            expected = (hadK @ expected.view(7, K, m)).view(7, K * m)
+        out = X.clone()
+        assert hadamard_utils._fwht_block_(out, hadK, K) is out
+        torch.testing.assert_close(out, expected)
+
+
+def _dense_structured(size, hadamard_size, signs):
+    Q = torch.block_diag(*[_dense_hadU(hadamard_size).T] * (size // hadamard_size))
+    return Q if signs is None else signs.double()[:, None] * Q
+
+
+@pytest.mark.parametrize("size, hadamard_size, random_signs", [(256, -1, True), (172 * 2, -1, True), (512, 64, False)])
+def test_structured_hadamard_matches_dense(size, hadamard_size, random_signs):
+    torch.manual_seed(0)
+    if random_signs:
+        op = hadamard_utils.random_hadamard(size, "cpu")
+    else:
+        op = hadamard_utils.block_diag_hadamard(size, hadamard_size, "cpu")
+    Q = _dense_structured(size, op.hadamard_size, op.signs)
+    torch.testing.assert_close(op.to_dense(), Q)
+    torch.testing.assert_close(Q @ Q.T, torch.eye(size, dtype=torch.float64))
+    assert op.get_matrix().dtype == torch.float32
+    torch.testing.assert_close(op.get_matrix(inv_t=True), Q.float())
+    if random_signs:
+        torch.testing.assert_close(hadamard_utils.random_hadamard_matrix(size, "cpu").abs(), Q.abs())
+    else:
+        torch.testing.assert_close(hadamard_utils.block_diag_hadamard_matrix(size, hadamard_size, "cpu"), Q)
+
+    x = torch.randn(3, 5, size, dtype=torch.float64)
+    torch.testing.assert_close(op.apply(x), x @ Q)
+    torch.testing.assert_close(op.apply_transpose(x), x @ Q.T)
+    torch.testing.assert_close(op(x, inv_t=True), op(x))
+
+    linear = torch.nn.Linear(size, 96)
+    W = linear.weight.data.clone()
+    op.fuse_into_linear(linear)
+    torch.testing.assert_close(linear.weight.data, (W.double() @ Q).float())
+    linear = torch.nn.Linear(48, size)
+    W, b = linear.weight.data.clone(), linear.bias.data.clone()
+    op.fuse_into_linear(linear, output=True)
+    torch.testing.assert_close(linear.weight.data, (Q.T @ W.double()).float())
+    torch.testing.assert_close(linear.bias.data, (b.double() @ Q).float())
+
+
+@pytest.mark.parametrize("had_dim, output", [(-1, False), (-1, True), (32, False), (32, True)])
+def test_apply_exact_had_to_linear(had_dim, output):
+    torch.manual_seed(0)
+    linear = torch.nn.Linear(40 * 4, 64, bias=False)
+    W = linear.weight.data.double().clone()
+    hadamard_utils.apply_exact_had_to_linear(linear, had_dim=had_dim, output=output)
+    size = 64 if output else 40 * 4
+    Q = _dense_structured(size, size if had_dim == -1 else had_dim, None)
+    expected = Q.T @ W if output else W @ Q
+    torch.testing.assert_close(linear.weight.data.double(), expected, rtol=1e-5, atol=1e-6)
+
+
+@pytest.mark.parametrize("chunk_size", [None, 64])
+def test_structured_hadamard_reparameterize(chunk_size, flat_args):
+    from flatquant.flat_linear import FlatQuantizedLinear
+    torch.manual_seed(0)
+    args = flat_args(lac=False, lwc=False, rep_chunk_size=chunk_size)
+    head_dim, num_heads = 32, 8
+    linear = torch.nn.Linear(256, head_dim * num_heads)
+    W, b = linear.weight.data.double().clone(), linear.bias.data.double().clone()
+    qa_trans, out_trans = hadamard_utils.random_hadamard(256, "cpu"), hadamard_utils.block_diag_hadamard(head_dim, -1, "cpu")
+    layer = FlatQuantizedLinear(args, linear)
+    layer.reparameterize(qa_trans=qa_trans, out_trans=out_trans)
+    Q_in = qa_trans.to_dense()
+    Q_out = torch.block_diag(*[out_trans.to_dense()] * num_heads)
+    torch.testing.assert_close(layer.linear.weight.data.double(), Q_out.T @ W @ Q_in, rtol=1e-5, atol=1e-6)
+    torch.testing.assert_close(layer.linear.bias.data.double(), b @ Q_out, rtol=1e-5, atol=1e-6)
@@ -0,0 +1,87 @@
+import pytest
+import torch
+
+from flatquant.flat_utils import pack_i4
+from vllm_custom.model_executor.layers.quantization.utils.fake_quant_utils import ActivationQuantizer
+from vllm_custom.model_executor.layers.quantization.utils.int4_utils import pack_int4, unpack_int4, \
+    quantize_activation, int4_linear
+
+
+def test_pack_roundtrip():
+    q = torch.randint(-8, 8, (5, 64), dtype=torch.int8)
+    packed = pack_int4(q)
+    assert packed.dtype == torch.uint8 and packed.shape == (5, 32)
+    # the layout of the exported checkpoints
+    assert torch.equal(packed, pack_i4(q))
+    assert torch.equal(unpack_int4(packed), q)
+
+
+def test_int4_linear_matches_fake_quant():
+    torch.manual_seed(0)
+    tokens, in_features, out_features = 7, 64, 48
+    x = torch.randn(tokens, in_features)
+    x[3] = 0
+    weight_q = torch.randint(-8, 8, (out_features, in_features)).float()
+    weight_scales = (torch.rand(out_features, 1) * 0.01 + 0.001).to(torch.float16)
+    bias = torch.randn(out_features)
+
+    quantizer = ActivationQuantizer(bits=4, sym=True, lac=True)
+    with torch.no_grad():
+        quantizer.clip_factor_a_max.fill_(1.5)
+        quantizer.clip_factor_a_min.fill_(2.0)
+    act = quantize_activation(x, quantizer)
+    out = int4_linear(act, pack_int4(weight_q), weight_scales, bias.to(torch.float16))
+
+    with torch.no_grad():
+        ref = torch.nn.functional.linear(quantizer(x), weight_q * weight_scales.float(), bias)
+    torch.testing.assert_close(out.float(), ref, rtol=1e-2, atol=1e-2)
+
+
+def test_mixed_bit_export_roundtrip(tmp_path, flat_args, keep_init):
+    # the model tools import flatquant.utils
+    pytest.importorskip("torch_npu")
+    import transformers
+    from safetensors.torch import load_file
+    import gptq_utils
+    from flatquant import bit_allocation, flat_utils
+    from flatquant.model_tools.llama_utils import apply_flatquant_to_llama
+
+    config = transformers.LlamaConfig(vocab_size=64, hidden_size=64, intermediate_size=128, num_hidden_layers=2,
+                                      num_attention_heads=4, max_position_embeddings=64)
+    torch.manual_seed(0)
+    args = flat_args(q_bits=16, k_bits=16, v_bits=16, direct_inv=False, add_diag=True, diag_init=None,
+                     separate_vtrans=False, w_groupsize=-1, gptq_mse=False, exp_dir=str(tmp_path))
+    model = apply_flatquant_to_llama(args, transformers.LlamaForCausalLM(config))
+    sensitivity = {f"layers.{i}.{unit}": {"params": 1, "mse": {}} for i in range(2) for unit in bit_allocation.UNITS}
+    bits = {key: 4 for key in sensitivity}
+    bits.update({"layers.0.qkv": 16, "layers.1.down": 3, "layers.1.up_gate": 2})
+    bit_config = bit_allocation.build_bit_config(sensitivity, bits, a_bits=4)
+    bit_allocation.apply_bit_config(model, bit_config, args.w_bits, args.a_bits)
+    flat_utils.reparameterize_model(model)
+    quantizers = gptq_utils.rtn_fwrd(model, "cpu", args, bit_config=bit_config)
+    flat_utils.save_int4_checkpoint(args, model, quantizers, bit_config=bit_config)
+
+    state = load_file(tmp_path / "int4_checkpoint" / "model.safetensors")
+    modules = transformers.AutoConfig.from_pretrained(tmp_path / "int4_checkpoint").quantization_config["modules"]
+    assert modules["model.layers.0.self_attn.k_proj"] == {"w_bits": 16, "a_bits": 16}
+    assert modules["model.layers.1.mlp.gate_proj"] == {"w_bits": 2, "a_bits": 4}
+    for i, layer in enumerate(model.model.layers):
+        for name, module in layer.named_modules():
+            if not isinstance(module, torch.nn.Linear):
+                continue
+            name = f"model.layers.{i}.{name}".replace(".linear", "")
+            w_bits = modules[name]["w_bits"]
+            if w_bits == 16:
+                # kept unquantized
+                assert f"{name}.weight_scales" not in state
+                assert torch.equal(state[f"{name}.weight"], module.weight.data)
+                continue
+            q = unpack_int4(state[f"{name}.weight"])
+            assert q.min() >= -2 ** (w_bits - 1) and q.max() <= 2 ** (w_bits - 1) - 1
+            torch.testing.assert_close(q.float() * state[f"{name}.weight_scales"].float(), module.weight.data,
+                                       rtol=1e-3, atol=1e-4)
+
+    # a unit at 16 bits only becomes a 16-bit layer of vLLM if its a_bits is 16 too
+    bit_config["modules"]["model.layers.1.mlp.down_proj"]["a_bits"] = 8
+    with pytest.raises(ValueError):
+        flat_utils.save_int4_checkpoint(args, model, quantizers, bit_config=bit_config)
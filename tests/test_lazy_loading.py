@@ -0,0 +1,97 @@
+import pytest
+import torch
+from accelerate import init_empty_weights
+from safetensors.torch import save_file
+
+from flatquant.flat_linear import FlatQuantizedLinear
+from flatquant.lazy_loading import LazyLayerLoader
+
+
+def _block(args):
+    with init_empty_weights():
+        linear = torch.nn.Linear(8, 4)
+    block = torch.nn.Module()
+    block.proj = FlatQuantizedLinear(args, linear)
+    block.up_smax = torch.ones_like(linear.weight[0]) * 1e-5
+    return block
+
+
+def test_materialize_and_release(tmp_path, flat_args):
+    torch.manual_seed(0)
+    args = flat_args()
+    weights = {f"model.layers.{i}.proj.{name}": torch.randn(shape).half()
+               for i in range(2) for name, shape in [("weight", (4, 8)), ("bias", (4,))]}
+    save_file({name: tensor for name, tensor in weights.items() if ".0." in name}, tmp_path / "shard-0.safetensors")
+    save_file({name: tensor for name, tensor in weights.items() if ".1." in name}, tmp_path / "shard-1.safetensors")
+    (tmp_path / "model.safetensors.index.json").write_text(
+        '{"weight_map": {%s}}' % ", ".join(f'"{name}": "shard-{name.split(".")[2]}.safetensors"' for name in weights))
+
+    loader = LazyLayerLoader(str(tmp_path), str(tmp_path / "offload"))
+    layers = [_block(args) for _ in range(2)]
+    assert layers[1].proj.linear.weight.is_meta and not layers[1].proj.clip_factor_w_max.is_meta
+    loader.materialize(layers[1], 1)
+    # the checkpoint dtype is kept
+    assert torch.equal(layers[1].proj.linear.weight, weights["model.layers.1.proj.weight"])
+    assert torch.equal(layers[1].proj.linear.bias, weights["model.layers.1.proj.bias"])
+    assert not layers[1].up_smax.is_meta
+
+    layers[1].proj.clip_factor_w_max.data.fill_(2.)
+    loader.release(layers[1], 1)
+    assert all(param.is_meta for param in layers[1].parameters())
+    assert (tmp_path / "offload" / "layer_1.pth").exists()
+    # the calibrated layer is reloaded from its offloaded copy
+    loader.materialize(layers[1], 1)
+    assert torch.equal(layers[1].proj.linear.weight, weights["model.layers.1.proj.weight"])
+    assert torch.all(layers[1].proj.clip_factor_w_max == 2.)
+
+
+def test_streamed_pipeline_matches_in_memory(tmp_path, flat_args, keep_init):
+    # the model tools import flatquant.utils
+    pytest.importorskip("torch_npu")
+    import transformers
+    import gptq_utils
+    from flatquant import flat_utils
+    from flatquant.lazy_loading import get_lazy_model
+    from flatquant.model_tools.llama_utils import apply_flatquant_to_llama
+
+    config = transformers.LlamaConfig(vocab_size=64, hidden_size=64, intermediate_size=128, num_hidden_layers=2,
+                                      num_attention_heads=4, max_position_embeddings=64)
+    torch.manual_seed(0)
+    transformers.LlamaForCausalLM(config).save_pretrained(tmp_path / "ckpt", safe_serialization=True)
+    args = flat_args(q_bits=16, k_bits=16, v_bits=16, direct_inv=False, add_diag=True, diag_init=None,
+                                 separate_vtrans=False, w_groupsize=-1, gptq_mse=False, exp_dir=str(tmp_path))
+
+    model = apply_flatquant_to_llama(args, transformers.LlamaForCausalLM.from_pretrained(tmp_path / "ckpt"))
+    lazy_model = apply_flatquant_to_llama(args, get_lazy_model(
+        transformers.LlamaForCausalLM, str(tmp_path / "ckpt"), config, offload_dir=str(tmp_path / "offload")))
+    loader = lazy_model.lazy_loader
+    for i, (layer, lazy_layer) in enumerate(zip(model.model.layers, lazy_model.model.layers)):
+        for name, param in layer.named_parameters():
+            if "trans" in name or "clip_factor" in name:
+                param.data = torch.randn_like(param) * 0.1 + param
+        # the calibrated layers are released by cali_flat_quant
+        loader.materialize(lazy_layer, i)
+        lazy_layer.load_state_dict(layer.state_dict())
+        loader.release(lazy_layer, i)
+
+    flat_utils.save_flat_matrices(args, lazy_model)
+    lazy_matrices = torch.load(tmp_path / "flat_matrices.pth")
+    flat_utils.save_flat_matrices(args, model)
+    flat_utils.reparameterize_model(model)
+    flat_utils.reparameterize_model(lazy_model, num_workers=2)
+    quantizers = gptq_utils.rtn_fwrd(model, "cpu", args)
+    lazy_quantizers = gptq_utils.rtn_fwrd(lazy_model, "cpu", args)
+
+    matrices = torch.load(tmp_path / "flat_matrices.pth")
+    for i in matrices:
+        assert matrices[i].keys() == lazy_matrices[i].keys()
+        assert all(torch.equal(matrices[i][name], lazy_matrices[i][name]) for name in matrices[i])
+    assert quantizers.keys() == lazy_quantizers.keys()
+    assert all(torch.equal(quantizers[name].scale, lazy_quantizers[name].scale) for name in quantizers)
+    for i, (layer, lazy_layer) in enumerate(zip(model.model.layers, lazy_model.model.layers)):
+        # nothing is left in host memory
+        assert all(param.is_meta for param in lazy_layer.parameters())
+        loader.materialize(lazy_layer, i)
+        state, lazy_state = layer.state_dict(), lazy_layer.state_dict()
+        assert state.keys() == lazy_state.keys()
+        assert all(torch.equal(state[name], lazy_state[name]) for name in state), i
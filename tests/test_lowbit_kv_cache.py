@@ -0,0 +1,91 @@
+import math
+
+import pytest
+import torch
+
+from flatquant.quant_utils import ActivationQuantizer
+
+kv_cache = pytest.importorskip("deploy.transformers.kv_cache")
+from deploy.functional.quantization import pack_bits, unpack_bits, pack_i4
+
+
+def _dequantize(x, bits, groupsize, clip_ratio=None):
+    data, param = kv_cache.asym_quantize_and_pack(x, bits, groupsize, clip_ratio)
+    return kv_cache.unpack_and_asym_dequantize(data, param.float(), bits), data, param
+
+
+def _dense_attention(q, k, v):
+    # q (bsz, num_qo_heads, head_dim), k/v (bsz, num_kv_heads, kv_len, head_dim)
+    group = q.shape[1] // k.shape[1]
+    k, v = k.repeat_interleave(group, dim=1), v.repeat_interleave(group, dim=1)
+    weights = torch.softmax(torch.einsum("bhd,bhld->bhl", q, k) / math.sqrt(q.shape[-1]), dim=-1)
+    return torch.einsum("bhl,bhld->bhd", weights, v)
+
+
+@pytest.mark.parametrize("bits", [2, 3, 4])
+def test_pack_bits_roundtrip(bits):
+    torch.manual_seed(0)
+    q = torch.randint(0, 2 ** bits, (3, 5, 64))
+    packed = pack_bits(q, bits)
+    assert packed.dtype == torch.uint8 and packed.shape == (3, 5, 64 * bits // 8)
+    assert torch.equal(unpack_bits(packed, bits), q.to(torch.int32))
+    if bits == 4:
+        # the layout of pack_i4 for the two's complement codes
+        signed = torch.randint(-8, 8, (4, 64), dtype=torch.int8)
+        assert torch.equal(pack_bits(signed & 0x0F, 4), pack_i4(signed))
+
+
+@pytest.mark.parametrize("bits, groupsize", [(2, 32), (3, 64), (2, -1)])
+@pytest.mark.parametrize("lac", [False, True])
+def test_asym_quantize_and_pack_matches_activation_quantizer(bits, groupsize, lac):
+    torch.manual_seed(0)
+    x = torch.randn(2, 4, 7, 128) + torch.randn(2, 4, 1, 128)
+    quantizer = ActivationQuantizer(bits=bits, sym=False, lac=lac, groupsize=groupsize)
+    clip_ratio = None
+    if lac:
+        quantizer.clip_factor_a_max.data.fill_(1.5)
+        quantizer.clip_factor_a_min.data.fill_(0.5)
+        clip_ratio = kv_cache.kv_clip_ratios(
+            [{f"self_attn.k_cache_quantizer.clip_factor_a_{bound}": getattr(quantizer, f"clip_factor_a_{bound}")
+              for bound in ("max", "min")}], 1)[0][0]
+    out, data, param = _dequantize(x, bits, groupsize, clip_ratio)
+    n_groups = 1 if groupsize == -1 else 128 // groupsize
+    assert data.shape == (2, 4, 7, 128 * bits // 8) and param.shape == (2, 4, 7, n_groups, 2)
+    # same codes, the scales are stored in fp16
+    with torch.no_grad():
+        torch.testing.assert_close(out, quantizer(x), rtol=1e-3, atol=1e-3)
+
+
+def test_batch_decode_lowbit_matches_dense_attention():
+    torch.manual_seed(0)
+    bits, groupsize = 3, 32
+    q = torch.randn(2, 8, 64)
+    k, v = torch.randn(2, 2, 37, 64), torch.randn(2, 2, 37, 64)
+    k_data, k_param = kv_cache.asym_quantize_and_pack(k, bits, groupsize)
+    v_data, v_param = kv_cache.asym_quantize_and_pack(v, bits, groupsize)
+    # chunks smaller than the cache exercise the online softmax
+    out = kv_cache.batch_decode_lowbit(q, k_data, k_param, v_data, v_param, bits, chunk_size=16)
+    # dequantized in fp16, as by the decode
+    k_deq = kv_cache.unpack_and_asym_dequantize(k_data, k_param, bits).float()
+    v_deq = kv_cache.unpack_and_asym_dequantize(v_data, v_param, bits).float()
+    torch.testing.assert_close(out, _dense_attention(q, k_deq, v_deq), rtol=1e-4, atol=1e-5)
+
+
+def test_paged_lowbit_cache_decode():
+    torch.manual_seed(0)
+    bsz, num_heads, head_dim, bits = 2, 2, 64, 2
+    cache = kv_cache.MultiLayerPagedKVCacheLowBit(
+        batch_size=bsz, page_size=4, max_seq_len=8, device="cpu", n_layers=1, num_heads=num_heads,
+        head_dim=head_dim, bits=bits, groupsize=32, clip_ratios=[((0.9, 0.8), (0.95, 0.85))], trans="none")
+    k, v = torch.randn(bsz, 7, num_heads, head_dim), torch.randn(bsz, 7, num_heads, head_dim)
+    cache.update(k[:, :6], v[:, :6], 0)
+    decode = cache.update(k[:, 6:], v[:, 6:], 0)
+    q = torch.randn(bsz, 1, num_heads, head_dim)
+    out = decode(q)
+
+    k_deq = kv_cache.unpack_and_asym_dequantize(
+        *kv_cache.asym_quantize_and_pack(k.transpose(1, 2), bits, 32, (0.9, 0.8)), bits).float()
+    v_deq = kv_cache.unpack_and_asym_dequantize(
+        *kv_cache.asym_quantize_and_pack(v.transpose(1, 2), bits, 32, (0.95, 0.85)), bits).float()
+    expected = _dense_attention(q.squeeze(1), k_deq, v_deq)
+    torch.testing.assert_close(out.squeeze(1).float(), expected, rtol=1e-3, atol=1e-3)
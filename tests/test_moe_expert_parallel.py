@@ -0,0 +1,73 @@
+import zlib
+
+import pytest
+import torch
+import torch.distributed as dist
+import torch.multiprocessing as mp
+
+pytest.importorskip("triton")
+
+WORLD_SIZE = 2
+
+
+def _build_moe(rank, flat_args):
+    import deepseek_v3.model as model
+    from flatquant.model_tools.deepseekv3_utils import FlatQuantMoE
+
+    model.world_size, model.rank = WORLD_SIZE, rank
+    model.Linear.dtype = torch.float32
+    args = model.ModelArgs(dim=64, moe_inter_dim=32, n_routed_experts=16, n_activated_experts=4,
+                           n_shared_experts=2, score_func="softmax")
+    moe = model.MoE(args)
+    with torch.no_grad():
+        for name, param in moe.named_parameters():
+            # the same weights for every replica or shard of a parameter
+            generator = torch.Generator().manual_seed(zlib.crc32(name.encode()))
+            param.copy_(torch.randn(param.shape, generator=generator) * 0.1)
+    moe = FlatQuantMoE(flat_args, moe)
+    moe.broadcast_shared_parameters()
+    for param in moe.parameters():
+        param.requires_grad = False
+    for param in moe.shared_parameters():
+        param.requires_grad = True
+    return moe
+
+
+def _run(moe, x, expert_parallel):
+    moe.expert_parallel = expert_parallel
+    moe.zero_grad()
+    x = x.clone().requires_grad_(True)
+    out = moe(x)
+    out.pow(2).mean().backward()
+    moe.all_reduce_shared_grads()
+    return out.detach(), x.grad, [param.grad.clone() for param in moe.shared_parameters()]
+
+
+def _worker(rank, init_file, flat_args):
+    dist.init_process_group("gloo", init_method=f"file://{init_file}", rank=rank, world_size=WORLD_SIZE)
+    torch.manual_seed(0)
+    moe = _build_moe(rank, flat_args)
+    x = torch.randn(3, 7, 64)
+
+    out_ref, x_grad_ref, grads_ref = _run(moe, x, expert_parallel=False)
+    out, x_grad, grads = _run(moe, x, expert_parallel=True)
+    # without expert parallelism the input gradient of every rank only covers its local experts
+    dist.all_reduce(x_grad_ref)
+
+    torch.testing.assert_close(out, out_ref, rtol=1e-4, atol=1e-5)
+    torch.testing.assert_close(x_grad, x_grad_ref, rtol=1e-4, atol=1e-6)
+    for grad, grad_ref in zip(grads, grads_ref):
+        torch.testing.assert_close(grad, grad_ref, rtol=1e-4, atol=1e-6)
+
+    moe._ori_mode = True
+    with torch.no_grad():
+        moe.expert_parallel = False
+        out_ref = moe(x)
+        moe.expert_parallel = True
+        out = moe(x)
+    torch.testing.assert_close(out, out_ref, rtol=1e-4, atol=1e-5)
+    dist.destroy_process_group()
+
+
+def test_expert_parallel_matches_replicated(tmp_path, flat_args):
+    mp.spawn(_worker, args=(str(tmp_path / "pg_init"), flat_args(add_diag=True)), nprocs=WORLD_SIZE)
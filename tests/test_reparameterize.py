@@ -0,0 +1,56 @@
+import types
+
+import numpy as np
+import torch
+
+from flatquant.flat_linear import FlatQuantizedLinear
+from flatquant.flat_utils import reparameterize_model
+from flatquant.trans_utils import SVDDecomposeTransMatrix, SVDSingleTransMatrix
+
+
+class _Proj(torch.nn.Module):
+    def __init__(self, args):
+        super().__init__()
+        self.ln_trans = None
+        self.up_gate_trans = None
+        self.trans = SVDDecomposeTransMatrix(4, 8, add_diag=True)
+        self.out_trans = SVDSingleTransMatrix(8)
+        self.proj = FlatQuantizedLinear(args, torch.nn.Linear(32, 24).half())
+        for clip_factor in (self.proj.clip_factor_w_max, self.proj.clip_factor_w_min):
+            clip_factor.data = torch.randn_like(clip_factor)
+
+    def reparameterize(self):
+        self.trans.to_eval_mode()
+        self.out_trans.to_eval_mode()
+        self.proj.reparameterize(qa_trans=self.trans, out_trans=self.out_trans)
+
+
+def _model(args, num_layers=3):
+    torch.manual_seed(0)
+    np.random.seed(0)
+    model = torch.nn.Module()
+    model.config = types.SimpleNamespace(num_hidden_layers=num_layers)
+    model.model = torch.nn.Module()
+    model.model.layers = torch.nn.ModuleList()
+    for _ in range(num_layers):
+        layer = torch.nn.Module()
+        layer.self_attn, layer.mlp = _Proj(args), _Proj(args)
+        model.model.layers.append(layer)
+    return model
+
+
+def _weights(model):
+    return [param.detach().clone() for name, param in model.named_parameters() if name.endswith("linear.weight")]
+
+
+def test_chunked_threaded_folding_matches_sequential(flat_args):
+    reference = _weights(reparameterize_model(_model(flat_args())))
+    model = _model(flat_args())
+    for module in model.modules():
+        if isinstance(module, FlatQuantizedLinear):
+            # rounded to 16, the multiple of the out_trans size below 20
+            module.args = flat_args(rep_chunk_size=20)
+    folded = _weights(reparameterize_model(model, num_workers=3))
+    for weight, reference_weight in zip(folded, reference):
+        assert weight.dtype == torch.float16
+        assert torch.equal(weight, reference_weight)
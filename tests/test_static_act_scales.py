@@ -0,0 +1,89 @@
+import pytest
+import torch
+
+from flatquant.quant_utils import ActivationQuantizer, RangeObserver, observe_static_ranges, set_static_ranges
+from vllm_custom.model_executor.layers.quantization.utils.fake_quant_utils import \
+    ActivationQuantizer as VLLMActivationQuantizer
+from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import FlatParamMapping
+from vllm_custom.model_executor.layers.quantization.utils.int4_utils import activation_scales
+
+
+def test_range_observer_ema():
+    observer = RangeObserver(percentile=1.0, momentum=0.5)
+    observer.update(torch.tensor([1., 2.]), torch.tensor([-1., 0.]))
+    observer.update(torch.tensor([4., 0.]), torch.tensor([-3., -1.]))
+    assert observer.xmax.item() == 3. and observer.xmin.item() == -2.
+
+    observer = RangeObserver(percentile=0.5, momentum=0.9)
+    observer.update(torch.tensor([1., 2., 3.]), torch.tensor([-3., -2., -1.]))
+    assert observer.xmax.item() == 2. and observer.xmin.item() == -2.
+
+
+def test_static_quantizer_matches_per_tensor_scale():
+    torch.manual_seed(0)
+    x = torch.randn(3, 5, 16)
+    quantizer = observe_static_ranges(ActivationQuantizer(bits=4, sym=True, lac=True, static=True))
+    with torch.no_grad():
+        dynamic = quantizer(x)
+    set_static_ranges(quantizer)
+    assert quantizer.use_static and quantizer.observer is None
+    assert quantizer.static_xmax.item() == x.amax().item()
+    with torch.no_grad():
+        static = quantizer(x)
+        scale = torch.maximum(-x.amin(), x.amax()) * torch.sigmoid(quantizer.clip_factor_a_max) / 7
+    torch.testing.assert_close(static, torch.clamp(torch.round(x / scale), -8, 7) * scale)
+    # a single per-tensor scale is coarser than the per-token ones
+    assert (static - x).pow(2).mean() >= (dynamic - x).pow(2).mean()
+
+
+def test_vllm_static_quantizer():
+    torch.manual_seed(0)
+    x = torch.randn(7, 32)
+    quantizer = observe_static_ranges(ActivationQuantizer(bits=4, sym=False, lac=True, static=True))
+    with torch.no_grad():
+        quantizer(x)
+    set_static_ranges(quantizer)
+    # as saved in flat_matrices.pth, for the second tensor-parallel rank of a row-parallel layer
+    flat_param = {f"self_attn.o_proj.act_quantizer.{name}": param.detach()
+                  for name, param in quantizer.named_parameters()}
+    flat_param["self_attn.o_proj.act_quantizer.clip_factor_a_max"] = torch.tensor([0., 4.])
+    flat_param["self_attn.o_proj.act_quantizer.clip_factor_a_min"] = torch.tensor([0., 4.])
+    mapped = FlatParamMapping(tp_rank=1)(flat_param)
+    vllm_quantizer = VLLMActivationQuantizer(bits=4, sym=False, lac=True, static=True)
+    vllm_quantizer.load_state_dict({name.replace("self_attn.o_quant.", ""): tensor for name, tensor in mapped.items()})
+    with torch.no_grad():
+        torch.testing.assert_close(vllm_quantizer(x), quantizer(x))
+
+    # the int4 activations of the symmetric quantization use the same range for every token
+    sym_quantizer = VLLMActivationQuantizer(bits=4, sym=True, lac=True, static=True)
+    sym_quantizer.load_state_dict(vllm_quantizer.state_dict())
+    scales = activation_scales(x, sym_quantizer)
+    assert scales.shape == (7, 1) and torch.all(scales == scales[0])
+
+
+def test_deploy_act_static_scales():
+    deploy = pytest.importorskip("deploy")
+    torch.manual_seed(0)
+    x = torch.randn(7, 32)
+    quantizer = observe_static_ranges(ActivationQuantizer(bits=4, sym=True, lac=True, static=True))
+    with torch.no_grad():
+        quantizer(x)
+    set_static_ranges(quantizer)
+    quantizer.clip_factor_a_max.data.fill_(1.)
+    quantizer.clip_factor_a_min.data.fill_(-1.)
+    # as saved in flat_matrices.pth, the o_proj quantizer without --lac and the mlp without --a_static
+    flat_matrices = {0: {f"self_attn.q_proj.act_quantizer.{name}": param.detach()
+                         for name, param in quantizer.named_parameters()}}
+    flat_matrices[0]["self_attn.o_proj.act_quantizer.static_xmax"] = quantizer.static_xmax.detach()
+    flat_matrices[0]["self_attn.o_proj.act_quantizer.static_xmin"] = quantizer.static_xmin.detach()
+    scales = deploy.nn.act_static_scales(flat_matrices, 1, clip_ratio=0.9)
+    assert scales[0]["up_gate"] is None and scales[0]["down"] is None
+
+    # the per-tensor scale of the LAC-clipped range of the fake quantizer
+    with torch.no_grad():
+        expected = quantizer.get_scale_zero(x)[0]
+    assert torch.all(expected == expected[0, 0])
+    assert scales[0]["qkv"] == pytest.approx(expected[0, 0].item(), rel=1e-6)
+    assert scales[0]["qkv"] != pytest.approx(torch.maximum(-x.amin(), x.amax()).item() / 7)
+    assert scales[0]["o"] == pytest.approx(0.9 * torch.maximum(-x.amin(), x.amax()).item() / 7, rel=1e-6)
+    assert deploy.nn.Quantizer(static_scale=scales[0]["qkv"]).static_scale.shape == (1, 1)
@@ -0,0 +1,82 @@
+import re
+
+import torch
+
+from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import FlatParamMapping, \
+    iter_flat_matrices, rank_flat_matrices_name, save_rank_flat_matrices
+
+
+def _flat_param(tp_size):
+    names = ["self_attn.ln_trans.matrix_left", "self_attn.kcache_trans.matrix", "mlp.up_gate_trans.matrix_right",
+             "self_attn.q_proj.act_quantizer.clip_factor_a_max", "self_attn.v_proj.act_quantizer.clip_factor_a_min",
+             "mlp.gate_proj.act_quantizer.clip_factor_a_max", "self_attn.k_cache_quantizer.clip_factor_a_max",
+             "self_attn.v_cache_quantizer.clip_factor_a_min", "self_attn.q_proj.clip_factor_w_max"]
+    flat_param = {name: torch.randn(4) for name in names}
+    flat_param["self_attn.o_proj.act_quantizer.clip_factor_a_max"] = torch.randn(tp_size)
+    flat_param["mlp.down_proj.act_quantizer.clip_factor_a_min"] = torch.randn(tp_size)
+    for rank in range(tp_size):
+        flat_param[f"mlp.down_trans.trans_list.{rank}.matrix_left"] = torch.randn(2, 2)
+        flat_param[f"self_attn.o_trans.trans_list.{rank}.matrix"] = torch.randn(3, 3)
+    return flat_param
+
+
+def _reference(flat_param, rank):
+    """The renaming previously done in the load_weights of the vLLM models."""
+    flat_param = dict(flat_param)
+    for name in list(flat_param.keys()):
+        if "self_attn.q_proj.act_quantizer" in name or "self_attn.k_proj.act_quantizer" in name \
+                or "self_attn.v_proj.act_quantizer" in name:
+            flat_param[re.sub("self_attn.*.act_quantizer", "self_attn.qkv_quant", name)] = flat_param.pop(name)
+        if "mlp.up_proj.act_quantizer" in name or "mlp.gate_proj.act_quantizer" in name:
+            flat_param[re.sub("mlp.*.act_quantizer", "mlp.up_gate_quant", name)] = flat_param.pop(name)
+        if "self_attn.k_cache_quantizer" in name:
+            flat_param[name.replace("self_attn.k_cache_quantizer", "self_attn.k_cache_quant")] = flat_param.pop(name)
+        if "self_attn.v_cache_quantizer" in name:
+            flat_param[name.replace("self_attn.v_cache_quantizer", "self_attn.v_cache_quant")] = flat_param.pop(name)
+        if "self_attn.o_proj.act_quantizer" in name:
+            flat_param[name.replace("self_attn.o_proj.act_quantizer", "self_attn.o_quant")] = \
+                flat_param.pop(name)[rank].unsqueeze(0)
+        if "mlp.down_proj.act_quantizer" in name:
+            flat_param[name.replace("mlp.down_proj.act_quantizer", "mlp.down_quant")] = \
+                flat_param.pop(name)[rank].unsqueeze(0)
+        if f"mlp.down_trans.trans_list.{rank}" in name:
+            flat_param[name.replace(f"mlp.down_trans.trans_list.{rank}", "mlp.down_trans")] = flat_param.pop(name)
+        if f"self_attn.o_trans.trans_list.{rank}" in name:
+            flat_param[name.replace(f"self_attn.o_trans.trans_list.{rank}", "self_attn.o_trans")] = \
+                flat_param.pop(name)
+    # the parameters of the other ranks were ignored by load_state_dict(strict=False)
+    return {name: tensor for name, tensor in flat_param.items() if ".trans_list." not in name}
+
+
+def _assert_equal(mapped, ref):
+    assert mapped.keys() == ref.keys()
+    for name in ref:
+        assert torch.equal(mapped[name], ref[name]), name
+
+
+def test_mapping_matches_reference():
+    torch.manual_seed(0)
+    tp_size = 2
+    layers = [_flat_param(tp_size) for _ in range(3)]
+    for rank in range(tp_size):
+        mapping = FlatParamMapping(rank)
+        for flat_param in layers:
+            _assert_equal(mapping(flat_param), _reference(flat_param, rank))
+
+
+def test_rank_files(tmp_path):
+    torch.manual_seed(0)
+    tp_size = 2
+    flat_parameters = {i: _flat_param(tp_size) for i in range(4)}
+    torch.save(flat_parameters, tmp_path / "flat_matrices.pth")
+    # a pipeline stage with the layers 1 and 2
+    full = {rank: dict(iter_flat_matrices(tmp_path, range(1, 3), tp_size, rank)) for rank in range(tp_size)}
+
+    save_rank_flat_matrices(tmp_path, tp_size)
+    for rank in range(tp_size):
+        assert (tmp_path / rank_flat_matrices_name(tp_size, rank)).exists()
+        sliced = dict(iter_flat_matrices(tmp_path, range(1, 3), tp_size, rank))
+        assert sliced.keys() == {1, 2}
+        for i in sliced:
+            _assert_equal(sliced[i], full[rank][i])
+            _assert_equal(sliced[i], _reference(flat_parameters[i], rank))
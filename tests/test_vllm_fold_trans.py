@@ -0,0 +1,40 @@
+import torch
+
+from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import SVDDecomposeTransMatrix, \
+    SVDSingleTransMatrix, fold_input_trans
+
+
+def _linear(in_features, out_features):
+    return torch.nn.Linear(in_features, out_features, bias=False).double()
+
+
+def test_fold_decompose_trans():
+    torch.manual_seed(0)
+    trans = SVDDecomposeTransMatrix(4, 8).double()
+    trans.to_eval_mode()
+    linear = _linear(32, 16)
+    x = torch.randn(3, 32, dtype=torch.float64)
+    ref = linear(trans(x))
+    fold_input_trans(linear, trans.matrix_left, trans.matrix_right)
+    torch.testing.assert_close(linear(x), ref, rtol=1e-5, atol=1e-5)
+
+
+def test_fold_per_head_trans():
+    torch.manual_seed(0)
+    num_heads, head_dim = 4, 8
+    o_trans, vcache_trans = SVDSingleTransMatrix(num_heads).double(), SVDSingleTransMatrix(head_dim).double()
+    o_trans.to_eval_mode()
+    vcache_trans.to_eval_mode()
+    attn_output = torch.randn(3, num_heads * head_dim, dtype=torch.float64)
+    heads = attn_output.reshape(-1, num_heads, head_dim)
+
+    # as in the forward of the attention of the vLLM models
+    linear = _linear(num_heads * head_dim, 16)
+    ref = linear(torch.matmul(o_trans.get_matrix().T, heads).reshape(attn_output.shape))
+    fold_input_trans(linear, o_trans.get_matrix(), torch.eye(head_dim, dtype=torch.float64))
+    torch.testing.assert_close(linear(attn_output), ref, rtol=1e-5, atol=1e-5)
+
+    linear = _linear(num_heads * head_dim, 16)
+    ref = linear(torch.matmul(heads, vcache_trans.get_matrix(inv_t=True).T).reshape(attn_output.shape))
+    fold_input_trans(linear, torch.eye(num_heads, dtype=torch.float64), vcache_trans.get_matrix(inv_t=True).T)
+    torch.testing.assert_close(linear(attn_output), ref, rtol=1e-5, atol=1e-5)
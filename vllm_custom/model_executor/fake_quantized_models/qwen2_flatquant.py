@@ -21,8 +21,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 """Inference-only Qwen2 model compatible with HuggingFace weights."""
-import os
-import re
 from typing import Iterable, List, Optional, Set, Tuple, Union
 
 import torch
@@ -32,7 +30,8 @@ from transformers import Qwen2Config
 from vllm.attention import Attention, AttentionMetadata, AttentionType
 from vllm.compilation.decorators import support_torch_compile
 from vllm.config import CacheConfig, VllmConfig
-from vllm.distributed import get_pp_group, get_tensor_model_parallel_world_size
+from vllm.distributed import get_pp_group, get_tensor_model_parallel_rank, \
+    get_tensor_model_parallel_world_size
 from vllm.logger import init_logger
 from vllm.model_executor.layers.activation import SiluAndMul
 from vllm.model_executor.layers.layernorm import RMSNorm
@@ -59,8 +58,11 @@ from vllm.model_executor.models.utils import (AutoWeightsLoader, PPMissingLayer,
                     maybe_prefix)
 
 from vllm_custom.model_executor.layers.quantization.utils.fake_quant_utils import ActivationQuantizer
+from vllm_custom.model_executor.layers.quantization.utils.int4_utils import use_int4_linear, linear_a_bits, \
+    quantize_activation
 from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import SVDSingleTransMatrix, SVDDecomposeTransMatrix, InvSingleTransMatrix, InvDecomposeTransMatrix
-from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import get_decompose_dim
+from vllm_custom.model_executor.layers.quantization.utils.flatquant_utils import get_decompose_dim, fold_input_trans, \
+    iter_flat_matrices
 
 logger = init_logger(__name__)
 
@@ -97,11 +99,15 @@ class Qwen2MLP(nn.Module):
                              "Only silu is supported for now.")
         self.act_fn = SiluAndMul()
 
-        # fake quantization for activations
-        self.up_gate_quant = ActivationQuantizer(bits=fake_quant_config["a_bits"], sym=not fake_quant_config["a_asym"],
-                                                lac=True, groupsize=-1, clip_ratio=None)
-        self.down_quant = ActivationQuantizer(bits=fake_quant_config["a_bits"], sym=not fake_quant_config["a_asym"],
-                                            lac=True, groupsize=-1, clip_ratio=None)
+        # fake quantization for activations, or the int4 quantization of the inputs of int4 linear layers
+        self.up_gate_int4 = use_int4_linear(quant_config, fake_quant_config, f"{prefix}.gate_up_proj")
+        self.down_int4 = use_int4_linear(quant_config, fake_quant_config, f"{prefix}.down_proj")
+        self.up_gate_quant = ActivationQuantizer(bits=linear_a_bits(quant_config, fake_quant_config, f"{prefix}.gate_up_proj"), sym=not fake_quant_config["a_asym"],
+                                                lac=True, groupsize=-1, clip_ratio=None,
+                                                static=fake_quant_config.get("a_static", False))
+        self.down_quant = ActivationQuantizer(bits=linear_a_bits(quant_config, fake_quant_config, f"{prefix}.down_proj"), sym=not fake_quant_config["a_asym"],
+                                            lac=True, groupsize=-1, clip_ratio=None,
+                                            static=fake_quant_config.get("a_static", False))
         
         # online trans
         if fake_quant_config["direct_inv"]:
@@ -121,15 +127,24 @@ class Qwen2MLP(nn.Module):
     def forward(self, x):
         if self.up_gate_trans is not None:
             x = self.up_gate_trans(x)
-        x = self.up_gate_quant(x)
+        x = quantize_activation(x, self.up_gate_quant) if self.up_gate_int4 else self.up_gate_quant(x)
         gate_up, _ = self.gate_up_proj(x)
         x = self.act_fn(gate_up)
         if self.down_trans is not None:
             x = self.down_trans(x)
-        x = self.down_quant(x)
+        x = quantize_activation(x, self.down_quant) if self.down_int4 else self.down_quant(x)
         x, _ = self.down_proj(x)
         return x
 
+    def fold_transforms(self):
+        # a transform can only be folded into the weights if its output is not quantized
+        if self.up_gate_trans is not None and self.up_gate_quant.bits == 16:
+            fold_input_trans(self.gate_up_proj, self.up_gate_trans.matrix_left, self.up_gate_trans.matrix_right)
+            self.up_gate_trans = None
+        if self.down_trans is not None and self.down_quant.bits == 16:
+            fold_input_trans(self.down_proj, self.down_trans.matrix_left, self.down_trans.matrix_right)
+            self.down_trans = None
+
 
 class Qwen2Attention(nn.Module):
 
@@ -200,11 +215,15 @@ class Qwen2Attention(nn.Module):
                               prefix=f"{prefix}.attn",
                               attn_type=attn_type)
 
-        # fake quantization for activations
-        self.qkv_quant = ActivationQuantizer(bits=fake_quant_config["a_bits"], sym=not fake_quant_config["a_asym"],
-                                             lac=True, groupsize=-1, clip_ratio=None)
-        self.o_quant = ActivationQuantizer(bits=fake_quant_config["a_bits"], sym=not fake_quant_config["a_asym"],
-                                            lac=True, groupsize=-1, clip_ratio=None)
+        # fake quantization for activations, or the int4 quantization of the inputs of int4 linear layers
+        self.qkv_int4 = use_int4_linear(quant_config, fake_quant_config, f"{prefix}.qkv_proj")
+        self.o_int4 = use_int4_linear(quant_config, fake_quant_config, f"{prefix}.o_proj")
+        self.qkv_quant = ActivationQuantizer(bits=linear_a_bits(quant_config, fake_quant_config, f"{prefix}.qkv_proj"), sym=not fake_quant_config["a_asym"],
+                                             lac=True, groupsize=-1, clip_ratio=None,
+                                             static=fake_quant_config.get("a_static", False))
+        self.o_quant = ActivationQuantizer(bits=linear_a_bits(quant_config, fake_quant_config, f"{prefix}.o_proj"), sym=not fake_quant_config["a_asym"],
+                                            lac=True, groupsize=-1, clip_ratio=None,
+                                            static=fake_quant_config.get("a_static", False))
         self.k_cache_quant = ActivationQuantizer(bits=fake_quant_config["k_bits"], sym=not fake_quant_config["k_asym"],
                                                 lac=True, groupsize=fake_quant_config["k_groupsize"], clip_ratio=None)
         self.v_cache_quant = ActivationQuantizer(bits=fake_quant_config["v_bits"], sym=not fake_quant_config["v_asym"],
@@ -243,7 +262,7 @@ class Qwen2Attention(nn.Module):
     ) -> torch.Tensor:
         if self.ln_trans is not None:
             hidden_states = self.ln_trans(hidden_states)
-        hidden_states = self.qkv_quant(hidden_states)
+        hidden_states = quantize_activation(hidden_states, self.qkv_quant) if self.qkv_int4 else self.qkv_quant(hidden_states)
         qkv, _ = self.qkv_proj(hidden_states)
         q, k, v = qkv.split([self.q_size, self.kv_size, self.kv_size], dim=-1)
         q, k = self.rotary_emb(positions, q, k)
@@ -261,10 +280,28 @@ class Qwen2Attention(nn.Module):
             init_shape = attn_output.shape
             attn_output = attn_output.reshape(-1, self.num_heads, self.head_dim)
             attn_output = torch.matmul(attn_output, self.vcache_trans.get_matrix(inv_t=True).T.to(attn_output)).reshape(init_shape)
-        attn_output = self.o_quant(attn_output)
+        attn_output = quantize_activation(attn_output, self.o_quant) if self.o_int4 else self.o_quant(attn_output)
         output, _ = self.o_proj(attn_output)
         return output
 
+    def fold_transforms(self):
+        # a transform can only be folded into the weights if its output is not quantized,
+        # kcache_trans is only created for a quantized K cache
+        if self.ln_trans is not None and self.qkv_quant.bits == 16:
+            fold_input_trans(self.qkv_proj, self.ln_trans.matrix_left, self.ln_trans.matrix_right)
+            self.ln_trans = None
+        if self.o_quant.bits < 16:
+            return
+        # the per-head transforms of the attention output, on its (num_heads, head_dim) view
+        device = self.o_proj.weight.device
+        if self.o_trans is not None:
+            fold_input_trans(self.o_proj, self.o_trans.get_matrix(), torch.eye(self.head_dim, device=device))
+            self.o_trans = None
+        elif self.vcache_trans is not None:
+            fold_input_trans(self.o_proj, torch.eye(self.num_heads, device=device),
+                             self.vcache_trans.get_matrix(inv_t=True).T)
+            self.vcache_trans = None
+
 
 class Qwen2DecoderLayer(nn.Module):
 
@@ -503,44 +540,20 @@ class Qwen2Model(nn.Module):
             loaded_params.add(name)
 
         # load transform matrices & act clip
-        rank = torch.distributed.get_rank()
-        flat_parameters = torch.load(os.path.join(self.config.name_or_path, "flat_matrices.pth"), weights_only=True)
-        for i in range(self.start_layer, self.end_layer):
-            flat_param = flat_parameters[i]
-            for name in list(flat_param.keys()):
-                # substitute names
-                if "self_attn.q_proj.act_quantizer" in name \
-                    or "self_attn.k_proj.act_quantizer" in name \
-                    or "self_attn.v_proj.act_quantizer" in name:
-                    flat_param[re.sub("self_attn.*.act_quantizer", "self_attn.qkv_quant", name)] = flat_param[name]
-                    del flat_param[name]
-                if "mlp.up_proj.act_quantizer" in name \
-                    or "mlp.gate_proj.act_quantizer" in name:
-                    flat_param[re.sub("mlp.*.act_quantizer", "mlp.up_gate_quant", name)] = flat_param[name]
-                    del flat_param[name]
-                if "self_attn.k_cache_quantizer" in name:
-                    flat_param[re.sub("self_attn.k_cache_quantizer", "self_attn.k_cache_quant", name)] = flat_param[name]
-                    del flat_param[name]
-                if "self_attn.v_cache_quantizer" in name:
-                    flat_param[re.sub("self_attn.v_cache_quantizer", "self_attn.v_cache_quant", name)] = flat_param[name]
-                    del flat_param[name]
-                if "self_attn.o_proj.act_quantizer" in name:
-                    flat_param[re.sub("self_attn.o_proj.act_quantizer", "self_attn.o_quant", name)] = flat_param[name][rank].unsqueeze(0)
-                    del flat_param[name]
-                if "mlp.down_proj.act_quantizer" in name:
-                    flat_param[re.sub("mlp.down_proj.act_quantizer", "mlp.down_quant", name)] = flat_param[name][rank].unsqueeze(0)
-                    del flat_param[name]
-                if f"mlp.down_trans.trans_list.{rank}" in name:
-                    flat_param[name.replace(f"mlp.down_trans.trans_list.{rank}", "mlp.down_trans")] = flat_param[name]
-                    del flat_param[name]
-                if f"self_attn.o_trans.trans_list.{rank}" in name:
-                    flat_param[name.replace(f"self_attn.o_trans.trans_list.{rank}", "self_attn.o_trans")] = flat_param[name]
-                    del flat_param[name]
+        flat_parameters = iter_flat_matrices(self.config.name_or_path, range(self.start_layer, self.end_layer),
+                                             get_tensor_model_parallel_world_size(),
+                                             get_tensor_model_parallel_rank())
+        for i, flat_param in flat_parameters:
             loaded_results = self.layers[i].load_state_dict(flat_param, strict=False)
             matched_keys = set(flat_param.keys()) - set(loaded_results.unexpected_keys)
             for key in matched_keys:
                 loaded_params.add(f"layers.{i}.{key}")
 
+        if self.config.fake_quant_config.get("fold_trans", False):
+            for i in range(self.start_layer, self.end_layer):
+                self.layers[i].self_attn.fold_transforms()
+                self.layers[i].mlp.fold_transforms()
+
         return loaded_params
 
 
@@ -1,4 +1,6 @@
 from vllm import ModelRegistry
+from vllm.model_executor.layers.quantization import QUANTIZATION_METHODS, register_quantization_config
+from vllm_custom.model_executor.layers.quantization.flatquant_int4 import FlatQuantInt4Config
 from vllm_custom.model_executor.fake_quantized_models.llama_fake_quantized import LlamaFakeQuantizedForCausalLM
 from vllm_custom.model_executor.fake_quantized_models.llama_flatquant import LlamaFlatQuantForCausalLM
 from vllm_custom.model_executor.fake_quantized_models.qwen2_fake_quantized import Qwen2FakeQuantizedForCausalLM
@@ -10,3 +12,6 @@ def register_fake_quantized_models():
     ModelRegistry.register_model("LlamaFlatQuantForCausalLM", LlamaFlatQuantForCausalLM)
     ModelRegistry.register_model("Qwen2FakeQuantizedForCausalLM", Qwen2FakeQuantizedForCausalLM)
     ModelRegistry.register_model("Qwen2FlatQuantForCausalLM", Qwen2FlatQuantForCausalLM)
+    # real int4 linear layers for the FlatQuant models
+    if FlatQuantInt4Config().get_name() not in QUANTIZATION_METHODS:
+        register_quantization_config(FlatQuantInt4Config().get_name())(FlatQuantInt4Config)
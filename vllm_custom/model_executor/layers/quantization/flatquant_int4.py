@@ -0,0 +1,96 @@
+from typing import Any, Dict, List, Optional
+
+import torch
+from torch.nn import Parameter
+
+from vllm.model_executor.layers.linear import LinearBase, LinearMethodBase, UnquantizedLinearMethod
+from vllm.model_executor.layers.quantization.base_config import QuantizationConfig, QuantizeMethodBase
+from vllm.model_executor.utils import set_weight_attrs
+
+from vllm_custom.model_executor.layers.quantization.utils.int4_utils import Int4Activation, int4_linear, \
+    quantize_activation
+
+
+class FlatQuantInt4Config(QuantizationConfig):
+    """
+    W4A4 linear layers with the packed int4 weights and per-channel scales exported by FlatQuant
+    (`main.py --export_int4`). Selected by `"quantization_config": {"quant_method": "flatquant_int4"}` in
+    the config.json of the checkpoint. With mixed precision (--bit_budget/--bit_config), its "modules" lists
+    the bits of every linear layer: the 2/3-bit weights are stored on the int4 grid, and the layers at 16 bits
+    are not quantized.
+    """
+
+    def __init__(self, modules: Optional[Dict[str, Dict[str, int]]] = None):
+        self.modules = modules or {}
+
+    def __repr__(self) -> str:
+        return f"FlatQuantInt4Config(modules={len(self.modules)})"
+
+    def get_name(self) -> str:
+        return "flatquant_int4"
+
+    def get_supported_act_dtypes(self) -> List[torch.dtype]:
+        return [torch.float16]
+
+    @classmethod
+    def get_min_capability(cls) -> int:
+        # int4 tensor cores of the deploy GEMM
+        return 80
+
+    @staticmethod
+    def get_config_filenames() -> List[str]:
+        return []
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "FlatQuantInt4Config":
+        return cls(config.get("modules"))
+
+    def is_unquantized(self, prefix: str) -> bool:
+        # the projections fused by vLLM are one unit of the bit allocation, with the same bits
+        name = prefix.replace("qkv_proj", "q_proj").replace("gate_up_proj", "gate_proj")
+        return self.modules.get(name, {}).get("w_bits") == 16
+
+    def get_quant_method(self, layer: torch.nn.Module, prefix: str) -> Optional[QuantizeMethodBase]:
+        if isinstance(layer, LinearBase):
+            if self.is_unquantized(prefix):
+                return UnquantizedLinearMethod()
+            return FlatQuantInt4LinearMethod(self)
+        return None
+
+    def get_scaled_act_names(self) -> List[str]:
+        return []
+
+
+class FlatQuantInt4LinearMethod(LinearMethodBase):
+    """
+    Int4 GEMM of deploy on CUDA, a reference implementation otherwise. The weights are packed along the
+    input dim, so the default weight loaders of the column- and row-parallel layers shard them as usual.
+    The input is either an Int4Activation quantized by the model with its learned clipping, or a tensor
+    which is quantized per token here.
+    """
+
+    def __init__(self, quant_config: FlatQuantInt4Config):
+        self.quant_config = quant_config
+
+    def create_weights(self, layer: torch.nn.Module, input_size_per_partition: int,
+                       output_partition_sizes: List[int], input_size: int, output_size: int,
+                       params_dtype: torch.dtype, **extra_weight_attrs):
+        if input_size_per_partition % 32 != 0:
+            raise ValueError(f"The input size per partition {input_size_per_partition} of flatquant_int4 "
+                             f"must be a multiple of 32.")
+        output_size_per_partition = sum(output_partition_sizes)
+        weight = Parameter(torch.empty(output_size_per_partition, input_size_per_partition // 2, dtype=torch.uint8),
+                           requires_grad=False)
+        set_weight_attrs(weight, {"input_dim": 1, "output_dim": 0, "packed_dim": 1, "pack_factor": 2})
+        set_weight_attrs(weight, extra_weight_attrs)
+        layer.register_parameter("weight", weight)
+
+        weight_scales = Parameter(torch.empty(output_size_per_partition, 1, dtype=torch.float16), requires_grad=False)
+        set_weight_attrs(weight_scales, {"output_dim": 0})
+        set_weight_attrs(weight_scales, extra_weight_attrs)
+        layer.register_parameter("weight_scales", weight_scales)
+
+    def apply(self, layer: torch.nn.Module, x, bias: Optional[torch.Tensor] = None) -> torch.Tensor:
+        if not isinstance(x, Int4Activation):
+            x = quantize_activation(x)
+        return int4_linear(x, layer.weight, layer.weight_scales, bias)
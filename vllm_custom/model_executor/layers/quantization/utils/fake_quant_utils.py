@@ -48,9 +48,10 @@ def asym_quant_dequant(x, scale, zero, maxq):
 class ActivationQuantizer(torch.nn.Module):
     '''
         A class for quantizing the activations. We only support (both sym. and asym.) per-token quantization
-        for the activations.
+        for the activations. With `static=True` the per-tensor range calibrated by FlatQuant (--a_static) is
+        used instead of the per-token ranges.
     '''
-    def __init__(self, bits, sym=False, lac=False, groupsize=-1, clip_ratio=None, ):
+    def __init__(self, bits, sym=False, lac=False, groupsize=-1, clip_ratio=None, static=False):
         super(ActivationQuantizer, self).__init__()
         self.bits = bits
         self.q_max, self.q_min = get_qmin_qmax(bits, sym)
@@ -63,6 +64,10 @@ class ActivationQuantizer(torch.nn.Module):
             self.sigmoid = torch.nn.Sigmoid()
             self.clip_factor_a_max = torch.nn.Parameter(torch.ones((1, ))*init_value, requires_grad=True)
             self.clip_factor_a_min = torch.nn.Parameter(torch.ones((1, ))*init_value, requires_grad=True)
+        self.static = static
+        if self.static:
+            self.static_xmax = torch.nn.Parameter(torch.zeros((1, )), requires_grad=False)
+            self.static_xmin = torch.nn.Parameter(torch.zeros((1, )), requires_grad=False)
         
         self.enable = True
 
@@ -90,9 +95,13 @@ class ActivationQuantizer(torch.nn.Module):
         q_max = self.q_max.to(x)
         init_shape = x.shape
         reshaped_x = x.reshape((-1, x.shape[-1]))
-        xmax, xmin = reshaped_x.amax(1, keepdim=True), reshaped_x.amin(1, keepdim=True)
-        tmp = torch.zeros_like(xmax)
-        xmax, xmin = torch.maximum(xmax, tmp), torch.minimum(xmin, tmp)
+        if self.static:
+            # calibrated range, no reduction over the tokens (copies, as they are modified in place below)
+            xmax, xmin = self.static_xmax.to(x).reshape(1, 1).clone(), self.static_xmin.to(x).reshape(1, 1).clone()
+        else:
+            xmax, xmin = reshaped_x.amax(1, keepdim=True), reshaped_x.amin(1, keepdim=True)
+            tmp = torch.zeros_like(xmax)
+            xmax, xmin = torch.maximum(xmax, tmp), torch.minimum(xmin, tmp)
         # # if self.groupsize > 0:
         # #     assert x.shape[-1] % self.groupsize == 0
         # #     x = x.reshape((-1, self.groupsize))
@@ -108,7 +117,7 @@ class ActivationQuantizer(torch.nn.Module):
             tmp = xmax == 0
             scale = (xmax / q_max)
             scale[tmp] = 1
-            scale = scale.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
+            scale = scale.expand_as(reshaped_x).reshape(init_shape)
             zero = torch.zeros_like(scale)
         else:
             tmp = (xmin == 0) & (xmax == 0)
@@ -117,8 +126,8 @@ class ActivationQuantizer(torch.nn.Module):
             scale = (xmax - xmin) / q_max
             zero = torch.round(-xmin / scale)
 
-            scale = scale.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
-            zero = zero.repeat(1, reshaped_x.shape[-1]).reshape(init_shape)
+            scale = scale.expand_as(reshaped_x).reshape(init_shape)
+            zero = zero.expand_as(reshaped_x).reshape(init_shape)
 
         return scale, zero
 
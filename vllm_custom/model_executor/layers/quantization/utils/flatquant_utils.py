@@ -1,4 +1,7 @@
 import math
+import os
+import re
+
 import numpy as np
 from scipy.linalg import qr
 import torch
@@ -48,6 +51,110 @@ def kronecker_matmul(x, hadL, hadR):
     return x.reshape(init_shape)
 
 
+@torch.no_grad()
+def fold_input_trans(linear, matrix_left, matrix_right):
+    """
+    Folds the online transform x -> x @ kron(matrix_left, matrix_right) in front of a linear layer into its
+    (local) weight, W -> W @ kron(matrix_left, matrix_right).T. Only exact if the transformed activations
+    are not quantized before the linear layer.
+    """
+    weight = linear.weight.data
+    folded = kronecker_matmul(weight.float(), matrix_left.T.to(weight.device, torch.float32),
+                              matrix_right.T.to(weight.device, torch.float32))
+    weight.copy_(folded.to(weight.dtype))
+
+
+# ---------- loading flat_matrices.pth ----------
+# (pattern of the name in flat_matrices.pth, name in the vLLM layer, whether the tensor holds one entry per rank)
+FLAT_PARAM_RENAMES = [
+    (re.compile(r"^self_attn\.[qkv]_proj\.act_quantizer\."), "self_attn.qkv_quant.", False),
+    (re.compile(r"^mlp\.(up|gate)_proj\.act_quantizer\."), "mlp.up_gate_quant.", False),
+    (re.compile(r"^self_attn\.k_cache_quantizer\."), "self_attn.k_cache_quant.", False),
+    (re.compile(r"^self_attn\.v_cache_quantizer\."), "self_attn.v_cache_quant.", False),
+    (re.compile(r"^self_attn\.o_proj\.act_quantizer\."), "self_attn.o_quant.", True),
+    (re.compile(r"^mlp\.down_proj\.act_quantizer\."), "mlp.down_quant.", True),
+]
+# the transforms of the row-parallel inputs, one per rank
+FLAT_TRANS_LIST = re.compile(r"^(self_attn\.o_trans|mlp\.down_trans)\.trans_list\.(\d+)\.")
+
+
+def flat_param_target(name, tp_rank):
+    """
+    (name in the vLLM layer, index of the rank to select or None) of a parameter of a layer in
+    flat_matrices.pth, None if it belongs to another tensor-parallel rank.
+    """
+    match = FLAT_TRANS_LIST.match(name)
+    if match is not None:
+        if int(match.group(2)) != tp_rank:
+            return None
+        return f"{match.group(1)}.{name[match.end():]}", None
+    for pattern, target, per_rank in FLAT_PARAM_RENAMES:
+        match = pattern.match(name)
+        if match is not None:
+            suffix = name[match.end():]
+            # the static ranges (--a_static) are per tensor, they hold for the inputs of every rank
+            return target + suffix, tp_rank if per_rank and suffix.startswith("clip_factor") else None
+    return name, None
+
+
+class FlatParamMapping:
+    """
+    Maps the parameters of a layer in flat_matrices.pth to the parameters of the vLLM layer of a
+    tensor-parallel rank. Every layer has the same names, so each name is only resolved once.
+    """
+    def __init__(self, tp_rank):
+        self.tp_rank = tp_rank
+        self.targets = {}
+
+    def __call__(self, flat_param):
+        mapped = {}
+        for name, tensor in flat_param.items():
+            if name not in self.targets:
+                self.targets[name] = flat_param_target(name, self.tp_rank)
+            target = self.targets[name]
+            if target is None:
+                continue
+            new_name, index = target
+            mapped[new_name] = tensor if index is None else tensor[index].unsqueeze(0)
+        return mapped
+
+
+def rank_flat_matrices_name(tp_size, tp_rank):
+    return f"flat_matrices_tp{tp_size}_rank{tp_rank}.pth"
+
+
+def save_rank_flat_matrices(path, tp_size):
+    """
+    Splits flat_matrices.pth in `path` into one file per tensor-parallel rank, holding only the renamed
+    parameters of that rank. vLLM memory-maps the file of its rank when it exists, so a rank only reads
+    the layers of its pipeline stage.
+    """
+    flat_parameters = torch.load(os.path.join(path, "flat_matrices.pth"), mmap=True, weights_only=True)
+    for tp_rank in range(tp_size):
+        mapping = FlatParamMapping(tp_rank)
+        # clone: a slice would otherwise save the storage of all ranks
+        rank_parameters = {i: {name: tensor.clone() for name, tensor in mapping(flat_param).items()}
+                           for i, flat_param in flat_parameters.items()}
+        torch.save(rank_parameters, os.path.join(path, rank_flat_matrices_name(tp_size, tp_rank)))
+
+
+def iter_flat_matrices(path, layer_ids, tp_size, tp_rank):
+    """
+    Yields (layer id, parameters renamed for the vLLM layer) of the layers in `layer_ids`, from the file of
+    the rank written by `save_rank_flat_matrices` if there is one, else from flat_matrices.pth. Both are
+    memory-mapped, so only the tensors that are loaded into the model are read.
+    """
+    rank_path = os.path.join(path, rank_flat_matrices_name(tp_size, tp_rank))
+    if os.path.exists(rank_path):
+        flat_parameters = torch.load(rank_path, mmap=True, weights_only=True)
+        mapping = dict
+    else:
+        flat_parameters = torch.load(os.path.join(path, "flat_matrices.pth"), mmap=True, weights_only=True)
+        mapping = FlatParamMapping(tp_rank)
+    for i in layer_ids:
+        yield i, mapping(flat_parameters[i])
+
+
 # ---------- transformation version of singular value decomposition ----------
 class SVDSingleTransMatrix(nn.Module):
     def __init__(self, size):
@@ -0,0 +1,99 @@
+from typing import NamedTuple
+
+import torch
+
+try:
+    import deploy
+except ImportError:
+    # the CUDA extension of deploy is not built, only the reference implementation is available
+    deploy = None
+
+
+class Int4Activation(NamedTuple):
+    '''
+        Per-token symmetric int4 activations, two values packed per uint8 along the last dim (the layout of
+        deploy.sym_quant), and their fp16 scales of shape (..., 1).
+    '''
+    packed: torch.Tensor
+    scales: torch.Tensor
+
+
+def use_int4_linear(quant_config, fake_quant_config, prefix=None):
+    '''
+        Whether the linear layer `prefix` of a FlatQuant model runs the real int4 GEMM of the flatquant_int4
+        quantization, i.e. is not one of the layers kept at 16 bits by its per-module bits.
+    '''
+    if quant_config is None or quant_config.get_name() != "flatquant_int4":
+        return False
+    if prefix is not None and quant_config.is_unquantized(prefix):
+        return False
+    assert fake_quant_config["w_bits"] == 4 and not fake_quant_config["w_asym"], \
+        "flatquant_int4 only supports symmetric 4-bit weights"
+    assert fake_quant_config["a_bits"] == 4 and not fake_quant_config["a_asym"], \
+        "flatquant_int4 only supports symmetric per-token 4-bit activations"
+    return True
+
+
+def linear_a_bits(quant_config, fake_quant_config, prefix):
+    '''Bits of the input quantizer of the linear layer `prefix`, 16 for the layers flatquant_int4 keeps unquantized.'''
+    if quant_config is not None and quant_config.get_name() == "flatquant_int4" and quant_config.is_unquantized(prefix):
+        return 16
+    return fake_quant_config["a_bits"]
+
+
+def pack_int4(q):
+    q = (q.to(torch.int8) & 0x0F).to(torch.uint8)
+    return q[..., 0::2] | (q[..., 1::2] << 4)
+
+
+def unpack_int4(packed):
+    low = (packed & 0x0F).to(torch.int8)
+    high = (packed >> 4).to(torch.int8)
+    q = torch.stack([low, high], dim=-1).flatten(-2)
+    return torch.where(q >= 8, q - 16, q)
+
+
+def activation_scales(x, quantizer=None):
+    '''
+        Per-token scales of the symmetric int4 quantization of x, with the (learned) clipping of the
+        ActivationQuantizer of the fake-quantized model if given, or its calibrated range if it is static.
+    '''
+    if quantizer is not None and quantizer.static:
+        # no reduction over x
+        xmax = quantizer.static_xmax.to(x).expand(*x.shape[:-1], 1)
+        xmin = quantizer.static_xmin.to(x).expand(*x.shape[:-1], 1)
+    else:
+        xmax = x.amax(dim=-1, keepdim=True).clamp(min=0)
+        xmin = x.amin(dim=-1, keepdim=True).clamp(max=0)
+    if quantizer is not None and quantizer.lac:
+        xmax = xmax * quantizer.sigmoid(quantizer.clip_factor_a_max)
+        xmin = xmin * quantizer.sigmoid(quantizer.clip_factor_a_min)
+    elif quantizer is not None and quantizer._clip_ratio is not None:
+        xmax = xmax * quantizer._clip_ratio
+        xmin = xmin * quantizer._clip_ratio
+    scales = torch.maximum(-xmin, xmax) / 7
+    return torch.where(scales == 0, torch.ones_like(scales), scales).to(torch.float16)
+
+
+def quantize_activation(x, quantizer=None):
+    scales = activation_scales(x, quantizer)
+    if deploy is not None and x.is_cuda:
+        return Int4Activation(deploy.sym_quant(x.to(torch.float16).contiguous(), scales), scales)
+    q = torch.clamp(torch.round(x.float() / scales.float()), -8, 7)
+    return Int4Activation(pack_int4(q), scales)
+
+
+def int4_linear(x: Int4Activation, weight, weight_scales, bias=None):
+    '''
+        y = (q_x * s_x) @ (q_w * s_w).T + bias for packed int4 activations and weights (out_features,
+        in_features // 2) with per-channel scales (out_features, 1). Runs the int4 GEMM of deploy on CUDA,
+        and a reference implementation otherwise, which is exact as the int4 products are accumulated in fp32.
+    '''
+    if deploy is not None and x.packed.is_cuda:
+        out = deploy.sym_dequant(deploy.matmul(x.packed, weight), x.scales, weight_scales)
+    else:
+        out = torch.matmul(unpack_int4(x.packed).float(), unpack_int4(weight).float().T)
+        out = (out * x.scales.float() * weight_scales.float().T).to(weight_scales.dtype)
+    if bias is not None:
+        out = out + bias
+    return out